@@ -1,5 +1,17 @@
 """Contract adapters implementing ContractPort."""
 
+from simulator.adapters.contracts.codec import ContractCodec, TextCodec
+from simulator.adapters.contracts.contract_cache import ContractCache
+from simulator.adapters.contracts.file_contract import FileContractAdapter
+from simulator.adapters.contracts.header_parser import HeaderParseError, parse_header
 from simulator.adapters.contracts.stub_contract import StubContractAdapter
 
-__all__ = ["StubContractAdapter"]
+__all__ = [
+    "ContractCache",
+    "ContractCodec",
+    "FileContractAdapter",
+    "HeaderParseError",
+    "StubContractAdapter",
+    "TextCodec",
+    "parse_header",
+]
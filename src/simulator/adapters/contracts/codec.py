@@ -0,0 +1,180 @@
+"""Contract-driven binary codec. Each message layout compiles once to a cached struct.Struct."""
+
+from __future__ import annotations
+
+import ctypes
+import struct
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from simulator.domain.models.target_and_task import MessageEnvelope
+
+# C scalar type -> struct format code. "char" arrays map to fixed-length byte strings ("Ns").
+SCALAR_CODES: dict[str, str] = {
+    "char": "s",
+    "int8": "b",
+    "uint8": "B",
+    "int16": "h",
+    "uint16": "H",
+    "int32": "i",
+    "uint32": "I",
+    "int64": "q",
+    "uint64": "Q",
+    "float": "f",
+    "double": "d",
+}
+
+_CTYPES_SCALARS: dict[Any, str] = {
+    ctypes.c_char: "char",
+    ctypes.c_int8: "int8",
+    ctypes.c_uint8: "uint8",
+    ctypes.c_int16: "int16",
+    ctypes.c_uint16: "uint16",
+    ctypes.c_int32: "int32",
+    ctypes.c_uint32: "uint32",
+    ctypes.c_int64: "int64",
+    ctypes.c_uint64: "uint64",
+    ctypes.c_float: "float",
+    ctypes.c_double: "double",
+}
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """One struct member: name, scalar type (see SCALAR_CODES), and array length (1 = scalar)."""
+
+    name: str
+    ctype: str
+    count: int = 1
+
+
+@dataclass(frozen=True)
+class MessageLayout:
+    """A message type's wire layout, compiled to a struct.Struct with C alignment padding."""
+
+    name: str
+    fields: tuple[FieldSpec, ...]
+    packer: struct.Struct
+
+    @property
+    def size(self) -> int:
+        return self.packer.size
+
+    def encode(self, payload: dict[str, Any]) -> bytes:
+        values: list[Any] = []
+        for f in self.fields:
+            value = payload.get(f.name)
+            if f.ctype == "char":
+                values.append(value.encode("utf-8") if isinstance(value, str) else bytes(value or b""))
+            elif f.count == 1:
+                values.append(value or 0)
+            else:
+                items = list(value or ())[: f.count]
+                values.extend(items + [0] * (f.count - len(items)))
+        try:
+            return self.packer.pack(*values)
+        except struct.error as e:
+            raise ValueError(f"{self.name}: {e}") from e
+
+    def decode(self, data: bytes | memoryview) -> dict[str, object]:
+        raw = self.packer.unpack_from(data)
+        out: dict[str, object] = {}
+        i = 0
+        for f in self.fields:
+            if f.ctype == "char":
+                out[f.name] = raw[i].split(b"\x00", 1)[0].decode("utf-8", "replace")
+                i += 1
+            elif f.count == 1:
+                out[f.name] = raw[i]
+                i += 1
+            else:
+                out[f.name] = list(raw[i:i + f.count])
+                i += f.count
+        return out
+
+
+@lru_cache(maxsize=4096)
+def compile_layout(
+    name: str, fields: tuple[FieldSpec, ...], byteorder: str = "little", packed: bool = False
+) -> MessageLayout:
+    """Compile fields to one struct format, inserting the padding a C compiler would (unless packed)."""
+    order = "<" if byteorder == "little" else ">"
+    parts: list[str] = [order]
+    offset = 0
+    max_align = 1
+    for f in fields:
+        code = SCALAR_CODES.get(f.ctype)
+        if code is None or f.count < 1:
+            raise ValueError(f"{name}.{f.name}: unsupported field type {f.ctype!r}[{f.count}]")
+        width = 1 if code == "s" else struct.calcsize(order + code)
+        align = 1 if packed else width
+        max_align = max(max_align, align)
+        pad = -offset % align
+        if pad:
+            parts.append(f"{pad}x")
+        parts.append(f"{f.count}s" if code == "s" else (f"{f.count}{code}" if f.count > 1 else code))
+        offset += pad + width * f.count
+    tail = -offset % max_align
+    if tail:
+        parts.append(f"{tail}x")
+    return MessageLayout(name=name, fields=fields, packer=struct.Struct("".join(parts)))
+
+
+def layout_from_ctypes(cls: type[ctypes.Structure], byteorder: str = "little") -> MessageLayout:
+    """Compile a ctypes.Structure subclass (scalar and 1-D array members) to a MessageLayout."""
+    fields: list[FieldSpec] = []
+    for fname, ftype, *_ in cls._fields_:
+        count = 1
+        if issubclass(ftype, ctypes.Array):
+            count = ftype._length_
+            ftype = ftype._type_
+        ctype = _CTYPES_SCALARS.get(ftype)
+        if ctype is None:
+            raise ValueError(f"{cls.__name__}.{fname}: unsupported ctypes member {ftype!r}")
+        fields.append(FieldSpec(name=fname, ctype=ctype, count=count))
+    packed = bool(getattr(cls, "_pack_", 0) == 1)
+    layout = compile_layout(cls.__name__, tuple(fields), byteorder, packed)
+    if layout.size != ctypes.sizeof(cls):
+        raise ValueError(f"{cls.__name__}: compiled size {layout.size} != ctypes size {ctypes.sizeof(cls)}")
+    return layout
+
+
+class ContractCodec:
+    """Implements MessageCodecPort over a {message_type: MessageLayout} table."""
+
+    def __init__(self, layouts: dict[str, MessageLayout]) -> None:
+        self._layouts = dict(layouts)
+        by_size: dict[int, list[MessageLayout]] = {}
+        for layout in self._layouts.values():
+            by_size.setdefault(layout.size, []).append(layout)
+        # Size-only identification is used when the caller has no expected type; only unambiguous sizes.
+        self._unique_by_size = {size: ls[0] for size, ls in by_size.items() if len(ls) == 1}
+
+    def encode(self, message: MessageEnvelope) -> bytes:
+        layout = self._layouts.get(message.message_type)
+        if layout is None:
+            raise ValueError(f"no contract for message type {message.message_type!r}")
+        return layout.encode(message.payload)
+
+    def decode(
+        self, data: bytes | memoryview, message_type: str | None = None
+    ) -> tuple[str, dict[str, object]] | None:
+        layout = self._layouts.get(message_type or "")
+        if layout is None or layout.size != len(data):
+            layout = self._unique_by_size.get(len(data))
+        if layout is None:
+            return None
+        return layout.name, layout.decode(data)
+
+
+class TextCodec:
+    """Implements MessageCodecPort with the MVP text body (str(payload)). Inbound bodies stay opaque."""
+
+    def encode(self, message: MessageEnvelope) -> bytes:
+        return str(message.payload).encode("utf-8")
+
+    def decode(
+        self, data: bytes | memoryview, message_type: str | None = None
+    ) -> tuple[str, dict[str, object]] | None:
+        return None
@@ -0,0 +1,74 @@
+"""On-disk cache of parsed header contracts, keyed by the source's SHA-256 checksum."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from simulator.adapters.contracts.codec import FieldSpec
+from simulator.adapters.contracts.header_parser import StructDef
+
+# Bump when parser output changes so stale entries are ignored rather than misread.
+CACHE_FORMAT = 1
+
+
+def sha256_file(path: Path) -> str:
+    """Hex SHA-256 of a file's bytes."""
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ContractCache:
+    """Parsed struct definitions per checksum: in-process dict in front of one JSON file per checksum."""
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self._dir = cache_dir
+        self._memory: dict[str, list[StructDef]] = {}
+
+    def get(self, checksum: str) -> list[StructDef] | None:
+        hit = self._memory.get(checksum)
+        if hit is not None or self._dir is None:
+            return hit
+        try:
+            data = json.loads((self._dir / f"{checksum}.json").read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict) or data.get("format") != CACHE_FORMAT:
+            return None
+        try:
+            structs = [
+                StructDef(
+                    name=s["name"],
+                    fields=tuple(FieldSpec(name=n, ctype=t, count=c) for n, t, c in s["fields"]),
+                    packed=bool(s["packed"]),
+                )
+                for s in data["structs"]
+            ]
+        except (KeyError, TypeError, ValueError):
+            return None
+        self._memory[checksum] = structs
+        return structs
+
+    def put(self, checksum: str, structs: list[StructDef]) -> None:
+        self._memory[checksum] = structs
+        if self._dir is None:
+            return
+        data = {
+            "format": CACHE_FORMAT,
+            "structs": [
+                {"name": s.name, "packed": s.packed, "fields": [[f.name, f.ctype, f.count] for f in s.fields]}
+                for s in structs
+            ],
+        }
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            tmp = self._dir / f".{checksum}.{os.getpid()}.tmp"
+            tmp.write_text(json.dumps(data))
+            os.replace(tmp, self._dir / f"{checksum}.json")
+        except OSError:
+            pass  # Cache is an optimization; a read-only or full disk just means re-parsing next time.
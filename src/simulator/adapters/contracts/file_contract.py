@@ -0,0 +1,101 @@
+"""File contract adapter: loads message layouts from contract sources and builds wire codecs."""
+
+from __future__ import annotations
+
+import ctypes
+import importlib.util
+from pathlib import Path
+from typing import Any
+
+from simulator.adapters.contracts.codec import ContractCodec, MessageLayout, compile_layout, layout_from_ctypes
+from simulator.adapters.contracts.contract_cache import ContractCache, sha256_file
+from simulator.adapters.contracts.header_parser import build_ctypes_class, parse_header
+from simulator.domain.models.target_and_task import MessageEnvelope
+
+HEADER_SOURCE_TYPES = frozenset({"repo_h", "user_h"})
+
+
+def _load_ctypes_module(path: Path) -> dict[str, type[ctypes.Structure]]:
+    """Import a generated ctypes module by path; returns every ctypes.Structure subclass by name."""
+    spec = importlib.util.spec_from_file_location(f"_contract_{path.stem}", path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"cannot import {path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return {
+        name: value
+        for name, value in vars(module).items()
+        if isinstance(value, type) and issubclass(value, ctypes.Structure) and value is not ctypes.Structure
+    }
+
+
+class FileContractAdapter:
+    """
+    Implements ContractPort. Sources are ContractDefinition-shaped dicts:
+    source_type "repo_h" / "user_h" (C header, parsed) or "ctypes" (generated module, imported).
+    Parsed headers are cached per checksum_sha256 under cache_dir, so unchanged headers are never re-parsed.
+    """
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self._cache = ContractCache(cache_dir)
+
+    def load_sources(self, sources: list[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Load all sources into one bundle:
+        {"sources", "types": {name: MessageLayout}, "ctypes": {name: Structure class}, "checksums", "errors"}.
+        """
+        types: dict[str, MessageLayout] = {}
+        classes: dict[str, type[ctypes.Structure]] = {}
+        checksums: dict[str, str] = {}
+        errors: list[dict[str, str]] = []
+        for source in sources:
+            path = Path(str(source.get("source_path", "")))
+            source_type = str(source.get("source_type", ""))
+            byteorder = str(source.get("byteorder", "little"))
+            try:
+                if source_type == "ctypes":
+                    loaded = _load_ctypes_module(path)
+                    types.update({name: layout_from_ctypes(cls, byteorder) for name, cls in loaded.items()})
+                    classes.update(loaded)
+                elif source_type in HEADER_SOURCE_TYPES:
+                    checksum = sha256_file(path)
+                    declared = str(source.get("checksum_sha256") or "").lower()
+                    if declared and declared != checksum:
+                        errors.append({
+                            "source_path": str(path),
+                            "error_code": "CONTRACT_CHECKSUM_MISMATCH",
+                            "message": f"declared {declared}, file is {checksum}",
+                        })
+                        continue
+                    checksums[str(path)] = checksum
+                    structs = self._cache.get(checksum)
+                    if structs is None:
+                        structs = parse_header(path.read_text(encoding="utf-8"))
+                        self._cache.put(checksum, structs)
+                    for sd in structs:
+                        types[sd.name] = compile_layout(sd.name, sd.fields, byteorder, sd.packed)
+                        classes[sd.name] = build_ctypes_class(sd)
+                else:
+                    raise ValueError(f"unsupported source_type {source_type!r}")
+            except (ImportError, OSError, SyntaxError, UnicodeDecodeError, ValueError) as e:
+                errors.append({"source_path": str(path), "error_code": "CONTRACT_LOAD_FAILED", "message": str(e)})
+        return {"sources": sources, "types": types, "ctypes": classes, "checksums": checksums, "errors": errors}
+
+    def validate_message(self, message: MessageEnvelope, bundle: dict[str, Any]) -> dict[str, Any]:
+        """Reject unknown message types and payload fields the contract does not declare."""
+        layout: MessageLayout | None = bundle.get("types", {}).get(message.message_type)
+        if layout is None:
+            return {"valid": False, "errors": [f"unknown message type {message.message_type!r}"]}
+        known = {f.name for f in layout.fields}
+        unknown = sorted(k for k in message.payload if k not in known)
+        errors = [f"unknown field {message.message_type}.{k}" for k in unknown]
+        if not errors:
+            try:
+                layout.encode(message.payload)
+            except (TypeError, ValueError) as e:
+                errors.append(str(e))
+        return {"valid": not errors, "errors": errors}
+
+    def codec(self, bundle: dict[str, Any]) -> ContractCodec:
+        """Codec over the bundle's compiled layouts."""
+        return ContractCodec(bundle.get("types", {}))
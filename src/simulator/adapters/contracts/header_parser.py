@@ -0,0 +1,153 @@
+"""C header contract parser: struct definitions -> FieldSpec tuples and generated ctypes classes."""
+
+from __future__ import annotations
+
+import ctypes
+import re
+from dataclasses import dataclass
+
+from simulator.adapters.contracts.codec import FieldSpec
+
+# C spellings accepted for struct members -> codec scalar type.
+C_TYPE_ALIASES: dict[str, str] = {
+    "char": "char",
+    "int8_t": "int8",
+    "signed char": "int8",
+    "uint8_t": "uint8",
+    "unsigned char": "uint8",
+    "bool": "uint8",
+    "_Bool": "uint8",
+    "int16_t": "int16",
+    "short": "int16",
+    "uint16_t": "uint16",
+    "unsigned short": "uint16",
+    "int32_t": "int32",
+    "int": "int32",
+    "uint32_t": "uint32",
+    "unsigned int": "uint32",
+    "unsigned": "uint32",
+    "int64_t": "int64",
+    "long long": "int64",
+    "uint64_t": "uint64",
+    "unsigned long long": "uint64",
+    "float": "float",
+    "double": "double",
+}
+
+_CTYPES_BY_SCALAR: dict[str, type] = {
+    "char": ctypes.c_char,
+    "int8": ctypes.c_int8,
+    "uint8": ctypes.c_uint8,
+    "int16": ctypes.c_int16,
+    "uint16": ctypes.c_uint16,
+    "int32": ctypes.c_int32,
+    "uint32": ctypes.c_uint32,
+    "int64": ctypes.c_int64,
+    "uint64": ctypes.c_uint64,
+    "float": ctypes.c_float,
+    "double": ctypes.c_double,
+}
+
+_COMMENT = re.compile(r"/\*.*?\*/|//[^\n]*", re.S)
+_DEFINE = re.compile(r"^\s*#\s*define\s+(\w+)\s+(\d+)\s*$", re.M)
+_PRAGMA_PACK = re.compile(r"^\s*#\s*pragma\s+pack\s*\(([^)]*)\)\s*$", re.M)
+_STRUCT = re.compile(r"(typedef\s+)?struct\s+(\w+)?\s*\{([^{}]*)\}\s*(\w+)?\s*;", re.S)
+_MEMBER = re.compile(r"^(?:const\s+)?([A-Za-z_][\w ]*?)\s+(\w+)\s*(?:\[\s*(\w+)\s*\])?$")
+
+
+class HeaderParseError(ValueError):
+    """The header uses a construct the contract parser does not support."""
+
+
+@dataclass(frozen=True)
+class StructDef:
+    """One parsed struct: type name, members in declaration order, and whether #pragma pack(1) applied."""
+
+    name: str
+    fields: tuple[FieldSpec, ...]
+    packed: bool = False
+
+
+def _pack_regions(text: str) -> list[tuple[int, bool]]:
+    """(offset, packed) change points from #pragma pack(push, 1) / pack(1) / pack(pop) / pack()."""
+    regions: list[tuple[int, bool]] = [(0, False)]
+    stack: list[bool] = []
+    for m in _PRAGMA_PACK.finditer(text):
+        args = [a.strip() for a in m.group(1).split(",") if a.strip()]
+        current = regions[-1][1]
+        if args and args[0] == "push":
+            stack.append(current)
+            current = len(args) > 1 and args[-1] == "1"
+        elif args and args[0] == "pop":
+            current = stack.pop() if stack else False
+        else:
+            current = bool(args) and args[0] == "1"
+        regions.append((m.end(), current))
+    return regions
+
+
+def _packed_at(regions: list[tuple[int, bool]], offset: int) -> bool:
+    packed = False
+    for start, value in regions:
+        if start > offset:
+            break
+        packed = value
+    return packed
+
+
+def _parse_member(decl: str, struct_name: str, defines: dict[str, int]) -> list[FieldSpec]:
+    decl = " ".join(decl.split())
+    head, _, rest = decl.partition(",")
+    m = _MEMBER.match(head)
+    if m is None:
+        raise HeaderParseError(f"{struct_name}: cannot parse member {decl!r}")
+    ctype_name = m.group(1)
+    declarators = [head[len(ctype_name):].strip()] + [d.strip() for d in rest.split(",") if d.strip()]
+    scalar = C_TYPE_ALIASES.get(ctype_name)
+    if scalar is None:
+        raise HeaderParseError(f"{struct_name}: unsupported member type {ctype_name!r}")
+    fields: list[FieldSpec] = []
+    for d in declarators:
+        dm = re.fullmatch(r"(\w+)\s*(?:\[\s*(\w+)\s*\])?", d)
+        if dm is None:
+            raise HeaderParseError(f"{struct_name}: cannot parse declarator {d!r}")
+        count = 1
+        if dm.group(2) is not None:
+            size = dm.group(2)
+            count = int(size) if size.isdigit() else defines.get(size, 0)
+            if count < 1:
+                raise HeaderParseError(f"{struct_name}.{dm.group(1)}: unknown array size {size!r}")
+        fields.append(FieldSpec(name=dm.group(1), ctype=scalar, count=count))
+    return fields
+
+
+def parse_header(text: str) -> list[StructDef]:
+    """Parse every struct definition in a header. Members are scalars or 1-D arrays of scalars."""
+    defines = {name: int(value) for name, value in _DEFINE.findall(text)}
+    text = _COMMENT.sub(" ", text)
+    regions = _pack_regions(text)
+    structs: list[StructDef] = []
+    for m in _STRUCT.finditer(text):
+        name = m.group(4) if m.group(1) and m.group(4) else m.group(2)
+        if not name:
+            raise HeaderParseError("anonymous struct without typedef name")
+        fields: list[FieldSpec] = []
+        for decl in m.group(3).split(";"):
+            if decl.strip():
+                fields.extend(_parse_member(decl, name, defines))
+        if not fields:
+            raise HeaderParseError(f"{name}: struct has no members")
+        structs.append(StructDef(name=name, fields=tuple(fields), packed=_packed_at(regions, m.start())))
+    return structs
+
+
+def build_ctypes_class(struct_def: StructDef) -> type[ctypes.Structure]:
+    """Generate the ctypes.Structure subclass equivalent to a parsed struct (as in the ctypes fixtures)."""
+    members: list[tuple[str, type]] = []
+    for f in struct_def.fields:
+        ctype = _CTYPES_BY_SCALAR[f.ctype]
+        members.append((f.name, ctype * f.count if f.count > 1 or f.ctype == "char" else ctype))
+    attrs: dict[str, object] = {"_fields_": members}
+    if struct_def.packed:
+        attrs["_pack_"] = 1
+    return type(struct_def.name, (ctypes.Structure,), attrs)
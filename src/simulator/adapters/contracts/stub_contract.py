@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from simulator.adapters.contracts.codec import TextCodec
 from simulator.domain.models.target_and_task import MessageEnvelope
 
 
@@ -17,3 +18,7 @@ class StubContractAdapter:
     def validate_message(self, message: MessageEnvelope, bundle: dict[str, Any]) -> dict[str, Any]:
         """Validate message against bundle. Stub: pass. Full impl rejects invalid type/field refs."""
         return {"valid": True, "errors": []}
+
+    def codec(self, bundle: dict[str, Any]) -> TextCodec:
+        """Stub: MVP text body codec (no contract layouts)."""
+        return TextCodec()
@@ -1,5 +1,7 @@
 """Task adapters implementing TaskRegistryPort."""
 
+from simulator.adapters.tasks.bundle_task_registry import BundleTaskRegistryAdapter
 from simulator.adapters.tasks.file_task_registry import FileTaskRegistryAdapter
+from simulator.adapters.tasks.task_dir_watcher import TaskDirectoryWatcher
 
-__all__ = ["FileTaskRegistryAdapter"]
+__all__ = ["BundleTaskRegistryAdapter", "FileTaskRegistryAdapter", "TaskDirectoryWatcher"]
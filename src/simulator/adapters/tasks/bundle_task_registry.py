@@ -0,0 +1,136 @@
+"""Task registry backed by a packed task bundle (see task_bundle.py)."""
+
+from __future__ import annotations
+
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+
+from simulator.adapters.tasks.composition import CompositionGraph
+from simulator.adapters.tasks.file_task_registry import DEFAULT_MAX_RESIDENT_TASKS
+from simulator.adapters.tasks.registry_snapshot import RegistrySnapshot, ResidentCache, SnapshotRegistry
+from simulator.adapters.tasks.task_bundle import BundleFormatError, TaskBundle
+from simulator.domain.models.target_and_task import TaskDefinition
+
+
+@dataclass(frozen=True)
+class _BundleSource:
+    """One mapped bundle (None before a bundle could be opened); generation keys its resident records."""
+
+    bundle: TaskBundle | None
+    generation: int
+    resident: ResidentCache
+
+    def __contains__(self, task_id: object) -> bool:
+        return self.bundle is not None and task_id in self.bundle
+
+    def headers(self) -> list[tuple[str, str]]:
+        return list(self.bundle.headers()) if self.bundle is not None else []
+
+    def get(self, task_id: str) -> TaskDefinition | None:
+        task = self.resident.get((self.generation, task_id))
+        if task is not None or self.bundle is None:
+            return task
+        task = self.bundle.get(task_id)
+        if task is not None:
+            self.resident.put((self.generation, task_id), task)
+        return task
+
+
+class BundleTaskRegistryAdapter(SnapshotRegistry):
+    """Implements TaskRegistryPort over an mmap'd bundle written by `simulator tasks pack`.
+
+    Opening reads only the bundle header; get() decodes one record and keeps at most max_resident
+    decoded tasks (LRU). refresh() re-maps the bundle when the file was replaced. Runtime-registered
+    tasks (path, definition, compose) live beside the bundle and survive refresh. Like the directory
+    registry, writes are serialized and publish a new RegistrySnapshot; readers never lock, and a
+    snapshot keeps the bundle it was published with mapped. A replaced bundle is unmapped (and its
+    file descriptor closed) once no snapshot can reach it; close() unmaps the current one.
+    """
+
+    def __init__(self, bundle_path: Path, max_resident: int = DEFAULT_MAX_RESIDENT_TASKS) -> None:
+        self._path = bundle_path
+        self._stat: tuple[int, int] | None = None
+        self._load_error: str | None = None
+        self._write_lock = threading.Lock()
+        self._resident = ResidentCache(max_resident)
+        self._source = _BundleSource(None, 0, self._resident)  # the published snapshot's source
+        self._snapshot = RegistrySnapshot(0, self._source, {}, CompositionGraph())
+        with self._write_lock:
+            self._open()
+
+    def _open(self) -> None:
+        try:
+            st = os.stat(self._path)
+            bundle = TaskBundle(self._path)
+        except (OSError, BundleFormatError) as e:
+            self._load_error = str(e)
+            return
+        self._stat = (st.st_mtime_ns, st.st_size)
+        self._load_error = None
+        self._resident.clear()
+        self._source = _BundleSource(bundle, self._source.generation + 1, self._resident)
+        # Older snapshots may still be decoding from the previous map, so each map is closed when the
+        # last snapshot holding its source goes away rather than here.
+        weakref.finalize(self._source, bundle.close)
+        self._publish(source=self._source)
+
+    def close(self) -> None:
+        """Unmap the current bundle. The registry serves runtime tasks only afterwards."""
+        with self._write_lock:
+            bundle = self._source.bundle
+            self._stat = None
+            self._resident.clear()
+            self._source = _BundleSource(None, self._source.generation + 1, self._resident)
+            self._publish(source=self._source)
+        if bundle is not None:
+            bundle.close()
+
+    @property
+    def load_error(self) -> str | None:
+        """Why the bundle could not be (re)opened, or None. The last good bundle, if any, is still served."""
+        return self._load_error
+
+    def snapshot(self) -> RegistrySnapshot:
+        """The current published snapshot (immutable; get and list_tasks on it never lock)."""
+        return self._snapshot
+
+    def refresh(self) -> dict[str, object]:
+        """Re-map the bundle if its file changed. Returns {ok, added, updated, removed, unchanged, errors}."""
+        with self._write_lock:
+            try:
+                st = os.stat(self._path)
+                changed = self._stat != (st.st_mtime_ns, st.st_size)
+            except OSError:
+                changed = True
+            before = self._source
+            if changed:
+                self._open()
+            after = self._source
+            report: dict[str, object] = {"ok": self._load_error is None, "added": [], "updated": [], "removed": []}
+            report["errors"] = [] if self._load_error is None else [
+                {"path": str(self._path), "error_code": "TASK_BUNDLE_INVALID", "message": self._load_error}
+            ]
+            if after is before:
+                report["unchanged"] = len(before.bundle) if before.bundle is not None else 0
+                return report
+            old = dict(before.bundle.content_hashes()) if before.bundle is not None else {}
+            new = dict(after.bundle.content_hashes()) if after.bundle is not None else {}
+            added = [t for t in new if t not in old]
+            updated = [t for t in new if t in old and new[t] != old[t]]
+            removed = [t for t in old if t not in new]
+            composites = self._snapshot.composites.copy()
+            composites.invalidate(added + updated + removed)
+            self._publish(composites=composites)
+        unchanged = len(new) - len(added) - len(updated)
+        report.update(added=added, updated=updated, removed=removed, unchanged=unchanged)
+        return report
+
+    def get(self, task_id: str) -> TaskDefinition | None:
+        return self._snapshot.get(task_id)
+
+    def list_tasks(self) -> list[dict[str, object]]:
+        """task_id and name from the bundle index (no record decoded), then runtime tasks."""
+        return self._snapshot.list_tasks()
@@ -0,0 +1,110 @@
+"""Composed tasks as a DAG of references to base tasks, flattened lazily and memoized."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+from simulator.adapters.tasks.task_files import compose_definition
+from simulator.domain.models.target_and_task import TaskDefinition
+
+
+@dataclass(frozen=True)
+class CompositeNode:
+    """One composed task: its bases (plain or composite task ids) in order, plus overrides."""
+
+    task_id: str
+    base_task_ids: tuple[str, ...]
+    overrides: dict[str, object] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        return str(self.overrides.get("name") or f"Composed from {', '.join(self.base_task_ids)}")
+
+
+class CompositionGraph:
+    """
+    Composed tasks stored as references, not copies. flatten() builds a TaskDefinition the first time
+    it is asked for and memoizes it; composites of composites reuse their children's memoized
+    flattenings. invalidate() drops the memo of a task and of every composite built on it, so
+    re-registering, editing, or removing a base is picked up on the next flatten.
+
+    A graph held by a published registry snapshot is only read (flatten fills the memo, which is
+    safe to race on: both threads build the same definition). Writers add and invalidate on a copy().
+    """
+
+    def __init__(self) -> None:
+        self._nodes: dict[str, CompositeNode] = {}
+        self._dependents: dict[str, set[str]] = {}
+        self._memo: dict[str, TaskDefinition] = {}
+
+    def copy(self) -> CompositionGraph:
+        """Independent graph with the same composites and memoized flattenings."""
+        graph = CompositionGraph()
+        graph._nodes = dict(self._nodes)
+        graph._dependents = {base: set(ids) for base, ids in self._dependents.items()}
+        graph._memo = dict(self._memo)
+        return graph
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._nodes
+
+    def headers(self) -> list[dict[str, object]]:
+        """task_id and name of every composite; nothing is flattened."""
+        return [{"task_id": n.task_id, "name": n.name} for n in self._nodes.values()]
+
+    def _reaches(self, start: str, target: str) -> bool:
+        """True if target is start or one of its (transitive) bases."""
+        stack, seen = [start], set()
+        while stack:
+            task_id = stack.pop()
+            if task_id == target:
+                return True
+            node = self._nodes.get(task_id)
+            if node is not None and task_id not in seen:
+                seen.add(task_id)
+                stack.extend(node.base_task_ids)
+        return False
+
+    def add(self, node: CompositeNode) -> str | None:
+        """Add or replace a composite. Returns COMPOSE_CYCLE if a base (transitively) refers back to it."""
+        if any(self._reaches(base, node.task_id) for base in node.base_task_ids):
+            return "COMPOSE_CYCLE"
+        previous = self._nodes.get(node.task_id)
+        if previous is not None:
+            for base in previous.base_task_ids:
+                self._dependents.get(base, set()).discard(node.task_id)
+        self._nodes[node.task_id] = node
+        for base in node.base_task_ids:
+            self._dependents.setdefault(base, set()).add(node.task_id)
+        self.invalidate([node.task_id])
+        return None
+
+    def invalidate(self, task_ids: Iterable[str]) -> None:
+        """Forget flattenings of task_ids and of every composite that (transitively) includes them."""
+        stack, seen = list(task_ids), set()
+        while stack:
+            task_id = stack.pop()
+            if task_id in seen:
+                continue
+            seen.add(task_id)
+            self._memo.pop(task_id, None)
+            stack.extend(self._dependents.get(task_id, ()))
+
+    def flatten(self, task_id: str, resolve: Callable[[str], TaskDefinition | None]) -> TaskDefinition | None:
+        """Memoized TaskDefinition for a composite (None if it is not one or a base is missing)."""
+        task = self._memo.get(task_id)
+        if task is not None:
+            return task
+        node = self._nodes.get(task_id)
+        if node is None:
+            return None
+        bases: list[TaskDefinition] = []
+        for base_id in node.base_task_ids:
+            base = self.flatten(base_id, resolve) if base_id in self._nodes else resolve(base_id)
+            if base is None:
+                return None
+            bases.append(base)
+        task = compose_definition(bases, list(node.base_task_ids), {**node.overrides, "task_id": task_id})
+        self._memo[task_id] = task
+        return task
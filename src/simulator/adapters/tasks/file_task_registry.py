@@ -3,143 +3,255 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
+from dataclasses import dataclass, replace
 from pathlib import Path
 
-from simulator.domain.models.target_and_task import (
-    StepExpect,
-    TaskDefinition,
-    TaskStep,
+from simulator.adapters.tasks.composition import CompositionGraph
+from simulator.adapters.tasks.registry_snapshot import RegistrySnapshot, ResidentCache, SnapshotRegistry
+from simulator.adapters.tasks.task_files import (  # load_task_file* stay importable from here
+    PARALLEL_LOAD_MIN_FILES,
+    load_task_file,
+    load_task_file_from_dict,
+    read_task_file,
+    read_task_files,
 )
+from simulator.domain.models.target_and_task import TaskDefinition
 
 
-def _parse_step(step: dict) -> TaskStep:
-    expect = step.get("expect")
-    step_expect = None
-    if expect and isinstance(expect, dict):
-        matcher = expect.get("matcher") or {}
-        step_expect = StepExpect(
-            direction=str(matcher.get("direction", "receive")),
-            message_type=str(matcher.get("message_type", "")),
-            expected_count=int(expect.get("expected_count", 0)),
-            comparison=str(expect.get("comparison", "eq")),
-        )
-    return TaskStep(
-        step_id=str(step.get("step_id", "")),
-        action=str(step.get("action", "send")),
-        message_type=str(step.get("message_type", "")),
-        payload_ref=step.get("payload_ref") if isinstance(step.get("payload_ref"), str) else None,
-        expect=step_expect,
-        timeout_ms=int(step.get("timeout_ms", 5000)),
-    )
-
-
-def load_task_file_from_dict(data: dict) -> TaskDefinition:
-    """Build TaskDefinition from a dict (e.g. from form or API)."""
-    steps = tuple(_parse_step(s) for s in data.get("steps") or [])
-    payloads = {k: v for k, v in (data.get("payloads") or {}).items() if isinstance(v, dict)}
-    defaults = dict(data.get("defaults") or {})
-    return TaskDefinition(
-        task_id=str(data.get("task_id", "")),
-        name=str(data.get("name", "")),
-        steps=steps,
-        payloads=payloads,
-        defaults=defaults,
-    )
-
-
-def load_task_file(path: Path) -> TaskDefinition:
-    """Load one .task.json file into TaskDefinition."""
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return load_task_file_from_dict(data)
-
-
-class FileTaskRegistryAdapter:
-    """Implements TaskRegistryPort by loading .task.json from a directory."""
-
-    def __init__(self, tasks_dir: Path | None = None) -> None:
+# Bump when the sidecar layout changes so an old index is rebuilt rather than misread.
+INDEX_FORMAT = 1
+DEFAULT_MAX_RESIDENT_TASKS = 256
+
+
+@dataclass(frozen=True)
+class _IndexEntry:
+    """What the registry last saw at one path: stat fingerprint, content hash, and the task header."""
+
+    mtime_ns: int
+    size: int
+    sha256: str
+    task_id: str
+    name: str
+
+
+def _scan_task_files(tasks_dir: Path) -> dict[Path, os.stat_result]:
+    """*.task.json files directly under tasks_dir with their stat (one scandir, no file reads)."""
+    found: dict[Path, os.stat_result] = {}
+    try:
+        with os.scandir(tasks_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".task.json") and entry.is_file():
+                    found[Path(entry.path)] = entry.stat()
+    except FileNotFoundError:
+        pass
+    return found
+
+
+def _read_index(index_path: Path, tasks_dir: Path) -> dict[Path, _IndexEntry]:
+    """Sidecar index entries for tasks_dir; {} when missing, stale-format, or written for another directory."""
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("format") != INDEX_FORMAT or data.get("tasks_dir") != str(tasks_dir):
+        return {}
+    try:
+        return {tasks_dir / name: _IndexEntry(*row) for name, row in data["entries"].items()}
+    except (KeyError, TypeError, AttributeError):
+        return {}
+
+
+def _write_index(index_path: Path, tasks_dir: Path, index: dict[Path, _IndexEntry]) -> None:
+    data = {
+        "format": INDEX_FORMAT,
+        "tasks_dir": str(tasks_dir),
+        "entries": {
+            path.name: [e.mtime_ns, e.size, e.sha256, e.task_id, e.name] for path, e in sorted(index.items())
+        },
+    }
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = index_path.with_name(f".{index_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, index_path)
+    except OSError:
+        pass  # The sidecar is an optimization; without it the next start re-reads headers from the files.
+
+
+@dataclass(frozen=True)
+class _DirectorySource:
+    """Directory tasks as of one snapshot: task_id -> (path, sha256, name), in path order."""
+
+    entries: dict[str, tuple[Path, str, str]]
+    resident: ResidentCache
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self.entries
+
+    def headers(self) -> list[tuple[str, str]]:
+        return [(task_id, name) for task_id, (_, _, name) in self.entries.items()]
+
+    def get(self, task_id: str) -> TaskDefinition | None:
+        found = self.entries.get(task_id)
+        if found is None:
+            return None
+        path, sha256, _ = found
+        task = self.resident.get((task_id, sha256))
+        if task is not None:
+            return task
+        read = read_task_file(str(path))
+        if read.task is None or read.task.task_id != task_id:
+            return None  # unreadable, or now defines another task; the next refresh re-indexes it
+        # Edited since this snapshot: serve the file as it is now (cached under its new hash, which the
+        # next refresh indexes) rather than reporting a task that exists as missing.
+        self.resident.put((task_id, read.sha256), read.task)
+        return read.task
+
+
+class FileTaskRegistryAdapter(SnapshotRegistry):
+    """Implements TaskRegistryPort by loading .task.json from a directory.
+
+    The directory is indexed by path -> (mtime_ns, size, sha256, task_id, name): refresh() reads only
+    files whose stat changed, and list_tasks() answers from the index alone. With index_path set the
+    index is persisted as a sidecar, so a restart lists an unchanged library without opening any task
+    file. Full definitions are parsed on get() and at most max_resident of them stay in memory (LRU).
+    Tasks registered at runtime (path, definition, compose) are not owned by the index, stay resident,
+    and survive refresh. A cold refresh of at least parallel_min_files files reads and hashes them
+    across load_workers processes (default: one per core); every unreadable file is reported.
+
+    Readers never lock: every write (refresh, register, compose) is serialized by one writer lock,
+    builds a new RegistrySnapshot from copies, and publishes it by swapping one reference. snapshot()
+    hands out the current one; a run that pins it keeps its view however many writes follow.
+    """
+
+    def __init__(
+        self,
+        tasks_dir: Path | None = None,
+        index_path: Path | None = None,
+        max_resident: int = DEFAULT_MAX_RESIDENT_TASKS,
+        load_workers: int | None = None,
+        parallel_min_files: int = PARALLEL_LOAD_MIN_FILES,
+    ) -> None:
         # Default: repo root is 4 levels up from this file (simulator/adapters/tasks)
         _repo = Path(__file__).resolve().parents[4]
         self._tasks_dir = tasks_dir or (_repo / "tests" / "fixtures" / "tasks")
-        self._cache: dict[str, TaskDefinition] = {}
+        self._index_path = index_path
+        self._load_workers = load_workers
+        self._parallel_min_files = parallel_min_files
+        # Writer-side state, touched only under _write_lock.
+        self._index: dict[Path, _IndexEntry] = {}
+        self._paths: dict[str, Path] = {}
+        self._write_lock = threading.Lock()
         self._loaded = False
+        self._resident = ResidentCache(max_resident)
+        self._snapshot = RegistrySnapshot(0, _DirectorySource({}, self._resident), {}, CompositionGraph())
+
+    @property
+    def resident_count(self) -> int:
+        """Directory tasks currently materialized in memory (runtime-registered tasks not included)."""
+        return len(self._resident)
 
     def _ensure_loaded(self) -> None:
         if self._loaded:
             return
-        if self._tasks_dir.exists():
-            for p in self._tasks_dir.glob("*.task.json"):
-                try:
-                    task = load_task_file(p)
-                    self._cache[task.task_id] = task
-                except (json.JSONDecodeError, KeyError, TypeError):
-                    continue
-        self._loaded = True
+        self.refresh()
 
-    def get(self, task_id: str) -> TaskDefinition | None:
+    def snapshot(self) -> RegistrySnapshot:
+        """The current published snapshot (immutable; get and list_tasks on it never lock)."""
         self._ensure_loaded()
-        return self._cache.get(task_id)
+        return self._snapshot
 
-    def list_tasks(self) -> list[dict[str, object]]:
-        self._ensure_loaded()
-        return [{"task_id": t.task_id, "name": t.name} for t in self._cache.values()]
-
-    def register_from_path(self, path: str) -> dict[str, object]:
-        """Load a .task.json from path and register it (runtime load without restart)."""
-        p = Path(path)
-        if not p.exists() or not p.suffix.lower().endswith(".json"):
-            return {"ok": False, "task_id": "", "error_code": "TASK_PATH_INVALID"}
-        try:
-            task = load_task_file(p)
-            self._cache[task.task_id] = task
-            self._loaded = True
-            return {"ok": True, "task_id": task.task_id, "error_code": "OK"}
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
-            return {"ok": False, "task_id": "", "error_code": "TASK_LOAD_FAILED", "message": str(e)}
+    def _forget(self, path: Path, task_id: str) -> bool:
+        """Drop task_id's directory entry if it still points at path. True if it did."""
+        if not task_id or self._paths.get(task_id) != path:
+            return False
+        del self._paths[task_id]
+        return True
 
-    def compose(self, base_task_ids: list[str], overrides: dict[str, object]) -> dict[str, object]:
-        """Compose a new task from base tasks. Returns {ok, task_id, task_def, error_code}."""
-        self._ensure_loaded()
-        if not base_task_ids:
-            return {"ok": False, "task_id": "", "error_code": "COMPOSE_NO_BASES"}
-        tasks: list[TaskDefinition] = []
-        for tid in base_task_ids:
-            t = self._cache.get(tid)
-            if t is None:
-                return {"ok": False, "task_id": "", "error_code": "COMPOSE_BASE_NOT_FOUND", "missing": tid}
-            tasks.append(t)
-        # Merge: concatenate steps, merge payloads/defaults; overrides apply to result
-        merged_steps: list[TaskStep] = []
-        merged_payloads: dict[str, dict] = {}
-        merged_defaults: dict[str, object] = {}
-        for t in tasks:
-            merged_steps.extend(t.steps)
-            merged_payloads.update(t.payloads)
-            merged_defaults.update(t.defaults)
-        new_id = str(overrides.get("task_id") or f"composed-{'-'.join(base_task_ids)}")
-        if new_id in self._cache:
-            return {"ok": False, "task_id": new_id, "error_code": "COMPOSE_DUPLICATE_ID"}
-        merged_defaults.update(overrides.get("defaults") or {})
-        composed = TaskDefinition(
-            task_id=new_id,
-            name=str(overrides.get("name") or f"Composed from {', '.join(base_task_ids)}"),
-            steps=tuple(merged_steps),
-            payloads=merged_payloads,
-            defaults=merged_defaults,
-        )
-        self._cache[new_id] = composed
-        return {"ok": True, "task_id": new_id, "error_code": "OK"}
-
-    def register_definition(self, definition: dict[str, object]) -> dict[str, object]:
-        """Register a task from an in-memory definition (create from scratch). Returns {ok, task_id, error_code}."""
-        try:
-            task_id = str(definition.get("task_id") or "")
-            if not task_id:
-                return {"ok": False, "task_id": "", "error_code": "TASK_ID_REQUIRED"}
-            if task_id in self._cache:
-                return {"ok": False, "task_id": task_id, "error_code": "TASK_DUPLICATE_ID"}
-            task = load_task_file_from_dict(definition)
-            self._cache[task_id] = task
+    def refresh(self) -> dict[str, object]:
+        """Sync with the tasks directory. Returns {ok, added, updated, removed, unchanged, errors}."""
+        added: list[str] = []
+        updated: list[str] = []
+        removed: list[str] = []
+        errors: list[dict[str, str]] = []
+        unchanged = 0
+        with self._write_lock:
+            dirty = False
+            if not self._loaded and self._index_path is not None:
+                self._index = _read_index(self._index_path, self._tasks_dir)
+                self._paths = {e.task_id: p for p, e in sorted(self._index.items()) if e.task_id}
+                dirty = not self._index
+            found = _scan_task_files(self._tasks_dir)
+            for path in sorted(self._index.keys() - found.keys()):
+                task_id = self._index.pop(path).task_id
+                dirty = True
+                if self._forget(path, task_id) and self._loaded:
+                    removed.append(task_id)
+            stale: list[Path] = []
+            for path in sorted(found):
+                prev = self._index.get(path)
+                st = found[path]
+                if prev is not None and prev.mtime_ns == st.st_mtime_ns and prev.size == st.st_size:
+                    unchanged += 1
+                else:
+                    stale.append(path)
+            reads = read_task_files(
+                stale, workers=self._load_workers, headers_only=True, min_parallel=self._parallel_min_files
+            )
+            for path, read in zip(stale, reads):
+                st = found[path]
+                prev = self._index.get(path)
+                dirty = True
+                if not read.sha256:
+                    errors.append({"path": str(path), "error_code": "TASK_LOAD_FAILED", "message": str(read.error)})
+                    continue
+                if prev is not None and prev.sha256 == read.sha256:
+                    # Touched but identical: remember the new stat so the next refresh skips the read.
+                    self._index[path] = replace(prev, mtime_ns=st.st_mtime_ns, size=st.st_size)
+                    unchanged += 1
+                    continue
+                if read.error is not None:
+                    # Keep the last good header and hash (so its resident definition is still served)
+                    # until the file changes again.
+                    kept = prev or _IndexEntry(0, 0, "", "", "")
+                    self._index[path] = replace(kept, mtime_ns=st.st_mtime_ns, size=st.st_size)
+                    errors.append({"path": str(path), "error_code": "TASK_LOAD_FAILED", "message": read.error})
+                    continue
+                task_id = read.task_id
+                if prev is not None and prev.task_id != task_id and self._forget(path, prev.task_id):
+                    removed.append(prev.task_id)
+                self._index[path] = _IndexEntry(st.st_mtime_ns, st.st_size, read.sha256, task_id, read.name)
+                self._paths[task_id] = path
+                (updated if prev is not None and prev.task_id == task_id else added).append(task_id)
+            if dirty or not self._loaded:
+                entries = {
+                    e.task_id: (p, e.sha256, e.name)
+                    for p, e in sorted(self._index.items())
+                    if e.task_id and self._paths.get(e.task_id) == p
+                }
+                composites = self._snapshot.composites
+                if added or updated or removed:
+                    composites = composites.copy()
+                    composites.invalidate(added + updated + removed)
+                self._publish(source=_DirectorySource(entries, self._resident), composites=composites)
+            if dirty and self._index_path is not None:
+                _write_index(self._index_path, self._tasks_dir, self._index)
             self._loaded = True
-            return {"ok": True, "task_id": task_id, "error_code": "OK"}
-        except (KeyError, TypeError) as e:
-            return {"ok": False, "task_id": "", "error_code": "TASK_DEFINITION_INVALID", "message": str(e)}
+        return {
+            "ok": not errors,
+            "added": added,
+            "updated": updated,
+            "removed": removed,
+            "unchanged": unchanged,
+            "errors": errors,
+        }
+
+    def get(self, task_id: str) -> TaskDefinition | None:
+        """Runtime task, resident copy, or the directory task parsed now (None if missing or unparseable)."""
+        return self.snapshot().get(task_id)
+
+    def list_tasks(self) -> list[dict[str, object]]:
+        """task_id and name of every task, from the index: no task file is opened or parsed."""
+        return self.snapshot().list_tasks()
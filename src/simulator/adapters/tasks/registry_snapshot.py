@@ -0,0 +1,172 @@
+"""Immutable task registry snapshots, published by reference swap and read without locks."""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Protocol
+
+from simulator.adapters.tasks.composition import CompositeNode, CompositionGraph
+from simulator.adapters.tasks.task_files import load_task_file, load_task_file_from_dict
+from simulator.domain.models.target_and_task import TaskDefinition
+
+
+class ResidentCache:
+    """
+    Bounded LRU of decoded definitions shared by every snapshot of one registry. Keys carry the
+    version of the source record (file hash, bundle generation), so a snapshot never picks up a
+    definition decoded for another one. Hits take no lock; inserts, which follow a file read or a
+    record decode anyway, do.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._max = max(1, max_entries)
+        self._entries: OrderedDict[Hashable, TaskDefinition] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> TaskDefinition | None:
+        task = self._entries.get(key)
+        if task is not None:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                pass  # evicted by a concurrent put
+        return task
+
+    def put(self, key: Hashable, task: TaskDefinition) -> None:
+        with self._lock:
+            self._entries[key] = task
+            while len(self._entries) > self._max:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class TaskSource(Protocol):
+    """The backing store's tasks as of one snapshot (directory index or mapped bundle)."""
+
+    def get(self, task_id: str) -> TaskDefinition | None: ...
+    def __contains__(self, task_id: object) -> bool: ...
+    def headers(self) -> Iterable[tuple[str, str]]: ...
+
+
+@dataclass(frozen=True)
+class RegistrySnapshot:
+    """
+    One published version of a registry. Nothing reachable from it is mutated after publication
+    (the composition graph only fills its flatten memo), so any number of threads read it without
+    locking and a run that pinned it keeps seeing the same tasks while writers publish newer ones.
+    """
+
+    version: int
+    source: TaskSource
+    runtime: dict[str, TaskDefinition]
+    composites: CompositionGraph
+
+    def get(self, task_id: str) -> TaskDefinition | None:
+        """Runtime task, flattened composite, or the source's task (None if missing or unreadable)."""
+        task = self.runtime.get(task_id)
+        if task is not None:
+            return task
+        if task_id in self.composites:
+            return self.composites.flatten(task_id, self.get)
+        return self.source.get(task_id)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self.runtime or task_id in self.composites or task_id in self.source
+
+    def list_tasks(self) -> list[dict[str, object]]:
+        """task_id and name of every task: source headers first, then runtime tasks, then composites."""
+        listed: list[dict[str, object]] = [
+            {"task_id": t, "name": n}
+            for t, n in self.source.headers()
+            if t not in self.runtime and t not in self.composites
+        ]
+        listed.extend({"task_id": t.task_id, "name": t.name} for t in self.runtime.values())
+        listed.extend(self.composites.headers())
+        return listed
+
+
+class SnapshotRegistry:
+    """
+    Runtime writes shared by the directory and bundle registries. Each one takes the writer lock,
+    builds the next snapshot from copies, and publishes it. Subclasses own _snapshot and _write_lock
+    and override _ensure_loaded() when their source is read lazily.
+    """
+
+    _snapshot: RegistrySnapshot
+    _write_lock: threading.Lock
+
+    def _ensure_loaded(self) -> None:
+        """Read the backing source once before the first write (no-op unless overridden)."""
+
+    def _publish(self, **changes: object) -> None:
+        """Swap in a snapshot with changes applied (writer lock held)."""
+        current = self._snapshot
+        self._snapshot = replace(current, version=current.version + 1, **changes)  # type: ignore[arg-type]
+
+    def register_from_path(self, path: str) -> dict[str, object]:
+        """Load a .task.json from path and register it (runtime load without restart)."""
+        p = Path(path)
+        if not p.exists() or not p.suffix.lower().endswith(".json"):
+            return {"ok": False, "task_id": "", "error_code": "TASK_PATH_INVALID"}
+        try:
+            task = load_task_file(p)
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            return {"ok": False, "task_id": "", "error_code": "TASK_LOAD_FAILED", "message": str(e)}
+        self._ensure_loaded()
+        with self._write_lock:
+            current = self._snapshot
+            composites = current.composites.copy()
+            composites.invalidate([task.task_id])
+            self._publish(runtime={**current.runtime, task.task_id: task}, composites=composites)
+        return {"ok": True, "task_id": task.task_id, "error_code": "OK"}
+
+    def compose(self, base_task_ids: list[str], overrides: dict[str, object]) -> dict[str, object]:
+        """Compose a task from base tasks, kept as references until get(). Returns {ok, task_id, error_code}.
+
+        Composing again under an existing composite id replaces it; plain task ids cannot be reused.
+        """
+        if not base_task_ids:
+            return {"ok": False, "task_id": "", "error_code": "COMPOSE_NO_BASES"}
+        self._ensure_loaded()
+        with self._write_lock:
+            current = self._snapshot
+            for tid in base_task_ids:
+                if tid not in current:
+                    return {"ok": False, "task_id": "", "error_code": "COMPOSE_BASE_NOT_FOUND", "missing": tid}
+            new_id = str(overrides.get("task_id") or f"composed-{'-'.join(base_task_ids)}")
+            if new_id in current and new_id not in current.composites:
+                return {"ok": False, "task_id": new_id, "error_code": "COMPOSE_DUPLICATE_ID"}
+            composites = current.composites.copy()
+            error = composites.add(CompositeNode(new_id, tuple(base_task_ids), dict(overrides)))
+            if error:
+                return {"ok": False, "task_id": new_id, "error_code": error}
+            self._publish(composites=composites)
+        return {"ok": True, "task_id": new_id, "error_code": "OK"}
+
+    def register_definition(self, definition: dict[str, object]) -> dict[str, object]:
+        """Register a task from an in-memory definition (create from scratch). Returns {ok, task_id, error_code}."""
+        try:
+            task_id = str(definition.get("task_id") or "")
+            if not task_id:
+                return {"ok": False, "task_id": "", "error_code": "TASK_ID_REQUIRED"}
+            task = load_task_file_from_dict(definition)
+        except (KeyError, TypeError) as e:
+            return {"ok": False, "task_id": "", "error_code": "TASK_DEFINITION_INVALID", "message": str(e)}
+        self._ensure_loaded()
+        with self._write_lock:
+            current = self._snapshot
+            if task_id in current:
+                return {"ok": False, "task_id": task_id, "error_code": "TASK_DUPLICATE_ID"}
+            self._publish(runtime={**current.runtime, task_id: task})
+        return {"ok": True, "task_id": task_id, "error_code": "OK"}
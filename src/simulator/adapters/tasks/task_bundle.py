@@ -0,0 +1,299 @@
+"""Packed task bundle: one versioned binary file holding a whole task library.
+
+Layout (little-endian):
+    header         _HEADER (magic, version, counts, section positions)
+    string offsets (string_count + 1) x u32, relative to the string blob
+    string blob    UTF-8 bytes of every distinct string (ids, names, step fields)
+    index          record_count x _INDEX_ENTRY (task_id string, name string, record position),
+                   sorted by task_id bytes so a lookup is a binary search over the mapped file
+    records        u32 length + body per task: raw sha256 content hash, steps as string-table
+                   references (a repeat step's body follows it inline), payloads/defaults as compact JSON
+
+Readers mmap the file and decode only the records they are asked for.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from collections.abc import Iterator
+from pathlib import Path
+
+from simulator.adapters.tasks.task_files import read_task_files
+from simulator.domain.models.target_and_task import StepExpect, TaskDefinition, TaskStep
+from simulator.domain.services.execution_plan import task_content_hash
+
+BUNDLE_MAGIC = b"SIMTASKB"
+BUNDLE_VERSION = 3  # 2: repeat steps (count, start, counter, nested steps); 3: signed step counts and timeouts
+
+_HEADER = struct.Struct("<8sHHIIQQQQ")
+_INDEX_ENTRY = struct.Struct("<IIQ")
+_U32 = struct.Struct("<I")
+# step_id, action, message_type, payload_ref, timeout_ms, has_expect, count, start, counter, child steps
+_STEP = struct.Struct("<IIIIiBiqII")
+_EXPECT = struct.Struct("<IIiI")  # direction, message_type, expected_count, comparison
+_NO_STRING = 0xFFFFFFFF
+
+
+class BundleFormatError(ValueError):
+    """The file is not a task bundle this version can read."""
+
+
+class BundleEncodeError(ValueError):
+    """A task holds a value the bundle layout cannot store (e.g. a count beyond 32 bits)."""
+
+    def __init__(self, task_id: str, message: str) -> None:
+        super().__init__(f"{task_id}: {message}")
+        self.task_id = task_id
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.ids: dict[str, int] = {}
+        self.values: list[str] = []
+
+    def ref(self, value: str | None) -> int:
+        if value is None:
+            return _NO_STRING
+        sid = self.ids.get(value)
+        if sid is None:
+            sid = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return sid
+
+
+def _json_bytes(value: object) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _encode_steps(steps: tuple[TaskStep, ...], strings: _StringTable, parts: list[bytes]) -> None:
+    for step in steps:
+        parts.append(
+            _STEP.pack(
+                strings.ref(step.step_id),
+                strings.ref(step.action),
+                strings.ref(step.message_type),
+                strings.ref(step.payload_ref),
+                step.timeout_ms,
+                step.expect is not None,
+                step.count,
+                step.start,
+                strings.ref(step.counter),
+                len(step.steps),
+            )
+        )
+        if step.expect is not None:
+            e = step.expect
+            parts.append(_EXPECT.pack(
+                strings.ref(e.direction), strings.ref(e.message_type), e.expected_count, strings.ref(e.comparison)
+            ))
+        _encode_steps(step.steps, strings, parts)
+
+
+def _encode_record(task: TaskDefinition, strings: _StringTable) -> bytes:
+    parts = [bytes.fromhex(task.content_hash or task_content_hash(task)), _U32.pack(len(task.steps))]
+    _encode_steps(task.steps, strings, parts)
+    for blob in (_json_bytes(task.payloads), _json_bytes(task.defaults)):
+        parts.append(_U32.pack(len(blob)))
+        parts.append(blob)
+    body = b"".join(parts)
+    return _U32.pack(len(body)) + body
+
+
+def write_bundle(tasks: list[TaskDefinition], path: Path) -> int:
+    """Write tasks to path atomically (last definition wins per task_id). Returns the file size in bytes.
+
+    Raises BundleEncodeError, before anything is written, for a task the layout cannot hold.
+    """
+    strings = _StringTable()
+    by_id = {t.task_id: t for t in tasks}
+    ordered = sorted(by_id.values(), key=lambda t: t.task_id.encode("utf-8"))
+    entries = [(strings.ref(t.task_id), strings.ref(t.name)) for t in ordered]
+    records = []
+    for t in ordered:
+        try:
+            records.append(_encode_record(t, strings))
+        except struct.error as e:
+            raise BundleEncodeError(t.task_id, str(e)) from e
+
+    encoded = [s.encode("utf-8") for s in strings.values]
+    offsets = [0]
+    for b in encoded:
+        offsets.append(offsets[-1] + len(b))
+    offsets_pos = _HEADER.size
+    blob_pos = offsets_pos + 4 * len(offsets)
+    index_pos = blob_pos + offsets[-1]
+    records_pos = index_pos + _INDEX_ENTRY.size * len(records)
+
+    out = bytearray(_HEADER.pack(
+        BUNDLE_MAGIC, BUNDLE_VERSION, 0, len(encoded), len(records), offsets_pos, blob_pos, index_pos, records_pos
+    ))
+    out += struct.pack(f"<{len(offsets)}I", *offsets)
+    out += b"".join(encoded)
+    position = records_pos
+    for (id_ref, name_ref), record in zip(entries, records):
+        out += _INDEX_ENTRY.pack(id_ref, name_ref, position)
+        position += len(record)
+    for record in records:
+        out += record
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(out)
+    os.replace(tmp, path)
+    return len(out)
+
+
+class TaskBundle:
+    """Read-only view of a bundle file over mmap. Opening costs one header read, whatever the library size."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as fh:
+            try:
+                self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:  # empty file
+                raise BundleFormatError(f"{path}: {e}") from e
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise BundleFormatError(f"{path}: truncated header")
+        magic, version, _, self._string_count, self._count, self._offsets_pos, self._blob_pos, self._index_pos, _ = (
+            _HEADER.unpack_from(self._map, 0)
+        )
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            self.close()
+            raise BundleFormatError(f"{path}: not a version {BUNDLE_VERSION} task bundle")
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _string_bytes(self, sid: int) -> bytes:
+        start, end = struct.unpack_from("<II", self._map, self._offsets_pos + 4 * sid)
+        return self._map[self._blob_pos + start : self._blob_pos + end]
+
+    def _string(self, sid: int) -> str | None:
+        return None if sid == _NO_STRING else self._string_bytes(sid).decode("utf-8")
+
+    def _entry(self, i: int) -> tuple[int, int, int]:
+        return _INDEX_ENTRY.unpack_from(self._map, self._index_pos + i * _INDEX_ENTRY.size)
+
+    def headers(self) -> Iterator[tuple[str, str]]:
+        """(task_id, name) for every task, in task_id order; no record is decoded."""
+        for i in range(self._count):
+            id_ref, name_ref, _ = self._entry(i)
+            yield self._string_bytes(id_ref).decode("utf-8"), self._string_bytes(name_ref).decode("utf-8")
+
+    def content_hashes(self) -> Iterator[tuple[str, str]]:
+        """(task_id, content hash) for every task, in task_id order; reads each record's hash only."""
+        for i in range(self._count):
+            id_ref, _, position = self._entry(i)
+            yield self._string_bytes(id_ref).decode("utf-8"), self._map[position + 4 : position + 36].hex()
+
+    def _find(self, task_id: str) -> tuple[int, int] | None:
+        """(name string, record position) for task_id by binary search over the sorted index."""
+        key = task_id.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            id_ref, name_ref, position = self._entry(mid)
+            probe = self._string_bytes(id_ref)
+            if probe < key:
+                lo = mid + 1
+            elif probe > key:
+                hi = mid
+            else:
+                return name_ref, position
+        return None
+
+    def __contains__(self, task_id: object) -> bool:
+        return isinstance(task_id, str) and self._find(task_id) is not None
+
+    def get(self, task_id: str) -> TaskDefinition | None:
+        """Decode the one record for task_id (None when absent)."""
+        found = self._find(task_id)
+        if found is None:
+            return None
+        name_ref, position = found
+        return self._decode(task_id, self._string(name_ref) or "", position)
+
+    def _decode_steps(self, count: int, pos: int) -> tuple[tuple[TaskStep, ...], int]:
+        """count steps starting at pos (repeat bodies recursively); returns them and the position after."""
+        m, s = self._map, self._string
+        steps: list[TaskStep] = []
+        for _ in range(count):
+            step_id, action, message_type, payload_ref, timeout_ms, has_expect, *loop = _STEP.unpack_from(m, pos)
+            repeat, start, counter, children = loop
+            pos += _STEP.size
+            expect = None
+            if has_expect:
+                direction, expect_type, expected_count, comparison = _EXPECT.unpack_from(m, pos)
+                pos += _EXPECT.size
+                expect = StepExpect(
+                    direction=s(direction) or "",
+                    message_type=s(expect_type) or "",
+                    expected_count=expected_count,
+                    comparison=s(comparison) or "",
+                )
+            body, pos = self._decode_steps(children, pos)
+            steps.append(TaskStep(
+                step_id=s(step_id) or "",
+                action=s(action) or "",
+                message_type=s(message_type) or "",
+                payload_ref=s(payload_ref),
+                expect=expect,
+                timeout_ms=timeout_ms,
+                count=repeat,
+                counter=s(counter) or "",
+                start=start,
+                steps=body,
+            ))
+        return tuple(steps), pos
+
+    def _decode(self, task_id: str, name: str, position: int) -> TaskDefinition:
+        m = self._map
+        pos = position + 4
+        content_hash = m[pos : pos + 32].hex()
+        (step_count,) = _U32.unpack_from(m, pos + 32)
+        steps, pos = self._decode_steps(step_count, pos + 36)
+        blobs = []
+        for _ in range(2):
+            (size,) = _U32.unpack_from(m, pos)
+            blobs.append(json.loads(m[pos + 4 : pos + 4 + size]))
+            pos += 4 + size
+        return TaskDefinition(
+            task_id=task_id,
+            name=name,
+            steps=tuple(steps),
+            payloads=blobs[0],
+            defaults=blobs[1],
+            content_hash=content_hash,
+        )
+
+
+def pack_task_directory(tasks_dir: Path, output: Path, workers: int | None = None) -> dict[str, object]:
+    """
+    Parse every *.task.json under tasks_dir (in parallel, see read_task_files) and write one bundle.
+    Nothing is written if any file fails. Returns {ok, path, task_count, size_bytes, errors}.
+    """
+    paths = sorted(tasks_dir.glob("*.task.json"))
+    reads = read_task_files(paths, workers=workers)
+    errors = [{"path": r.path, "error_code": "TASK_LOAD_FAILED", "message": r.error} for r in reads if r.error]
+    if errors:
+        return {"ok": False, "path": str(output), "task_count": 0, "size_bytes": 0, "errors": errors}
+    tasks = [r.task for r in reads if r.task is not None]
+    try:
+        size = write_bundle(tasks, output)
+    except BundleEncodeError as e:
+        path = next(r.path for r in reversed(reads) if r.task_id == e.task_id)
+        errors.append({"path": path, "error_code": "TASK_BUNDLE_ENCODE_FAILED", "message": str(e)})
+        return {"ok": False, "path": str(output), "task_count": 0, "size_bytes": 0, "errors": errors}
+    except OSError as e:
+        errors.append({"path": str(output), "error_code": "TASK_BUNDLE_WRITE_FAILED", "message": str(e)})
+        return {"ok": False, "path": str(output), "task_count": 0, "size_bytes": 0, "errors": errors}
+    count = len({t.task_id for t in tasks})
+    return {"ok": True, "path": str(output), "task_count": count, "size_bytes": size, "errors": []}
@@ -0,0 +1,66 @@
+"""Polling watcher that keeps a FileTaskRegistryAdapter in sync with its directory."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+
+from simulator.adapters.logging import ConsoleLoggingAdapter
+from simulator.adapters.tasks.file_task_registry import FileTaskRegistryAdapter
+from simulator.domain.ports.logging_port import LoggingPort
+
+DEFAULT_POLL_INTERVAL_SEC = 1.0
+
+
+class TaskDirectoryWatcher:
+    """
+    Calls registry.refresh() every interval_sec on a daemon thread. An unchanged directory costs one
+    scandir plus a stat comparison per file; on_change receives the refresh report when anything
+    was added, updated, removed, or failed to load. A poll that raises (in refresh or on_change) is
+    logged as TASK_WATCH_FAILED and the thread keeps polling.
+    """
+
+    def __init__(
+        self,
+        registry: FileTaskRegistryAdapter,
+        interval_sec: float = DEFAULT_POLL_INTERVAL_SEC,
+        on_change: Callable[[dict[str, object]], None] | None = None,
+        logger: LoggingPort | None = None,
+    ) -> None:
+        self._registry = registry
+        self._interval = interval_sec
+        self._on_change = on_change
+        self._logger = logger or ConsoleLoggingAdapter()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="task-dir-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout_sec: float = 2.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout_sec)
+            self._thread = None
+
+    def poll_once(self) -> dict[str, object]:
+        """One refresh; notifies on_change when the report is not a no-op."""
+        report = self._registry.refresh()
+        if self._on_change and (report["added"] or report["updated"] or report["removed"] or report["errors"]):
+            self._on_change(report)
+        return report
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self.poll_once()
+            except Exception as e:
+                self._logger.error("TASK_WATCH_FAILED", error=f"{type(e).__name__}: {e}")
@@ -0,0 +1,155 @@
+"""Parsing .task.json files, one at a time or in bulk across a process pool."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from simulator.domain.models.target_and_task import (
+    StepExpect,
+    TaskDefinition,
+    TaskStep,
+)
+from simulator.domain.services.execution_plan import task_content_hash
+
+# Below this many files a pool costs more to start than it saves.
+PARALLEL_LOAD_MIN_FILES = 256
+# Chunks per worker: enough to balance uneven file sizes without paying per-file IPC.
+_CHUNKS_PER_WORKER = 4
+
+
+def _parse_step(step: dict) -> TaskStep:
+    expect = step.get("expect")
+    step_expect = None
+    if expect and isinstance(expect, dict):
+        matcher = expect.get("matcher") or {}
+        step_expect = StepExpect(
+            direction=str(matcher.get("direction", "receive")),
+            message_type=str(matcher.get("message_type", "")),
+            expected_count=int(expect.get("expected_count", 0)),
+            comparison=str(expect.get("comparison", "eq")),
+        )
+    action = str(step.get("action", "send"))
+    if action == "loop":
+        action = "repeat"
+    return TaskStep(
+        step_id=str(step.get("step_id", "")),
+        action=action,
+        message_type=str(step.get("message_type", "")),
+        payload_ref=step.get("payload_ref") if isinstance(step.get("payload_ref"), str) else None,
+        expect=step_expect,
+        timeout_ms=int(step.get("timeout_ms", 5000)),
+        count=int(step.get("count", 1)),
+        counter=str(step.get("counter", "i")),
+        start=int(step.get("start", 0)),
+        steps=tuple(_parse_step(s) for s in step.get("steps") or []) if action == "repeat" else (),
+    )
+
+
+def load_task_file_from_dict(data: dict) -> TaskDefinition:
+    """Build TaskDefinition from a dict (e.g. from form or API)."""
+    steps = tuple(_parse_step(s) for s in data.get("steps") or [])
+    payloads = {k: v for k, v in (data.get("payloads") or {}).items() if isinstance(v, dict)}
+    defaults = dict(data.get("defaults") or {})
+    task = TaskDefinition(
+        task_id=str(data.get("task_id", "")),
+        name=str(data.get("name", "")),
+        steps=steps,
+        payloads=payloads,
+        defaults=defaults,
+    )
+    return replace(task, content_hash=task_content_hash(task))
+
+
+def load_task_file(path: Path) -> TaskDefinition:
+    """Load one .task.json file into TaskDefinition."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return load_task_file_from_dict(data)
+
+
+def compose_definition(
+    tasks: list[TaskDefinition], base_task_ids: list[str], overrides: dict[str, object]
+) -> TaskDefinition:
+    """Concatenate steps and merge payloads/defaults of tasks; overrides set task_id, name, and defaults."""
+    merged_steps: list[TaskStep] = []
+    merged_payloads: dict[str, dict] = {}
+    merged_defaults: dict[str, object] = {}
+    for t in tasks:
+        merged_steps.extend(t.steps)
+        merged_payloads.update(t.payloads)
+        merged_defaults.update(t.defaults)
+    merged_defaults.update(overrides.get("defaults") or {})
+    composed = TaskDefinition(
+        task_id=str(overrides.get("task_id") or f"composed-{'-'.join(base_task_ids)}"),
+        name=str(overrides.get("name") or f"Composed from {', '.join(base_task_ids)}"),
+        steps=tuple(merged_steps),
+        payloads=merged_payloads,
+        defaults=merged_defaults,
+    )
+    return replace(composed, content_hash=task_content_hash(composed))
+
+
+@dataclass(frozen=True)
+class TaskFileRead:
+    """Outcome for one file of a bulk read: header (and definition, unless headers_only) or an error."""
+
+    path: str
+    sha256: str  # "" when the file could not be read
+    task_id: str
+    name: str
+    task: TaskDefinition | None
+    error: str | None = None  # TASK_LOAD_FAILED message; sha256 is still set when only parsing failed
+
+
+def read_task_file(path: str, headers_only: bool = False) -> TaskFileRead:
+    """Read, hash, and parse one task file. Never raises: failures come back in .error."""
+    try:
+        raw = Path(path).read_bytes()
+    except OSError as e:
+        return TaskFileRead(path, "", "", "", None, str(e))
+    digest = hashlib.sha256(raw).hexdigest()
+    try:
+        task = load_task_file_from_dict(json.loads(raw))
+    except (UnicodeDecodeError, json.JSONDecodeError, AttributeError, KeyError, TypeError, ValueError) as e:
+        return TaskFileRead(path, digest, "", "", None, str(e))
+    # headers_only still validates the whole definition; it only keeps the result out of the reply.
+    return TaskFileRead(path, digest, task.task_id, task.name, None if headers_only else task)
+
+
+def _read_chunk(paths: list[str], headers_only: bool) -> list[TaskFileRead]:
+    return [read_task_file(p, headers_only) for p in paths]
+
+
+def read_task_files(
+    paths: list[Path],
+    workers: int | None = None,
+    headers_only: bool = False,
+    min_parallel: int = PARALLEL_LOAD_MIN_FILES,
+) -> list[TaskFileRead]:
+    """
+    read_task_file for every path, in input order. With at least min_parallel files and more than
+    one worker (default: os.cpu_count()), the list is sharded across a ProcessPoolExecutor and each
+    worker returns its parsed results in one batch; otherwise (or if no pool can be started) the
+    files are read in this process. Workers are spawned, not forked, since the caller may already
+    run watcher, pool or scheduler threads.
+    """
+    names = [str(p) for p in paths]
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(names) < min_parallel:
+        return _read_chunk(names, headers_only)
+    size = -(-len(names) // (workers * _CHUNKS_PER_WORKER))
+    chunks = [names[i : i + size] for i in range(0, len(names), size)]
+    results: list[TaskFileRead] = []
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            for chunk in pool.map(_read_chunk, chunks, [headers_only] * len(chunks)):
+                results.extend(chunk)
+    except (OSError, BrokenProcessPool):
+        return _read_chunk(names, headers_only)
+    return results
@@ -1,5 +1,7 @@
-"""Transport adapters: TCP and UDP client/server."""
+"""Transport adapters: TCP and UDP client/server (blocking and asyncio), and an in-memory peer."""
 
 from simulator.adapters.transport.composite_transport import CompositeTransportAdapter
+from simulator.adapters.transport.memory import MemoryTransportAdapter, ScriptedResponder
+from simulator.adapters.transport.tcp.connection_pool import TcpConnectionPool
 
-__all__ = ["CompositeTransportAdapter"]
+__all__ = ["CompositeTransportAdapter", "MemoryTransportAdapter", "ScriptedResponder", "TcpConnectionPool"]
@@ -1,6 +1,7 @@
-"""Transport common: endpoint parsing and validation."""
+"""Transport common: endpoint parsing, framing, and validation."""
 
 from simulator.adapters.transport.common.endpoint_parser import parse_endpoint
+from simulator.adapters.transport.common.framing import StreamReassembler, create_framer
 from simulator.adapters.transport.common.transport_validation import validate_transport_config
 
-__all__ = ["parse_endpoint", "validate_transport_config"]
+__all__ = ["StreamReassembler", "create_framer", "parse_endpoint", "validate_transport_config"]
@@ -0,0 +1,195 @@
+"""Stream framing: length-prefixed, delimiter, fixed-size framers and a zero-copy reassembler.
+
+Framers only locate frame boundaries inside a byte buffer; StreamReassembler owns one preallocated
+bytearray per stream, fills it with recv_into, and hands out memoryview slices of complete frames.
+"""
+
+from __future__ import annotations
+
+import socket
+import struct
+from typing import Any, Protocol
+
+FRAMING_IDS = ("length-prefixed", "delimiter", "fixed-size")
+DEFAULT_MAX_FRAME_BYTES = 16 * 1024 * 1024
+
+
+class FramingError(ValueError):
+    """Invalid framing config, or a frame that violates it (e.g. over max_frame_bytes)."""
+
+
+class Framer(Protocol):
+    """Wrap outbound bodies and locate the first complete inbound frame in buf[start:end]."""
+
+    def encode(self, body: bytes) -> bytes: ...
+
+    def frame_bounds(self, buf: bytearray, start: int, end: int) -> tuple[int, int, int] | None:
+        """Return (body_start, body_end, frame_end) as absolute offsets, or None if incomplete."""
+        ...
+
+
+class LengthPrefixedFramer:
+    """Body preceded by an unsigned 1/2/4-byte length in big or little endian."""
+
+    _FORMATS = {1: "B", 2: "H", 4: "I"}
+
+    def __init__(
+        self,
+        prefix_bytes: int = 4,
+        byteorder: str = "big",
+        max_frame_bytes: int = DEFAULT_MAX_FRAME_BYTES,
+    ) -> None:
+        if prefix_bytes not in self._FORMATS:
+            raise FramingError(f"prefix_bytes must be 1, 2 or 4, got {prefix_bytes!r}")
+        if byteorder not in ("big", "little"):
+            raise FramingError(f"byteorder must be 'big' or 'little', got {byteorder!r}")
+        order = ">" if byteorder == "big" else "<"
+        self._prefix = struct.Struct(order + self._FORMATS[prefix_bytes])
+        self._max_body = min(max_frame_bytes, (1 << (8 * prefix_bytes)) - 1)
+
+    def encode(self, body: bytes) -> bytes:
+        if len(body) > self._max_body:
+            raise FramingError(f"frame body of {len(body)} bytes exceeds {self._max_body}")
+        return self._prefix.pack(len(body)) + body
+
+    def frame_bounds(self, buf: bytearray, start: int, end: int) -> tuple[int, int, int] | None:
+        head = start + self._prefix.size
+        if end < head:
+            return None
+        (length,) = self._prefix.unpack_from(buf, start)
+        if length > self._max_body:
+            raise FramingError(f"inbound frame of {length} bytes exceeds {self._max_body}")
+        if end < head + length:
+            return None
+        return head, head + length, head + length
+
+
+class DelimiterFramer:
+    """Body terminated by a delimiter (default newline, the MVP wire format)."""
+
+    def __init__(self, delimiter: bytes = b"\n", max_frame_bytes: int = DEFAULT_MAX_FRAME_BYTES) -> None:
+        if not delimiter:
+            raise FramingError("delimiter must be non-empty")
+        self._delimiter = delimiter
+        self._max_body = max_frame_bytes
+
+    def encode(self, body: bytes) -> bytes:
+        return body + self._delimiter
+
+    def frame_bounds(self, buf: bytearray, start: int, end: int) -> tuple[int, int, int] | None:
+        pos = buf.find(self._delimiter, start, end)
+        if pos < 0:
+            if end - start > self._max_body:
+                raise FramingError(f"no delimiter within {self._max_body} bytes")
+            return None
+        return start, pos, pos + len(self._delimiter)
+
+
+class FixedSizeFramer:
+    """Every frame is exactly size bytes."""
+
+    def __init__(self, size: int) -> None:
+        if size <= 0:
+            raise FramingError(f"size must be positive, got {size!r}")
+        self._size = size
+
+    def encode(self, body: bytes) -> bytes:
+        if len(body) > self._size:
+            raise FramingError(f"frame body of {len(body)} bytes exceeds fixed size {self._size}")
+        return body.ljust(self._size, b"\x00")
+
+    def frame_bounds(self, buf: bytearray, start: int, end: int) -> tuple[int, int, int] | None:
+        if end - start < self._size:
+            return None
+        return start, start + self._size, start + self._size
+
+
+def create_framer(config: dict[str, Any] | None) -> Framer:
+    """Build a framer from a target `framing` block. None keeps the newline-delimited MVP format."""
+    if not config or config.get("id") is None:
+        return DelimiterFramer()
+    framing_id = str(config.get("id"))
+    max_frame = int(config.get("max_frame_bytes", DEFAULT_MAX_FRAME_BYTES))
+    if framing_id == "length-prefixed":
+        return LengthPrefixedFramer(
+            prefix_bytes=int(config.get("prefix_bytes", 4)),
+            byteorder=str(config.get("byteorder", "big")),
+            max_frame_bytes=max_frame,
+        )
+    if framing_id == "delimiter":
+        delimiter = config.get("delimiter", "\n")
+        if isinstance(delimiter, str):
+            delimiter = delimiter.encode("utf-8")
+        return DelimiterFramer(bytes(delimiter), max_frame_bytes=max_frame)
+    if framing_id == "fixed-size":
+        return FixedSizeFramer(int(config.get("size", 0)))
+    raise FramingError(f"unknown framing id {framing_id!r}; expected one of {FRAMING_IDS}")
+
+
+class StreamReassembler:
+    """Per-stream receive buffer. Allocates once; compacts unread bytes to the front only when full.
+
+    Frames returned by next_frame/read_frame are memoryview slices of the internal buffer and stay
+    valid only until the next fill; copy them (bytes(frame)) if they must outlive that.
+    """
+
+    def __init__(self, framer: Framer, capacity: int = 64 * 1024) -> None:
+        self._framer = framer
+        self._buf = bytearray(capacity)
+        self._view = memoryview(self._buf)
+        self._start = 0
+        self._end = 0
+
+    @property
+    def pending(self) -> int:
+        """Bytes received but not yet returned as a frame."""
+        return self._end - self._start
+
+    def next_frame(self) -> memoryview | None:
+        """Pop the next complete frame body from the buffer, or None if more bytes are needed."""
+        if self._start == self._end:
+            self._start = self._end = 0
+            return None
+        bounds = self._framer.frame_bounds(self._buf, self._start, self._end)
+        if bounds is None:
+            return None
+        body_start, body_end, frame_end = bounds
+        self._start = frame_end
+        return self._view[body_start:body_end]
+
+    def recv_from(self, sock: socket.socket) -> int:
+        """One recv_into the free tail of the buffer. Returns bytes read (0 means the peer closed)."""
+        self._reserve()
+        n = sock.recv_into(self._view[self._end:])
+        self._end += n
+        return n
+
+    def feed(self, data: bytes) -> None:
+        """Append bytes read elsewhere (e.g. an asyncio stream)."""
+        self._reserve(len(data))
+        self._buf[self._end:self._end + len(data)] = data
+        self._end += len(data)
+
+    def read_frame(self, sock: socket.socket) -> memoryview | None:
+        """Block (per the socket timeout) until a full frame is buffered. None on orderly peer close."""
+        while True:
+            frame = self.next_frame()
+            if frame is not None:
+                return frame
+            if self.recv_from(sock) == 0:
+                return None
+
+    def _reserve(self, need: int = 1) -> None:
+        if len(self._buf) - self._end >= need:
+            return
+        pending = self._end - self._start
+        if pending + need <= len(self._buf):
+            pending_bytes = self._view[self._start:self._end]
+            # Slice assignment copies without overlap handling, so an overlapping move goes through bytes.
+            self._buf[:pending] = pending_bytes if self._start >= pending else bytes(pending_bytes)
+        else:
+            grown = bytearray(max(len(self._buf) * 2, pending + need))
+            grown[:pending] = self._view[self._start:self._end]
+            self._buf = grown
+            self._view = memoryview(self._buf)
+        self._start, self._end = 0, pending
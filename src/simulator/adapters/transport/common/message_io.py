@@ -0,0 +1,133 @@
+"""Message bodies on the wire and the observations recorded for them.
+
+Every observation is stamped with time.perf_counter_ns() ("timestamp_ns") when the bytes leave or
+arrive (the in-memory transport passes its clock's time instead); receives paired with a request
+carry "latency_ns". observed_interactions() assigns the run-local "interaction_index".
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections.abc import Iterable
+
+from simulator.domain.models.run_models import ObservedInteractions
+from simulator.domain.models.target_and_task import MessageEnvelope
+from simulator.domain.ports.codec_port import MessageCodecPort
+from simulator.domain.services.cancellation import RunDeadline
+
+
+class _BodyMemo:
+    """
+    Encoded bodies for one codec, keyed by envelope identity (envelopes hold a dict payload, so they
+    are not hashable). Each entry holds a weak reference to its envelope and is dropped when the
+    envelope is collected, so a compiled plan's envelopes encode once and nothing outlives them.
+    """
+
+    def __init__(self) -> None:
+        self._bodies: dict[int, tuple[bytes, weakref.ref[MessageEnvelope]]] = {}
+
+    def get(self, msg: MessageEnvelope) -> bytes | None:
+        entry = self._bodies.get(id(msg))
+        return entry[0] if entry is not None and entry[1]() is msg else None
+
+    def put(self, msg: MessageEnvelope, body: bytes) -> None:
+        key = id(msg)
+        self._bodies[key] = (body, weakref.ref(msg, lambda _: self._bodies.pop(key, None)))
+
+
+# Owned by the transports, outside the domain model; a codec's memo goes when the codec does.
+_TEXT_BODIES = _BodyMemo()
+_CODEC_BODIES: weakref.WeakKeyDictionary[MessageCodecPort, _BodyMemo] = weakref.WeakKeyDictionary()
+_memo_lock = threading.Lock()
+
+
+def _memo(codec: MessageCodecPort | None) -> _BodyMemo:
+    if codec is None:
+        return _TEXT_BODIES
+    memo = _CODEC_BODIES.get(codec)
+    if memo is None:
+        with _memo_lock:
+            memo = _CODEC_BODIES.setdefault(codec, _BodyMemo())
+    return memo
+
+
+def encode_body(msg: MessageEnvelope, codec: MessageCodecPort | None) -> bytes:
+    """Frame body for msg. Without a codec, the MVP text body (str(payload)) is used.
+
+    Bodies are memoized per codec and envelope, so plan envelopes reused across runs encode once.
+    """
+    memo = _memo(codec)
+    body = memo.get(msg)
+    if body is None:
+        body = str(msg.payload).encode("utf-8") if codec is None else codec.encode(msg)
+        memo.put(msg, body)
+    return body
+
+
+def datagram_body(msg: MessageEnvelope, codec: MessageCodecPort | None) -> bytes:
+    """Datagram body: contract codec when wired, else the MVP newline-terminated text payload."""
+    if codec is None:
+        return encode_body(msg, None) + b"\n"
+    return codec.encode(msg)
+
+
+def receive_timeout_sec(msg: MessageEnvelope, default_sec: float, deadline: RunDeadline | None = None) -> float:
+    """Read deadline for a receive: its step's timeout_ms when the plan set one, else the run timeout.
+
+    With a run deadline, the wait is cut to what is left of the run's budget.
+    """
+    wait_sec = default_sec if msg.timeout_ms is None else max(0.001, msg.timeout_ms / 1000.0)
+    return wait_sec if deadline is None else deadline.timeout_sec(wait_sec)
+
+
+def run_stopped(deadline: RunDeadline | None, errors: list[str]) -> bool:
+    """True once the run is cancelled or out of budget; the reason is recorded in errors (once)."""
+    reason = deadline.stop_reason() if deadline is not None else None
+    if reason is None:
+        return False
+    if reason not in errors:
+        errors.append(reason)
+    return True
+
+
+def receive_observation(
+    frame: bytes | memoryview,
+    codec: MessageCodecPort | None,
+    expected_type: str | None = None,
+    timestamp_ns: int | None = None,
+) -> dict[str, object]:
+    """Observation for one inbound frame; typed message_type/payload when the codec recognizes it."""
+    observation: dict[str, object] = {
+        "direction": "receive",
+        "raw_len": len(frame),
+        "timestamp_ns": time.perf_counter_ns() if timestamp_ns is None else timestamp_ns,
+    }
+    if codec is not None:
+        decoded = codec.decode(frame, expected_type)
+        if decoded is not None:
+            observation["message_type"], observation["payload"] = decoded
+    return observation
+
+
+def send_observation(message_type: str, **fields: object) -> dict[str, object]:
+    """Observation for one message just written to the wire."""
+    return {"direction": "send", "message_type": message_type, "timestamp_ns": time.perf_counter_ns(), **fields}
+
+
+def stamp_latency(observation: dict[str, object], request: dict[str, object] | None) -> dict[str, object]:
+    """Set latency_ns on a receive observation from the send observation it answers (if any)."""
+    if request is not None:
+        received, sent = observation.get("timestamp_ns"), request.get("timestamp_ns")
+        if isinstance(received, int) and isinstance(sent, int):
+            observation["latency_ns"] = received - sent
+    return observation
+
+
+def observed_interactions(interactions: Iterable[dict[str, object]], errors: Iterable[str]) -> ObservedInteractions:
+    """Freeze a run's observations, numbering them in report order."""
+    ordered = tuple(interactions)
+    for index, observation in enumerate(ordered):
+        observation["interaction_index"] = index
+    return ObservedInteractions(interactions=ordered, transport_errors=tuple(errors))
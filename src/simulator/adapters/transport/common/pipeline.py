@@ -0,0 +1,134 @@
+"""Pipelined request/response correlation shared by the blocking and asyncio TCP clients."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Hashable
+from typing import Any
+
+from simulator.adapters.transport.common.message_io import receive_observation, send_observation, stamp_latency
+from simulator.adapters.transport.common.timeout_wheel import TimeoutWheel
+from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
+from simulator.domain.ports.codec_port import MessageCodecPort
+
+DEFAULT_TICK_SEC = 0.005
+
+
+def pipeline_key(target: TargetRef) -> str | None:
+    """Correlation field from target.pipeline; None means responses are matched in order (FIFO)."""
+    key = (target.pipeline or {}).get("correlation_key")
+    return str(key) if key else None
+
+
+class PipelineCorrelator:
+    """
+    Matches responses to receive steps while every send is written back-to-back.
+
+    Each receive step is paired with the closest preceding unpaired send; its correlation value is
+    that send's payload[key]. A decoded response carrying payload[key] fills the first open step with
+    the same value; responses without a usable key fill the first open step (FIFO). A step's timeout
+    starts when its paired send is written; expired steps record TRANSPORT_READ_TIMEOUT.
+    interactions() returns observations in script order regardless of arrival order.
+    """
+
+    def __init__(
+        self,
+        messages: list[MessageEnvelope],
+        codec: MessageCodecPort | None,
+        key: str | None,
+        timeout_sec: float,
+        wheel: TimeoutWheel | None = None,
+    ) -> None:
+        self._messages = messages
+        self._codec = codec
+        self._key = key
+        self._timeout_sec = timeout_sec
+        self.wheel = wheel or TimeoutWheel(tick_sec=min(DEFAULT_TICK_SEC, timeout_sec))
+        self._observed: dict[int, dict[str, object]] = {}
+        self._open: dict[int, Any] = {}  # receive step index -> correlation value
+        # Lookup queues (script order); closed steps are skipped lazily so each match is O(1) amortized.
+        self._fifo: deque[int] = deque()
+        self._by_value: dict[Hashable, deque[int]] = {}
+        self._armed_by_send: dict[int, list[int]] = {}
+        self._paired_send: dict[int, int] = {}
+        self.errors: list[str] = []
+        unpaired: list[int] = []
+        for i, msg in enumerate(messages):
+            if msg.direction == "send":
+                unpaired.append(i)
+            elif msg.direction == "receive":
+                send_index = unpaired.pop() if unpaired else None
+                value = None
+                if send_index is not None:
+                    value = messages[send_index].payload.get(key) if key else None
+                    self._armed_by_send.setdefault(send_index, []).append(i)
+                    self._paired_send[i] = send_index
+                else:
+                    self.wheel.schedule(i, timeout_sec)
+                self._open[i] = value
+                self._fifo.append(i)
+                if isinstance(value, Hashable) and value is not None:
+                    self._by_value.setdefault(value, deque()).append(i)
+
+    @property
+    def outstanding(self) -> int:
+        return len(self._open)
+
+    def on_send(self, index: int) -> None:
+        """Record the send at script index and start the timeouts of the receive steps it answers."""
+        msg = self._messages[index]
+        self._observed[index] = send_observation(msg.message_type)
+        for receive_index in self._armed_by_send.get(index, ()):
+            if receive_index in self._open:
+                self.wheel.schedule(receive_index, self._timeout_sec)
+
+    def on_frame(self, frame: bytes | memoryview) -> None:
+        """Correlate one inbound frame to an open receive step."""
+        observation = receive_observation(frame, self._codec, None)
+        payload = observation.get("payload")
+        value = payload.get(self._key) if self._key and isinstance(payload, dict) else None
+        if value is None:
+            match = self._first_open(self._fifo)
+        else:
+            match = self._first_open(self._by_value.get(value) if isinstance(value, Hashable) else None)
+        if match is None:
+            self.errors.append(f"TRANSPORT_UNCORRELATED_RESPONSE:{value!r}")
+            return
+        expected = self._messages[match].message_type
+        if self._codec is not None and "message_type" not in observation:
+            decoded = self._codec.decode(frame, expected)
+            if decoded is not None:
+                observation["message_type"], observation["payload"] = decoded
+        if "message_type" in observation and value is not None:
+            observation["correlation"] = value
+        del self._open[match]
+        self.wheel.cancel(match)
+        send_index = self._paired_send.get(match)
+        request = self._observed.get(send_index) if send_index is not None else None
+        self._observed[match] = stamp_latency(observation, request)
+
+    def _first_open(self, queue: deque[int] | None) -> int | None:
+        while queue:
+            if queue[0] in self._open:
+                return queue.popleft()
+            queue.popleft()
+        return None
+
+    def expire(self) -> None:
+        """Time out open steps whose deadline passed."""
+        for index in self.wheel.advance():
+            if self._open.pop(index, _MISSING) is not _MISSING:
+                self.errors.append("TRANSPORT_READ_TIMEOUT")
+
+    def abandon(self) -> None:
+        """Connection closed or failed: every open step times out."""
+        for index in list(self._open):
+            self.wheel.cancel(index)
+            self.errors.append("TRANSPORT_READ_TIMEOUT")
+        self._open.clear()
+
+    def interactions(self) -> list[dict[str, object]]:
+        return [self._observed[i] for i in sorted(self._observed)]
+
+
+_MISSING = object()
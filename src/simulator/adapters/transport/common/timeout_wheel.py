@@ -0,0 +1,75 @@
+"""Hashed timing wheel: O(1) schedule/cancel for many outstanding request timeouts."""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable, Hashable
+
+
+class TimeoutWheel:
+    """
+    Timeouts bucketed by tick on a ring of slots. advance() walks the ticks elapsed since the last
+    call and returns the keys whose timeout has passed; resolution is one tick (expiry may be up to
+    one tick late, never early).
+    """
+
+    def __init__(
+        self, tick_sec: float = 0.01, slots: int = 512, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if tick_sec <= 0 or slots < 1:
+            raise ValueError("tick_sec must be > 0 and slots >= 1")
+        self._tick = tick_sec
+        self._clock = clock
+        self._buckets: list[dict[Hashable, int]] = [{} for _ in range(slots)]
+        self._where: dict[Hashable, int] = {}
+        self._origin = clock()
+        self._cursor = 0  # ticks processed since origin
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where
+
+    def schedule(self, key: Hashable, timeout_sec: float) -> None:
+        """Expire key after timeout_sec (replaces any pending timeout for the same key)."""
+        self.cancel(key)
+        now_tick = int((self._clock() - self._origin) / self._tick)
+        # +1: the current tick is partly elapsed, so rounding down could expire early.
+        due = max(now_tick, self._cursor) + max(1, math.ceil(timeout_sec / self._tick)) + 1
+        ticks_ahead = due - self._cursor
+        slot = due % len(self._buckets)
+        self._buckets[slot][key] = (ticks_ahead - 1) // len(self._buckets)
+        self._where[key] = slot
+
+    def cancel(self, key: Hashable) -> bool:
+        slot = self._where.pop(key, None)
+        if slot is None:
+            return False
+        del self._buckets[slot][key]
+        return True
+
+    def advance(self) -> list[Hashable]:
+        """Keys whose timeout elapsed since the last advance, in expiry order."""
+        target = int((self._clock() - self._origin) / self._tick)
+        expired: list[Hashable] = []
+        if not self._where:
+            self._cursor = max(self._cursor, target)
+            return expired
+        while self._cursor < target:
+            self._cursor += 1
+            bucket = self._buckets[self._cursor % len(self._buckets)]
+            for key, rounds in list(bucket.items()):
+                if rounds == 0:
+                    del bucket[key]
+                    del self._where[key]
+                    expired.append(key)
+                else:
+                    bucket[key] = rounds - 1
+        return expired
+
+    def next_tick_in(self) -> float:
+        """Seconds until the next tick boundary (a suitable poll interval)."""
+        elapsed = self._clock() - self._origin
+        return max(0.0, (int(elapsed / self._tick) + 1) * self._tick - elapsed)
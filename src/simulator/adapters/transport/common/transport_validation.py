@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from simulator.adapters.transport.common.endpoint_parser import parse_endpoint
+from simulator.adapters.transport.common.framing import FramingError, create_framer
 
-VALID_PROTOCOLS = ("tcp", "udp")
+VALID_PROTOCOLS = ("tcp", "udp", "mem")
 VALID_MODES = ("client", "server")
 TIMEOUT_MS_MIN, TIMEOUT_MS_MAX = 100, 120_000
 
@@ -15,6 +18,7 @@ def validate_transport_config(
     local_endpoint: str = "",
     remote_endpoint: str = "",
     timeout_ms: int = 5000,
+    framing: dict[str, Any] | None = None,
 ) -> list[str]:
     """Return deterministic error codes for invalid config."""
     errors: list[str] = []
@@ -32,4 +36,9 @@ def validate_transport_config(
         errors.append("SRS-E-TRN-001")
     if not (TIMEOUT_MS_MIN <= timeout_ms <= TIMEOUT_MS_MAX):
         errors.append("SRS-E-TRN-001")
+    if framing is not None:
+        try:
+            create_framer(framing)
+        except (FramingError, TypeError, ValueError):
+            errors.append("SRS-E-TRN-001")
     return errors
@@ -1,32 +1,83 @@
-"""Composite transport: dispatches to TCP or UDP adapter by protocol."""
+"""Composite transport: dispatches to TCP, UDP or in-memory adapter by protocol."""
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
+from simulator.adapters.transport.memory.adapter import MemoryTransportAdapter
 from simulator.adapters.transport.tcp.adapter import TcpTransportAdapter
+from simulator.adapters.transport.tcp.async_adapter import AsyncTcpTransportAdapter
+from simulator.adapters.transport.tcp.connection_pool import TcpConnectionPool
 from simulator.adapters.transport.udp.adapter import UdpTransportAdapter
+from simulator.adapters.transport.udp.async_adapter import AsyncUdpTransportAdapter
 from simulator.domain.models.run_models import ObservedInteractions
 from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
+from simulator.domain.ports.codec_port import MessageCodecPort
+from simulator.domain.services.cancellation import RunDeadline
 
 
 class CompositeTransportAdapter:
-    """Implements TransportPort by delegating to TCP or UDP per protocol."""
+    """Implements TransportPort by delegating to TCP, UDP or mem per protocol (blocking and asyncio variants)."""
 
-    def __init__(self) -> None:
-        self._tcp = TcpTransportAdapter()
-        self._udp = UdpTransportAdapter()
+    def __init__(
+        self,
+        tcp_pool: TcpConnectionPool | None = None,
+        codec: MessageCodecPort | None = None,
+        memory: MemoryTransportAdapter | None = None,
+    ) -> None:
+        self._tcp = TcpTransportAdapter(pool=tcp_pool, codec=codec)
+        self._udp = UdpTransportAdapter(codec=codec)
+        self._async_tcp = AsyncTcpTransportAdapter(codec=codec)
+        self._async_udp = AsyncUdpTransportAdapter(codec=codec)
+        self._memory = memory or MemoryTransportAdapter(codec=codec)
 
     def execute(
         self,
         *,
         target: TargetRef,
         protocol: str,
-        messages: list[MessageEnvelope],
+        messages: Iterable[MessageEnvelope],
+        timeout_ms: int,
+        deadline: RunDeadline | None = None,
+    ) -> ObservedInteractions:
+        if protocol.lower() == "tcp":
+            return self._tcp.execute(
+                target=target, protocol=protocol, messages=messages, timeout_ms=timeout_ms, deadline=deadline
+            )
+        if protocol.lower() == "udp":
+            return self._udp.execute(
+                target=target, protocol=protocol, messages=messages, timeout_ms=timeout_ms, deadline=deadline
+            )
+        if protocol.lower() == "mem":
+            return self._memory.execute(
+                target=target, protocol=protocol, messages=messages, timeout_ms=timeout_ms, deadline=deadline
+            )
+        return ObservedInteractions(
+            interactions=(),
+            transport_errors=(f"Unsupported protocol {protocol!r}",),
+        )
+
+    async def execute_async(
+        self,
+        *,
+        target: TargetRef,
+        protocol: str,
+        messages: Iterable[MessageEnvelope],
         timeout_ms: int,
+        deadline: RunDeadline | None = None,
     ) -> ObservedInteractions:
         if protocol.lower() == "tcp":
-            return self._tcp.execute(target=target, protocol=protocol, messages=messages, timeout_ms=timeout_ms)
+            return await self._async_tcp.execute_async(
+                target=target, protocol=protocol, messages=messages, timeout_ms=timeout_ms, deadline=deadline
+            )
         if protocol.lower() == "udp":
-            return self._udp.execute(target=target, protocol=protocol, messages=messages, timeout_ms=timeout_ms)
+            return await self._async_udp.execute_async(
+                target=target, protocol=protocol, messages=messages, timeout_ms=timeout_ms, deadline=deadline
+            )
+        if protocol.lower() == "mem":
+            return await self._memory.execute_async(
+                target=target, protocol=protocol, messages=messages, timeout_ms=timeout_ms, deadline=deadline
+            )
         return ObservedInteractions(
             interactions=(),
             transport_errors=(f"Unsupported protocol {protocol!r}",),
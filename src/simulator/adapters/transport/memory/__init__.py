@@ -0,0 +1,6 @@
+"""In-memory transport adapter (in-process peer, virtual-time friendly)."""
+
+from simulator.adapters.transport.memory.adapter import MemoryTransportAdapter
+from simulator.adapters.transport.memory.responder import ScriptedResponder
+
+__all__ = ["MemoryTransportAdapter", "ScriptedResponder"]
@@ -0,0 +1,137 @@
+"""In-memory transport adapter: an in-process peer on a ClockPort. Implements TransportPort."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Generator, Iterable
+
+from simulator.adapters.transport.common.message_io import (
+    encode_body,
+    observed_interactions,
+    receive_observation,
+    receive_timeout_sec,
+    run_stopped,
+    send_observation,
+    stamp_latency,
+)
+from simulator.adapters.transport.memory.responder import ScriptedResponder
+from simulator.domain.models.run_models import ObservedInteractions
+from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
+from simulator.domain.ports.clock_port import ClockPort
+from simulator.domain.ports.codec_port import MessageCodecPort
+from simulator.domain.services.cancellation import RunDeadline
+from simulator.domain.services.clock import SystemClock, VirtualClock
+
+# Answers one receive step: the envelope the peer sends for it, or None to stay silent (read timeout).
+Responder = Callable[[MessageEnvelope], MessageEnvelope | None]
+
+
+class MemoryTransportAdapter:
+    """
+    Protocol "mem": the script runs against a peer in the same process, with no sockets. Sends are
+    encoded and recorded; each receive step asks responder (default: a ScriptedResponder that sends
+    the expected message) for the peer's message, which arrives latency_ms after the request. A
+    silent peer, or one slower than the step's deadline, costs the full deadline and records
+    TRANSPORT_READ_TIMEOUT. All waiting is clock.sleep() and every timestamp is clock.now_ns(), so
+    on a VirtualClock a run with hours of timeouts completes at once and reproduces the same
+    observations every time.
+
+    Frames are handed over without copies: the peer's body is the one memoized for its reply
+    envelope, and the codec decodes a memoryview of it. With the default latency of 0, a run
+    measures RunWorkflow itself (planning, encoding, verification) with the kernel out of the way.
+    execute_async() waits with asyncio.sleep on a real clock, so concurrent runs share the loop.
+    """
+
+    def __init__(
+        self,
+        clock: ClockPort | None = None,
+        responder: Responder | None = None,
+        latency_ms: float = 0.0,
+        codec: MessageCodecPort | None = None,
+    ) -> None:
+        self._clock = clock or SystemClock()
+        self._responder = responder or ScriptedResponder()
+        self._latency_sec = max(0.0, latency_ms / 1000.0)
+        self._codec = codec
+
+    def execute(
+        self,
+        *,
+        target: TargetRef,
+        protocol: str,
+        messages: Iterable[MessageEnvelope],
+        timeout_ms: int,
+        deadline: RunDeadline | None = None,
+    ) -> ObservedInteractions:
+        exchange = self._exchange(protocol, messages, timeout_ms, deadline)
+        try:
+            while True:
+                self._clock.sleep(next(exchange))
+        except StopIteration as done:
+            return done.value
+
+    async def execute_async(
+        self,
+        *,
+        target: TargetRef,
+        protocol: str,
+        messages: Iterable[MessageEnvelope],
+        timeout_ms: int,
+        deadline: RunDeadline | None = None,
+    ) -> ObservedInteractions:
+        """Same exchange as execute(); on a real clock the waits are asyncio.sleep, so they yield the loop."""
+        exchange = self._exchange(protocol, messages, timeout_ms, deadline)
+        virtual = isinstance(self._clock, VirtualClock)
+        try:
+            while True:
+                wait_sec = next(exchange)
+                if virtual:
+                    self._clock.sleep(wait_sec)
+                elif wait_sec > 0:
+                    await asyncio.sleep(wait_sec)
+        except StopIteration as done:
+            return done.value
+
+    def _exchange(
+        self,
+        protocol: str,
+        messages: Iterable[MessageEnvelope],
+        timeout_ms: int,
+        deadline: RunDeadline | None,
+    ) -> Generator[float, None, ObservedInteractions]:
+        """Plays the script, yielding each wait (seconds) for the caller to sleep through."""
+        if protocol.lower() != "mem":
+            return ObservedInteractions(
+                interactions=(),
+                transport_errors=(f"Memory adapter does not support protocol {protocol!r}",),
+            )
+        timeout_sec = max(0.001, timeout_ms / 1000.0)
+        clock = self._clock
+        interactions: list[dict[str, object]] = []
+        errors: list[str] = []
+        request: dict[str, object] | None = None
+        try:
+            for msg in messages:
+                if run_stopped(deadline, errors):
+                    break
+                if msg.direction == "send":
+                    encode_body(msg, self._codec)
+                    request = send_observation(msg.message_type, timestamp_ns=clock.now_ns())
+                    interactions.append(request)
+                elif msg.direction == "receive":
+                    wait_sec = receive_timeout_sec(msg, timeout_sec, deadline)
+                    reply = self._responder(msg)
+                    if reply is None or self._latency_sec > wait_sec:
+                        yield wait_sec
+                        errors.append("TRANSPORT_READ_TIMEOUT")
+                        continue
+                    yield self._latency_sec
+                    frame = memoryview(encode_body(reply, self._codec))
+                    observation = receive_observation(frame, self._codec, msg.message_type, clock.now_ns())
+                    if self._codec is None:  # handed over in-process, so the type is known without a codec
+                        observation["message_type"], observation["payload"] = reply.message_type, reply.payload
+                    interactions.append(stamp_latency(observation, request))
+                    request = None
+        except ValueError as e:
+            errors.append(f"CODEC_ENCODE_FAILED:{e!s}")
+        return observed_interactions(interactions, errors)
@@ -0,0 +1,21 @@
+"""Scripted peer for the in-memory transport."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from simulator.domain.models.target_and_task import MessageEnvelope
+
+
+class ScriptedResponder:
+    """
+    replies[message_type] is what the peer sends when a receive step expects message_type (None:
+    it stays silent); other receive steps get the expected envelope back. Reply envelopes are
+    reused by every run, so the transport encodes each one once and hands out views of that body.
+    """
+
+    def __init__(self, replies: Mapping[str, MessageEnvelope | None] | None = None) -> None:
+        self._replies = dict(replies or {})
+
+    def __call__(self, expected: MessageEnvelope) -> MessageEnvelope | None:
+        return self._replies.get(expected.message_type, expected)
@@ -2,105 +2,259 @@
 
 from __future__ import annotations
 
+import selectors
 import socket
+import threading
+from collections.abc import Iterable
+from contextlib import AbstractContextManager, nullcontext
 from typing import TYPE_CHECKING
 
+from simulator.adapters.transport.common.framing import (
+    Framer,
+    FramingError,
+    StreamReassembler,
+    create_framer,
+)
+from simulator.adapters.transport.common.message_io import (
+    encode_body,
+    observed_interactions,
+    receive_observation,
+    receive_timeout_sec,
+    run_stopped,
+    send_observation,
+    stamp_latency,
+)
+from simulator.adapters.transport.common.pipeline import PipelineCorrelator, pipeline_key
+from simulator.adapters.transport.tcp.connection_pool import PoolExhaustedError, TcpConnectionPool
+from simulator.adapters.transport.tcp.server_engine import TcpServerEngine
 from simulator.domain.models.run_models import ObservedInteractions
 from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
 
 if TYPE_CHECKING:
-    pass
+    from simulator.domain.ports.codec_port import MessageCodecPort
+    from simulator.domain.services.cancellation import RunDeadline
 
 
-def _serialize_message(msg: MessageEnvelope) -> bytes:
-    """MVP: simple newline-terminated JSON-like payload for smoke tests."""
-    body = str(msg.payload)
-    return (body + "\n").encode("utf-8")
+def _wake_on_cancel(deadline: "RunDeadline | None", sock: socket.socket) -> AbstractContextManager[object]:
+    """While the exchange runs, a cancel shuts the socket down, so a blocked recv returns at once."""
+    if deadline is None:
+        return nullcontext()
+    return deadline.token.on_cancel(lambda: sock.shutdown(socket.SHUT_RDWR))
+
+
+def _play_script(
+    sock: socket.socket,
+    messages: Iterable[MessageEnvelope],
+    framer: Framer,
+    codec: "MessageCodecPort | None",
+    reassembler: StreamReassembler,
+    interactions: list[dict[str, object]],
+    errors: list[str],
+    timeout_sec: float,
+    deadline: "RunDeadline | None" = None,
+) -> bool:
+    """Send/receive messages in order over one connection. Returns False if the peer closed the stream."""
+    request: dict[str, object] | None = None
+    for msg in messages:
+        if run_stopped(deadline, errors):
+            return True
+        if msg.direction == "send":
+            sock.sendall(framer.encode(encode_body(msg, codec)))
+            request = send_observation(msg.message_type)
+            interactions.append(request)
+        elif msg.direction == "receive":
+            sock.settimeout(receive_timeout_sec(msg, timeout_sec, deadline))
+            try:
+                frame = reassembler.read_frame(sock)
+            except socket.timeout:
+                errors.append("TRANSPORT_READ_TIMEOUT")
+                continue
+            if frame is None:
+                return False
+            interactions.append(stamp_latency(receive_observation(frame, codec, msg.message_type), request))
+            request = None
+    return True
+
+
+def _play_pipelined(
+    sock: socket.socket,
+    messages: list[MessageEnvelope],
+    framer: Framer,
+    codec: "MessageCodecPort | None",
+    reassembler: StreamReassembler,
+    correlator: PipelineCorrelator,
+    deadline: "RunDeadline | None" = None,
+) -> bool:
+    """Write every send back-to-back while a reader thread correlates responses. False if the peer closed."""
+    lock = threading.Lock()
+    stop = threading.Event()
+    outcome: dict[str, object] = {"open": True}
+
+    def read() -> None:
+        # A selector rather than select.select: a load-test process routinely holds fds past FD_SETSIZE.
+        sel = selectors.DefaultSelector()
+        try:
+            sel.register(sock, selectors.EVENT_READ)
+            while not stop.is_set():
+                with lock:
+                    correlator.expire()
+                    if not correlator.outstanding:
+                        return
+                    frame = reassembler.next_frame()
+                    if frame is not None:
+                        correlator.on_frame(frame)
+                        continue
+                    poll = correlator.wheel.next_tick_in()
+                if sel.select(poll) and reassembler.recv_from(sock) == 0:
+                    outcome["open"] = False
+                    return
+        except Exception as e:  # reported by the writer thread; a dead reader must not strand requests
+            outcome["error"] = e
+        finally:
+            sel.close()
+
+    reader = threading.Thread(target=read, name="tcp-pipeline-reader", daemon=True)
+    reader.start()
+    try:
+        for i, msg in enumerate(messages):
+            if run_stopped(deadline, correlator.errors):
+                stop.set()
+                break
+            if msg.direction == "send":
+                sock.sendall(framer.encode(encode_body(msg, codec)))
+                with lock:
+                    correlator.on_send(i)
+    except BaseException:
+        stop.set()
+        raise
+    finally:
+        reader.join()
+        with lock:
+            correlator.abandon()
+    error = outcome.get("error")
+    if isinstance(error, (FramingError, OSError)):
+        raise error
+    if isinstance(error, Exception):
+        correlator.errors.append(f"TRANSPORT_ERROR:{error!s}")
+        return False
+    return bool(outcome["open"])
 
 
 class TcpTransportAdapter:
-    """TCP client and server. Client: connect, send, receive. Server: bind, accept, recv, send."""
+    """TCP client and server. Client: connect, send, receive. Server: TcpServerEngine (many concurrent clients).
+
+    Inbound bytes are reassembled into frames per the target's framing config, so split or coalesced
+    segments still yield one observation per message. Bodies are encoded/decoded by the contract
+    codec when one is wired. With a pool, client runs check out a warm connection per target
+    instead of connecting each time. With target.pipeline set, client sends are written
+    back-to-back and responses are correlated by key (see PipelineCorrelator).
+    """
+
+    def __init__(
+        self, pool: TcpConnectionPool | None = None, codec: "MessageCodecPort | None" = None
+    ) -> None:
+        self._pool = pool
+        self._codec = codec
 
     def execute(
         self,
         *,
         target: TargetRef,
         protocol: str,
-        messages: list[MessageEnvelope],
+        messages: Iterable[MessageEnvelope],
         timeout_ms: int,
+        deadline: "RunDeadline | None" = None,
     ) -> ObservedInteractions:
         if protocol.lower() != "tcp":
             return ObservedInteractions(
                 interactions=(),
                 transport_errors=(f"TCP adapter does not support protocol {protocol!r}",),
             )
+        try:
+            framer = create_framer(target.framing)
+        except (FramingError, TypeError, ValueError) as e:
+            return ObservedInteractions(interactions=(), transport_errors=(f"TRANSPORT_FRAMING_INVALID:{e!s}",))
         timeout_sec = max(0.001, timeout_ms / 1000.0)
+        if deadline is not None:
+            timeout_sec = deadline.timeout_sec(timeout_sec)
         if target.mode == "server":
-            return self._run_server(target, messages, timeout_sec)
-        return self._run_client(target, messages, timeout_sec)
+            return self._run_server(target, list(messages), timeout_sec, framer, deadline)
+        return self._run_client(target, messages, timeout_sec, framer, deadline)
 
     def _run_client(
-        self, target: TargetRef, messages: list[MessageEnvelope], timeout_sec: float
+        self,
+        target: TargetRef,
+        messages: Iterable[MessageEnvelope],
+        timeout_sec: float,
+        framer: Framer,
+        deadline: "RunDeadline | None",
     ) -> ObservedInteractions:
         interactions: list[dict[str, object]] = []
         errors: list[str] = []
+        sock: socket.socket | None = None
+        reusable = False
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            if run_stopped(deadline, errors):
+                return observed_interactions(interactions, errors)
+            sock = self._connect(target, timeout_sec)
             sock.settimeout(timeout_sec)
-            sock.connect((target.host, target.port))
-            for msg in messages:
-                if msg.direction == "send":
-                    data = _serialize_message(msg)
-                    sock.sendall(data)
-                    interactions.append({"direction": "send", "message_type": msg.message_type})
-                elif msg.direction == "receive":
+            reassembler = StreamReassembler(framer)
+            with _wake_on_cancel(deadline, sock):
+                if target.pipeline is not None:
+                    script = list(messages)  # responses are correlated by script position
+                    correlator = PipelineCorrelator(script, self._codec, pipeline_key(target), timeout_sec)
                     try:
-                        buf = sock.recv(4096)
-                        if buf:
-                            interactions.append({"direction": "receive", "raw_len": len(buf)})
-                    except socket.timeout:
-                        errors.append("TRANSPORT_READ_TIMEOUT")
-            sock.close()
+                        still_open = _play_pipelined(
+                            sock, script, framer, self._codec, reassembler, correlator, deadline
+                        )
+                    finally:
+                        interactions.extend(correlator.interactions())
+                        errors.extend(correlator.errors)
+                else:
+                    still_open = _play_script(
+                        sock, messages, framer, self._codec, reassembler, interactions, errors, timeout_sec, deadline
+                    )
+            # A late or unread reply would be misread by the next run on this connection.
+            reusable = still_open and not errors and reassembler.pending == 0
+        except PoolExhaustedError:
+            errors.append("TRANSPORT_POOL_EXHAUSTED")
+        except FramingError as e:
+            errors.append(f"TRANSPORT_PROTOCOL_ERROR:{e!s}")
+        except ValueError as e:
+            errors.append(f"CODEC_ENCODE_FAILED:{e!s}")
         except socket.timeout:
             errors.append("TRANSPORT_CONNECT_TIMEOUT")
         except ConnectionRefusedError:
             errors.append("TRANSPORT_CONNECTION_REFUSED")
         except OSError as e:
             errors.append(f"TRANSPORT_ERROR:{e!s}")
-        return ObservedInteractions(
-            interactions=tuple(interactions),
-            transport_errors=tuple(errors),
-        )
+        finally:
+            run_stopped(deadline, errors)  # a cancel that woke a blocked recv surfaces as a closed stream
+            if sock is not None:
+                if self._pool is not None:
+                    self._pool.release(target, sock, reusable=reusable)
+                else:
+                    sock.close()
+        return observed_interactions(interactions, errors)
+
+    def _connect(self, target: TargetRef, timeout_sec: float) -> socket.socket:
+        if self._pool is not None:
+            return self._pool.acquire(target, timeout_sec)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(timeout_sec)
+        try:
+            sock.connect((target.host, target.port))
+        except OSError:
+            sock.close()
+            raise
+        return sock
 
     def _run_server(
-        self, target: TargetRef, messages: list[MessageEnvelope], timeout_sec: float
+        self,
+        target: TargetRef,
+        messages: list[MessageEnvelope],
+        timeout_sec: float,
+        framer: Framer,
+        deadline: "RunDeadline | None",
     ) -> ObservedInteractions:
-        interactions: list[dict[str, object]] = []
-        errors: list[str] = []
-        try:
-            server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            server.settimeout(timeout_sec)
-            server.bind((target.host, target.port))
-            server.listen(1)
-            conn, _ = server.accept()
-            conn.settimeout(timeout_sec)
-            for msg in messages:
-                if msg.direction == "send":
-                    conn.sendall(_serialize_message(msg))
-                    interactions.append({"direction": "send", "message_type": msg.message_type})
-                elif msg.direction == "receive":
-                    try:
-                        buf = conn.recv(4096)
-                        if buf:
-                            interactions.append({"direction": "receive", "raw_len": len(buf)})
-                    except socket.timeout:
-                        errors.append("TRANSPORT_READ_TIMEOUT")
-            conn.close()
-            server.close()
-        except (socket.timeout, OSError) as e:
-            errors.append(f"TRANSPORT_ERROR:{e!s}")
-        return ObservedInteractions(
-            interactions=tuple(interactions),
-            transport_errors=tuple(errors),
-        )
+        return TcpServerEngine(framer, self._codec).serve(target, messages, timeout_sec, deadline)
@@ -0,0 +1,255 @@
+"""Asyncio TCP transport adapter (client and server). Implements TransportPort.execute_async."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from contextlib import AbstractContextManager, nullcontext
+
+from simulator.adapters.transport.common.framing import (
+    Framer,
+    FramingError,
+    StreamReassembler,
+    create_framer,
+)
+from simulator.adapters.transport.common.message_io import (
+    encode_body,
+    observed_interactions,
+    receive_observation,
+    receive_timeout_sec,
+    run_stopped,
+    send_observation,
+    stamp_latency,
+)
+from simulator.adapters.transport.common.pipeline import PipelineCorrelator, pipeline_key
+from simulator.adapters.transport.tcp.server_engine import TcpServerEngine
+from simulator.domain.models.run_models import ObservedInteractions
+from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
+from simulator.domain.ports.codec_port import MessageCodecPort
+from simulator.domain.services.cancellation import RunDeadline
+
+
+def _wake_on_cancel(deadline: RunDeadline | None, writer: asyncio.StreamWriter) -> AbstractContextManager[object]:
+    """While the exchange runs, a cancel (from any thread) aborts the connection so a pending read returns."""
+    if deadline is None:
+        return nullcontext()
+    loop = asyncio.get_running_loop()
+    return deadline.token.on_cancel(lambda: loop.call_soon_threadsafe(writer.transport.abort))
+
+
+class AsyncTcpTransportAdapter:
+    """TCP client and server for the running event loop.
+
+    Client I/O runs on the loop, so no thread blocks on it. Server mode runs the blocking adapter's
+    TcpServerEngine on a worker thread, so both adapters serve clients the same way.
+    """
+
+    def __init__(self, codec: MessageCodecPort | None = None) -> None:
+        self._codec = codec
+
+    async def execute_async(
+        self,
+        *,
+        target: TargetRef,
+        protocol: str,
+        messages: Iterable[MessageEnvelope],
+        timeout_ms: int,
+        deadline: RunDeadline | None = None,
+    ) -> ObservedInteractions:
+        if protocol.lower() != "tcp":
+            return ObservedInteractions(
+                interactions=(),
+                transport_errors=(f"TCP adapter does not support protocol {protocol!r}",),
+            )
+        try:
+            framer = create_framer(target.framing)
+        except (FramingError, TypeError, ValueError) as e:
+            return ObservedInteractions(interactions=(), transport_errors=(f"TRANSPORT_FRAMING_INVALID:{e!s}",))
+        timeout_sec = max(0.001, timeout_ms / 1000.0)
+        if deadline is not None:
+            timeout_sec = deadline.timeout_sec(timeout_sec)
+        if target.mode == "server":
+            return await self._run_server(target, list(messages), timeout_sec, framer, deadline)
+        return await self._run_client(target, messages, timeout_sec, framer, deadline)
+
+    async def _run_client(
+        self,
+        target: TargetRef,
+        messages: Iterable[MessageEnvelope],
+        timeout_sec: float,
+        framer: Framer,
+        deadline: RunDeadline | None,
+    ) -> ObservedInteractions:
+        interactions: list[dict[str, object]] = []
+        errors: list[str] = []
+        if run_stopped(deadline, errors):
+            return observed_interactions(interactions, errors)
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(target.host, target.port), timeout_sec
+            )
+        except asyncio.TimeoutError:
+            return ObservedInteractions(interactions=(), transport_errors=("TRANSPORT_CONNECT_TIMEOUT",))
+        except ConnectionRefusedError:
+            return ObservedInteractions(interactions=(), transport_errors=("TRANSPORT_CONNECTION_REFUSED",))
+        except OSError as e:
+            return ObservedInteractions(interactions=(), transport_errors=(f"TRANSPORT_ERROR:{e!s}",))
+        correlator = None
+        if target.pipeline is not None:
+            messages = list(messages)  # responses are correlated by script position
+            correlator = PipelineCorrelator(messages, self._codec, pipeline_key(target), timeout_sec)
+        try:
+            with _wake_on_cancel(deadline, writer):
+                if correlator is not None:
+                    await _exchange_pipelined(
+                        reader, writer, messages, timeout_sec, framer, self._codec, correlator, deadline
+                    )
+                else:
+                    await _exchange(
+                        reader, writer, messages, timeout_sec, framer, self._codec, interactions, errors, deadline
+                    )
+        except FramingError as e:
+            errors.append(f"TRANSPORT_PROTOCOL_ERROR:{e!s}")
+        except ValueError as e:
+            errors.append(f"CODEC_ENCODE_FAILED:{e!s}")
+        except OSError as e:
+            errors.append(f"TRANSPORT_ERROR:{e!s}")
+        finally:
+            await _close(writer)
+            if correlator is not None:
+                correlator.abandon()
+                interactions.extend(correlator.interactions())
+                errors[:0] = correlator.errors
+            run_stopped(deadline, errors)  # a cancel that aborted a pending read surfaces as a closed stream
+        return observed_interactions(interactions, errors)
+
+    async def _run_server(
+        self,
+        target: TargetRef,
+        messages: list[MessageEnvelope],
+        timeout_sec: float,
+        framer: Framer,
+        deadline: RunDeadline | None,
+    ) -> ObservedInteractions:
+        # Same engine as the blocking adapter (backlog, max_connections, concurrent clients); a worker
+        # thread keeps the event loop free.
+        engine = TcpServerEngine(framer, self._codec)
+        return await asyncio.to_thread(engine.serve, target, messages, timeout_sec, deadline)
+
+
+async def _exchange(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    messages: Iterable[MessageEnvelope],
+    timeout_sec: float,
+    framer: Framer,
+    codec: MessageCodecPort | None,
+    interactions: list[dict[str, object]],
+    errors: list[str],
+    deadline: RunDeadline | None = None,
+) -> None:
+    """Play the message script over one stream; same framing and observation shape as the blocking adapter."""
+    reassembler = StreamReassembler(framer)
+    request: dict[str, object] | None = None
+    for msg in messages:
+        if run_stopped(deadline, errors):
+            return
+        if msg.direction == "send":
+            writer.write(framer.encode(encode_body(msg, codec)))
+            try:
+                await asyncio.wait_for(writer.drain(), timeout_sec)
+            except asyncio.TimeoutError:
+                errors.append("TRANSPORT_WRITE_TIMEOUT")
+                return
+            request = send_observation(msg.message_type)
+            interactions.append(request)
+        elif msg.direction == "receive":
+            try:
+                frame = await asyncio.wait_for(
+                    _read_frame(reader, reassembler), receive_timeout_sec(msg, timeout_sec, deadline)
+                )
+            except asyncio.TimeoutError:
+                errors.append("TRANSPORT_READ_TIMEOUT")
+                continue
+            if frame is None:
+                return
+            interactions.append(stamp_latency(receive_observation(frame, codec, msg.message_type), request))
+            request = None
+
+
+async def _exchange_pipelined(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    messages: list[MessageEnvelope],
+    timeout_sec: float,
+    framer: Framer,
+    codec: MessageCodecPort | None,
+    correlator: PipelineCorrelator,
+    deadline: RunDeadline | None = None,
+) -> None:
+    """Write every send back-to-back while a reader task correlates responses (see PipelineCorrelator).
+
+    Sends stop, and the reader stops waiting, once the run deadline is spent or the run is cancelled.
+    """
+    reassembler = StreamReassembler(framer)
+
+    async def read() -> None:
+        while correlator.outstanding:
+            if run_stopped(deadline, correlator.errors):
+                return
+            frame = reassembler.next_frame()
+            if frame is not None:
+                correlator.on_frame(frame)
+                continue
+            poll = correlator.wheel.next_tick_in() or 0.001
+            if deadline is not None:
+                poll = deadline.timeout_sec(poll)
+            try:
+                chunk = await asyncio.wait_for(reader.read(64 * 1024), poll)
+            except asyncio.TimeoutError:
+                correlator.expire()
+                continue
+            if not chunk:
+                return
+            reassembler.feed(chunk)
+            correlator.expire()
+
+    read_task = asyncio.create_task(read())
+    try:
+        for i, msg in enumerate(messages):
+            if run_stopped(deadline, correlator.errors):
+                break
+            if msg.direction == "send":
+                writer.write(framer.encode(encode_body(msg, codec)))
+                correlator.on_send(i)
+                # Returns at once below the write buffer's high-water mark; no round trip is awaited.
+                await asyncio.wait_for(writer.drain(), timeout_sec)
+        await read_task
+    except asyncio.TimeoutError:
+        correlator.errors.append("TRANSPORT_WRITE_TIMEOUT")
+    finally:
+        if not read_task.done():
+            read_task.cancel()
+            try:
+                await read_task
+            except asyncio.CancelledError:
+                pass
+
+
+async def _read_frame(reader: asyncio.StreamReader, reassembler: StreamReassembler) -> memoryview | None:
+    while True:
+        frame = reassembler.next_frame()
+        if frame is not None:
+            return frame
+        chunk = await reader.read(64 * 1024)
+        if not chunk:
+            return None
+        reassembler.feed(chunk)
+
+
+async def _close(writer: asyncio.StreamWriter) -> None:
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
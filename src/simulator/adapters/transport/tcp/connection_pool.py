@@ -0,0 +1,154 @@
+"""Bounded TCP client connection pool keyed by (host, port, mode)."""
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable
+
+from simulator.domain.models.target_and_task import TargetRef
+
+PoolKey = tuple[str, int, str]
+
+
+class PoolExhaustedError(OSError):
+    """No connection became available for a target within the checkout timeout."""
+
+
+def pool_key(target: TargetRef) -> PoolKey:
+    return (target.host, target.port, target.mode)
+
+
+def _is_healthy(sock: socket.socket) -> bool:
+    """Non-blocking peek: healthy only if the peer has neither closed nor left unread bytes."""
+    try:
+        sock.setblocking(False)
+        data = sock.recv(1, socket.MSG_PEEK)
+    except BlockingIOError:
+        return True
+    except OSError:
+        return False
+    finally:
+        try:
+            sock.setblocking(True)
+        except OSError:
+            pass
+    return False
+
+
+@dataclass
+class _Slot:
+    """Per-key state: idle connections (most recently used last) and checked-out count."""
+
+    idle: deque[tuple[socket.socket, float]] = field(default_factory=deque)
+    in_use: int = 0
+
+
+class TcpConnectionPool:
+    """Reuses warm client connections across runs. Idle eviction, checkout health check, per-target cap."""
+
+    def __init__(
+        self,
+        *,
+        max_per_target: int = 8,
+        idle_timeout_sec: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_per_target = max(1, max_per_target)
+        self._idle_timeout_sec = idle_timeout_sec
+        self._clock = clock
+        self._slots: dict[PoolKey, _Slot] = {}
+        self._cond = threading.Condition()
+        self._last_sweep = clock()
+
+    def acquire(self, target: TargetRef, timeout_sec: float) -> socket.socket:
+        """Check out a healthy idle connection or open a new one. Blocks while the target is at its cap."""
+        key = pool_key(target)
+        deadline = self._clock() + timeout_sec
+        with self._cond:
+            while True:
+                # Fetched again after every wait: an empty slot may be dropped (eviction, close) meanwhile.
+                slot = self._slots.setdefault(key, _Slot())
+                now = self._clock()
+                while slot.idle:
+                    sock, last_used = slot.idle.pop()
+                    if now - last_used <= self._idle_timeout_sec and _is_healthy(sock):
+                        slot.in_use += 1
+                        return sock
+                    sock.close()
+                if slot.in_use < self._max_per_target:
+                    slot.in_use += 1
+                    break
+                remaining = deadline - now
+                if remaining <= 0:
+                    raise PoolExhaustedError(f"no connection available for {key[0]}:{key[1]}")
+                self._cond.wait(remaining)
+        sock: socket.socket | None = None
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.settimeout(max(0.001, deadline - self._clock()))
+            sock.connect((target.host, target.port))
+            return sock
+        except BaseException:
+            if sock is not None:
+                sock.close()
+            with self._cond:
+                slot.in_use -= 1
+                self._cond.notify()
+            raise
+
+    def release(self, target: TargetRef, sock: socket.socket, *, reusable: bool = True) -> None:
+        """Return a checked-out connection; closes it instead when the run left it in an unknown state."""
+        key = pool_key(target)
+        with self._cond:
+            slot = self._slots.setdefault(key, _Slot())
+            slot.in_use = max(0, slot.in_use - 1)
+            if reusable:
+                slot.idle.append((sock, self._clock()))
+            else:
+                sock.close()
+            self._cond.notify()
+            if self._clock() - self._last_sweep >= self._idle_timeout_sec / 2:
+                self._evict_idle_locked()
+
+    def evict_idle(self) -> int:
+        """Close idle connections older than idle_timeout_sec. Returns number closed."""
+        with self._cond:
+            return self._evict_idle_locked()
+
+    def close(self) -> None:
+        """Close every idle connection. Connections checked out right now come back on release."""
+        with self._cond:
+            for slot in self._slots.values():
+                while slot.idle:
+                    slot.idle.pop()[0].close()
+            self._slots = {k: s for k, s in self._slots.items() if s.in_use}
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Idle and in-use counts per "host:port/mode" key."""
+        with self._cond:
+            return {
+                f"{h}:{p}/{m}": {"idle": len(s.idle), "in_use": s.in_use}
+                for (h, p, m), s in self._slots.items()
+            }
+
+    def _evict_idle_locked(self) -> int:
+        now = self._clock()
+        self._last_sweep = now
+        closed = 0
+        for key in list(self._slots):
+            slot = self._slots[key]
+            kept = deque()
+            for sock, last_used in slot.idle:
+                if now - last_used > self._idle_timeout_sec:
+                    sock.close()
+                    closed += 1
+                else:
+                    kept.append((sock, last_used))
+            slot.idle = kept
+            if not slot.idle and not slot.in_use:
+                del self._slots[key]
+        return closed
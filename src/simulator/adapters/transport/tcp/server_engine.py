@@ -0,0 +1,208 @@
+"""Multi-connection TCP server engine: one selectors loop serving many clients with per-connection state."""
+
+from __future__ import annotations
+
+import selectors
+import socket
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from simulator.adapters.transport.common.framing import Framer, FramingError, StreamReassembler
+from simulator.adapters.transport.common.message_io import (
+    encode_body,
+    observed_interactions,
+    receive_observation,
+    run_stopped,
+    send_observation,
+)
+from simulator.domain.models.run_models import ObservedInteractions
+from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
+
+if TYPE_CHECKING:
+    from simulator.domain.ports.codec_port import MessageCodecPort
+    from simulator.domain.services.cancellation import RunDeadline
+
+DEFAULT_BACKLOG = 1024
+# Per-connection reassembly buffer starts small (thousands of connections) and grows on demand.
+CONNECTION_BUFFER_BYTES = 4096
+
+
+@dataclass
+class _Connection:
+    connection_id: int
+    sock: socket.socket
+    reassembler: StreamReassembler
+    deadline: float
+    step: int = 0
+    outbound: bytearray = field(default_factory=bytearray)
+
+
+def server_options(target: TargetRef) -> tuple[int, int]:
+    """
+    (backlog, max_connections) from target.server. max_connections defaults to 1, so a run without
+    a server block ends as soon as its client is done; an explicit 0 means serve until idle.
+    """
+    opts: dict[str, Any] = target.server or {}
+    backlog = int(opts.get("backlog", DEFAULT_BACKLOG))
+    max_connections = int(opts.get("max_connections", 1))
+    if backlog < 1 or max_connections < 0:
+        raise ValueError("server.backlog must be >= 1 and server.max_connections >= 0")
+    return backlog, max_connections
+
+
+class TcpServerEngine:
+    """
+    Serves the task script to every accepted client concurrently on one selectors loop.
+
+    Each connection has its own reassembler and script position: receive steps wait for a frame,
+    send steps queue the pre-encoded response. Interactions carry the connection_id (accept order).
+    The run window ends when max_connections clients have finished (one by default), or, with
+    max_connections 0, when no connection is open and nothing has arrived for timeout_sec. A
+    connection that waits longer than timeout_sec for a frame records TRANSPORT_READ_TIMEOUT and
+    is closed.
+    """
+
+    def __init__(self, framer: Framer, codec: "MessageCodecPort | None" = None) -> None:
+        self._framer = framer
+        self._codec = codec
+
+    def serve(
+        self,
+        target: TargetRef,
+        messages: list[MessageEnvelope],
+        timeout_sec: float,
+        deadline: "RunDeadline | None" = None,
+    ) -> ObservedInteractions:
+        interactions: list[dict[str, object]] = []
+        errors: list[str] = []
+        try:
+            backlog, max_connections = server_options(target)
+            # The script is identical for every client: encode each send step once.
+            wire = [
+                self._framer.encode(encode_body(m, self._codec)) if m.direction == "send" else b""
+                for m in messages
+            ]
+        except ValueError as e:
+            return ObservedInteractions(interactions=(), transport_errors=(f"CODEC_ENCODE_FAILED:{e!s}",))
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            listener.bind((target.host, target.port))
+            listener.listen(backlog)
+            listener.setblocking(False)
+        except OSError as e:
+            listener.close()
+            return ObservedInteractions(interactions=(), transport_errors=(f"TRANSPORT_ERROR:{e!s}",))
+
+        sel = selectors.DefaultSelector()
+        sel.register(listener, selectors.EVENT_READ, None)
+        open_conns: dict[int, _Connection] = {}
+        accepted = 0
+        idle_deadline = time.monotonic() + timeout_sec
+        # Deadlines are swept periodically rather than tracked per wakeup, so a select over
+        # thousands of sockets does not pay an O(connections) scan on every event.
+        sweep_interval = min(timeout_sec, 0.1)
+        next_sweep = time.monotonic() + sweep_interval
+        accepting = True
+
+        def close(conn: _Connection) -> None:
+            nonlocal idle_deadline
+            sel.unregister(conn.sock)
+            conn.sock.close()
+            del open_conns[conn.connection_id]
+            idle_deadline = time.monotonic() + timeout_sec
+
+        def advance(conn: _Connection) -> None:
+            while conn.step < len(messages):
+                msg = messages[conn.step]
+                if msg.direction == "send":
+                    conn.outbound += wire[conn.step]
+                    interactions.append(send_observation(msg.message_type, connection_id=conn.connection_id))
+                elif msg.direction == "receive":
+                    frame = conn.reassembler.next_frame()
+                    if frame is None:
+                        break
+                    observation = receive_observation(frame, self._codec, msg.message_type)
+                    observation["connection_id"] = conn.connection_id
+                    interactions.append(observation)
+                conn.step += 1
+            flush(conn)
+
+        def flush(conn: _Connection) -> None:
+            if conn.outbound:
+                try:
+                    sent = conn.sock.send(conn.outbound)
+                except BlockingIOError:
+                    sent = 0
+                del conn.outbound[:sent]
+                if sent:
+                    conn.deadline = time.monotonic() + timeout_sec
+            if conn.step >= len(messages) and not conn.outbound:
+                close(conn)
+                return
+            events = selectors.EVENT_READ | (selectors.EVENT_WRITE if conn.outbound else 0)
+            sel.modify(conn.sock, events, conn)
+
+        def service(conn: _Connection, readable: bool) -> None:
+            try:
+                if readable:
+                    if conn.reassembler.recv_from(conn.sock) == 0:
+                        close(conn)
+                        return
+                    conn.deadline = time.monotonic() + timeout_sec
+                advance(conn)
+            except FramingError as e:
+                errors.append(f"TRANSPORT_PROTOCOL_ERROR:{e!s}")
+                close(conn)
+            except BlockingIOError:
+                pass
+            except OSError as e:
+                errors.append(f"TRANSPORT_ERROR:{e!s}")
+                close(conn)
+
+        try:
+            while accepting or open_conns:
+                if run_stopped(deadline, errors):
+                    break  # the sweep interval bounds how long a cancel waits for this check
+                now = time.monotonic()
+                if not open_conns and now >= idle_deadline:
+                    break
+                wake = next_sweep if open_conns else min(idle_deadline, next_sweep)
+                for key, mask in sel.select(max(0.0, wake - now)):
+                    if key.data is None:
+                        while accepting:
+                            try:
+                                sock, _ = listener.accept()
+                            except BlockingIOError:
+                                break
+                            sock.setblocking(False)
+                            accepted += 1
+                            conn = _Connection(
+                                connection_id=accepted,
+                                sock=sock,
+                                reassembler=StreamReassembler(self._framer, capacity=CONNECTION_BUFFER_BYTES),
+                                deadline=time.monotonic() + timeout_sec,
+                            )
+                            open_conns[accepted] = conn
+                            sel.register(sock, selectors.EVENT_READ, conn)
+                            service(conn, readable=False)
+                            if max_connections and accepted >= max_connections:
+                                accepting = False
+                                sel.unregister(listener)
+                    elif key.data.connection_id in open_conns:
+                        service(key.data, readable=bool(mask & selectors.EVENT_READ))
+                now = time.monotonic()
+                if now >= next_sweep:
+                    for conn in [c for c in open_conns.values() if c.deadline <= now]:
+                        errors.append("TRANSPORT_READ_TIMEOUT")
+                        close(conn)
+                    next_sweep = now + sweep_interval
+        finally:
+            for conn in list(open_conns.values()):
+                conn.sock.close()
+            sel.close()
+            listener.close()
+        if accepted == 0 and not run_stopped(deadline, errors):
+            errors.append("TRANSPORT_ERROR:timed out")
+        return observed_interactions(interactions, errors)
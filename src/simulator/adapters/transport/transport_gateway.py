@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from simulator.adapters.transport.composite_transport import CompositeTransportAdapter
 from simulator.domain.models.run_models import ObservedInteractions
 from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
@@ -18,9 +20,21 @@ class TransportGateway:
         *,
         target: TargetRef,
         protocol: str,
-        messages: list[MessageEnvelope],
+        messages: Iterable[MessageEnvelope],
         timeout_ms: int,
     ) -> ObservedInteractions:
         return self._adapter.execute(
             target=target, protocol=protocol, messages=messages, timeout_ms=timeout_ms
         )
+
+    async def execute_async(
+        self,
+        *,
+        target: TargetRef,
+        protocol: str,
+        messages: Iterable[MessageEnvelope],
+        timeout_ms: int,
+    ) -> ObservedInteractions:
+        return await self._adapter.execute_async(
+            target=target, protocol=protocol, messages=messages, timeout_ms=timeout_ms
+        )
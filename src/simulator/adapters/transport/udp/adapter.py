@@ -3,31 +3,55 @@
 from __future__ import annotations
 
 import socket
+from collections.abc import Iterable
+from contextlib import AbstractContextManager, nullcontext
 from typing import TYPE_CHECKING
 
+from simulator.adapters.transport.common.message_io import (
+    datagram_body,
+    observed_interactions,
+    receive_observation,
+    receive_timeout_sec,
+    run_stopped,
+    send_observation,
+    stamp_latency,
+)
+from simulator.adapters.transport.udp.responder import UdpResponder
 from simulator.domain.models.run_models import ObservedInteractions
 from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
 
 if TYPE_CHECKING:
-    pass
+    from simulator.domain.ports.codec_port import MessageCodecPort
+    from simulator.domain.services.cancellation import RunDeadline
 
 
-def _serialize_message(msg: MessageEnvelope) -> bytes:
-    """MVP: simple payload for smoke tests."""
-    body = str(msg.payload)
-    return (body + "\n").encode("utf-8")
+def _wake(sock: socket.socket) -> None:
+    # shutdown() does not interrupt recvfrom on an unconnected UDP socket; an empty datagram does.
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as waker:
+        waker.sendto(b"", ("127.0.0.1", sock.getsockname()[1]))
+
+
+def _wake_on_cancel(deadline: "RunDeadline | None", sock: socket.socket) -> AbstractContextManager[object]:
+    """While the script runs, a cancel wakes a blocked recvfrom at once."""
+    if deadline is None:
+        return nullcontext()
+    return deadline.token.on_cancel(lambda: _wake(sock))
 
 
 class UdpTransportAdapter:
-    """UDP client and server. Client: sendto, recvfrom. Server: bind, recvfrom, sendto."""
+    """UDP client and server. Client: sendto, recvfrom. Server: UdpResponder for the run window."""
+
+    def __init__(self, codec: "MessageCodecPort | None" = None) -> None:
+        self._codec = codec
 
     def execute(
         self,
         *,
         target: TargetRef,
         protocol: str,
-        messages: list[MessageEnvelope],
+        messages: Iterable[MessageEnvelope],
         timeout_ms: int,
+        deadline: "RunDeadline | None" = None,
     ) -> ObservedInteractions:
         if protocol.lower() != "udp":
             return ObservedInteractions(
@@ -35,63 +59,57 @@ class UdpTransportAdapter:
                 transport_errors=(f"UDP adapter does not support protocol {protocol!r}",),
             )
         timeout_sec = max(0.001, timeout_ms / 1000.0)
+        if deadline is not None:
+            timeout_sec = deadline.timeout_sec(timeout_sec)
         if target.mode == "server":
-            return self._run_server(target, messages, timeout_sec)
-        return self._run_client(target, messages, timeout_sec)
+            return self._run_server(target, list(messages), timeout_sec, deadline)
+        return self._run_client(target, messages, timeout_sec, deadline)
 
     def _run_client(
-        self, target: TargetRef, messages: list[MessageEnvelope], timeout_sec: float
+        self,
+        target: TargetRef,
+        messages: Iterable[MessageEnvelope],
+        timeout_sec: float,
+        deadline: "RunDeadline | None",
     ) -> ObservedInteractions:
         interactions: list[dict[str, object]] = []
         errors: list[str] = []
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.settimeout(timeout_sec)
-            addr = (target.host, target.port)
-            for msg in messages:
-                if msg.direction == "send":
-                    sock.sendto(_serialize_message(msg), addr)
-                    interactions.append({"direction": "send", "message_type": msg.message_type})
-                elif msg.direction == "receive":
-                    try:
-                        buf, _ = sock.recvfrom(4096)
-                        if buf:
-                            interactions.append({"direction": "receive", "raw_len": len(buf)})
-                    except socket.timeout:
-                        errors.append("TRANSPORT_READ_TIMEOUT")
-            sock.close()
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.settimeout(timeout_sec)
+                addr = (target.host, target.port)
+                sock.bind(("", 0))  # a port to wake on cancel before the first send
+                request: dict[str, object] | None = None
+                with _wake_on_cancel(deadline, sock):
+                    for msg in messages:
+                        if run_stopped(deadline, errors):
+                            break
+                        if msg.direction == "send":
+                            sock.sendto(datagram_body(msg, self._codec), addr)
+                            request = send_observation(msg.message_type)
+                            interactions.append(request)
+                        elif msg.direction == "receive":
+                            sock.settimeout(receive_timeout_sec(msg, timeout_sec, deadline))
+                            try:
+                                buf, _ = sock.recvfrom(4096)
+                                if buf:
+                                    observation = receive_observation(buf, self._codec, msg.message_type)
+                                    interactions.append(stamp_latency(observation, request))
+                                    request = None
+                            except socket.timeout:
+                                errors.append("TRANSPORT_READ_TIMEOUT")
+                run_stopped(deadline, errors)
+        except ValueError as e:
+            errors.append(f"CODEC_ENCODE_FAILED:{e!s}")
         except OSError as e:
             errors.append(f"TRANSPORT_ERROR:{e!s}")
-        return ObservedInteractions(
-            interactions=tuple(interactions),
-            transport_errors=tuple(errors),
-        )
+        return observed_interactions(interactions, errors)
 
     def _run_server(
-        self, target: TargetRef, messages: list[MessageEnvelope], timeout_sec: float
+        self,
+        target: TargetRef,
+        messages: list[MessageEnvelope],
+        timeout_sec: float,
+        deadline: "RunDeadline | None",
     ) -> ObservedInteractions:
-        interactions: list[dict[str, object]] = []
-        errors: list[str] = []
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.settimeout(timeout_sec)
-            sock.bind((target.host, target.port))
-            for msg in messages:
-                if msg.direction == "receive":
-                    try:
-                        buf, peer = sock.recvfrom(4096)
-                        if buf:
-                            interactions.append({"direction": "receive", "raw_len": len(buf)})
-                            if messages and messages[0].direction == "send":
-                                sock.sendto(_serialize_message(messages[0]), peer)
-                    except socket.timeout:
-                        errors.append("TRANSPORT_READ_TIMEOUT")
-                elif msg.direction == "send":
-                    pass  # response sent in receive branch for request/response
-            sock.close()
-        except OSError as e:
-            errors.append(f"TRANSPORT_ERROR:{e!s}")
-        return ObservedInteractions(
-            interactions=tuple(interactions),
-            transport_errors=tuple(errors),
-        )
+        return UdpResponder(self._codec).serve(target, messages, timeout_sec, deadline)
@@ -0,0 +1,121 @@
+"""Asyncio UDP transport adapter (client and server). Implements TransportPort.execute_async."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+
+from simulator.adapters.transport.common.message_io import (
+    datagram_body,
+    observed_interactions,
+    receive_observation,
+    receive_timeout_sec,
+    run_stopped,
+    send_observation,
+    stamp_latency,
+)
+from simulator.adapters.transport.udp.responder import UdpResponder
+from simulator.domain.models.run_models import ObservedInteractions
+from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
+from simulator.domain.ports.codec_port import MessageCodecPort
+from simulator.domain.services.cancellation import RunDeadline
+
+
+class _DatagramQueue(asyncio.DatagramProtocol):
+    """Queues inbound datagrams for the run coroutine to await."""
+
+    def __init__(self) -> None:
+        self.received: asyncio.Queue[tuple[bytes, tuple[str, int]]] = asyncio.Queue()
+        self.error: OSError | None = None
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        self.received.put_nowait((data, addr))
+
+    def error_received(self, exc: Exception) -> None:
+        if isinstance(exc, OSError):
+            self.error = exc
+
+
+class AsyncUdpTransportAdapter:
+    """
+    UDP client on the running event loop; server mode runs UdpResponder in a worker thread. Same
+    observation shape as UdpTransportAdapter.
+    """
+
+    def __init__(self, codec: MessageCodecPort | None = None) -> None:
+        self._codec = codec
+
+    async def execute_async(
+        self,
+        *,
+        target: TargetRef,
+        protocol: str,
+        messages: Iterable[MessageEnvelope],
+        timeout_ms: int,
+        deadline: RunDeadline | None = None,
+    ) -> ObservedInteractions:
+        if protocol.lower() != "udp":
+            return ObservedInteractions(
+                interactions=(),
+                transport_errors=(f"UDP adapter does not support protocol {protocol!r}",),
+            )
+        timeout_sec = max(0.001, timeout_ms / 1000.0)
+        if deadline is not None:
+            timeout_sec = deadline.timeout_sec(timeout_sec)
+        if target.mode == "server":
+            return await self._run_server(target, list(messages), timeout_sec, deadline)
+        return await self._run_client(target, messages, timeout_sec, deadline)
+
+    async def _run_client(
+        self,
+        target: TargetRef,
+        messages: Iterable[MessageEnvelope],
+        timeout_sec: float,
+        deadline: RunDeadline | None,
+    ) -> ObservedInteractions:
+        interactions: list[dict[str, object]] = []
+        errors: list[str] = []
+        loop = asyncio.get_running_loop()
+        try:
+            transport, proto = await loop.create_datagram_endpoint(
+                _DatagramQueue, remote_addr=(target.host, target.port)
+            )
+        except OSError as e:
+            return ObservedInteractions(interactions=(), transport_errors=(f"TRANSPORT_ERROR:{e!s}",))
+        request: dict[str, object] | None = None
+        try:
+            for msg in messages:
+                if run_stopped(deadline, errors):
+                    break
+                if msg.direction == "send":
+                    transport.sendto(datagram_body(msg, self._codec))
+                    request = send_observation(msg.message_type)
+                    interactions.append(request)
+                elif msg.direction == "receive":
+                    try:
+                        buf, _ = await asyncio.wait_for(
+                            proto.received.get(), receive_timeout_sec(msg, timeout_sec, deadline)
+                        )
+                        if buf:
+                            observation = receive_observation(buf, self._codec, msg.message_type)
+                            interactions.append(stamp_latency(observation, request))
+                            request = None
+                    except asyncio.TimeoutError:
+                        errors.append("TRANSPORT_READ_TIMEOUT")
+        except ValueError as e:
+            errors.append(f"CODEC_ENCODE_FAILED:{e!s}")
+        finally:
+            transport.close()
+        if proto.error is not None:
+            errors.append(f"TRANSPORT_ERROR:{proto.error!s}")
+        return observed_interactions(interactions, errors)
+
+    async def _run_server(
+        self,
+        target: TargetRef,
+        messages: list[MessageEnvelope],
+        timeout_sec: float,
+        deadline: RunDeadline | None,
+    ) -> ObservedInteractions:
+        # The responder's batched non-blocking loop is the server; a worker thread keeps the event loop free.
+        return await asyncio.to_thread(UdpResponder(self._codec).serve, target, messages, timeout_sec, deadline)
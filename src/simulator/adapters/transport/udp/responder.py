@@ -0,0 +1,158 @@
+"""High-rate UDP responder: serves a whole run window, dispatching responses per inbound message type."""
+
+from __future__ import annotations
+
+import selectors
+import socket
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from simulator.adapters.transport.common.message_io import (
+    datagram_body,
+    observed_interactions,
+    receive_observation,
+    run_stopped,
+    send_observation,
+)
+from simulator.domain.models.run_models import ObservedInteractions
+from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
+
+if TYPE_CHECKING:
+    from simulator.domain.ports.codec_port import MessageCodecPort
+    from simulator.domain.services.cancellation import RunDeadline
+
+MAX_DATAGRAM_BYTES = 65535
+# Datagrams drained per readiness wakeup before new deadlines are checked.
+READ_BATCH = 256
+RECV_BUFFER_BYTES = 4 * 1024 * 1024
+# Longest a quiet window waits between checks of the run's deadline and cancellation.
+STOP_CHECK_SEC = 0.1
+
+
+@dataclass
+class _Peer:
+    position: int = 0  # index into the receive cycle; used when the codec cannot type a datagram
+    received: int = 0
+
+
+def response_table(
+    messages: list[MessageEnvelope],
+) -> tuple[list[str], dict[str, list[MessageEnvelope]]]:
+    """(receive types in script order, {receive type: sends that follow it before the next receive})."""
+    order: list[str] = []
+    table: dict[str, list[MessageEnvelope]] = {}
+    current: list[MessageEnvelope] | None = None
+    for msg in messages:
+        if msg.direction == "receive":
+            order.append(msg.message_type)
+            current = table.setdefault(msg.message_type, [])
+        elif msg.direction == "send" and current is not None:
+            current.append(msg)
+    return order, table
+
+
+class UdpResponder:
+    """
+    Stands in for a UDP service for the run window.
+
+    The task script is read as a message_type -> response table: each receive step answers with the
+    send steps that follow it. Inbound datagrams are typed by the codec when it recognizes them;
+    otherwise they are answered by the peer's position in the script's receive cycle but recorded
+    untyped, as the TCP server engine does, with that position's type under script_type. The socket is non-blocking and
+    drained in batches per wakeup into one preallocated buffer. The run ends when no datagram has
+    arrived for timeout_sec, or after server["window_ms"] when set.
+    """
+
+    def __init__(self, codec: "MessageCodecPort | None" = None) -> None:
+        self._codec = codec
+
+    def serve(
+        self,
+        target: TargetRef,
+        messages: list[MessageEnvelope],
+        timeout_sec: float,
+        deadline: "RunDeadline | None" = None,
+    ) -> ObservedInteractions:
+        interactions: list[dict[str, object]] = []
+        errors: list[str] = []
+        order, table = response_table(messages)
+        try:
+            wire = {
+                mtype: [(m.message_type, datagram_body(m, self._codec)) for m in sends]
+                for mtype, sends in table.items()
+            }
+        except ValueError as e:
+            return ObservedInteractions(interactions=(), transport_errors=(f"CODEC_ENCODE_FAILED:{e!s}",))
+        window_ms = (target.server or {}).get("window_ms")
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER_BYTES)
+            except OSError:
+                pass
+            sock.bind((target.host, target.port))
+            sock.setblocking(False)
+        except OSError as e:
+            sock.close()
+            return ObservedInteractions(interactions=(), transport_errors=(f"TRANSPORT_ERROR:{e!s}",))
+
+        peers: dict[tuple[str, int], _Peer] = {}
+        buf = bytearray(MAX_DATAGRAM_BYTES)
+        view = memoryview(buf)
+        dropped = 0
+        start = time.monotonic()
+        end = start + window_ms / 1000.0 if window_ms else None
+        idle_deadline = start + timeout_sec
+        sel = selectors.DefaultSelector()
+        sel.register(sock, selectors.EVENT_READ)
+        try:
+            while True:
+                if run_stopped(deadline, errors):
+                    break
+                now = time.monotonic()
+                stop = idle_deadline if end is None else end
+                if now >= stop:
+                    break
+                wait = stop - now if deadline is None else min(stop - now, STOP_CHECK_SEC)
+                if not sel.select(wait):
+                    continue
+                for _ in range(READ_BATCH):
+                    try:
+                        n, addr = sock.recvfrom_into(buf)
+                    except (BlockingIOError, InterruptedError):
+                        break
+                    except ConnectionResetError:
+                        continue  # ICMP port unreachable from an earlier reply; not fatal for a responder
+                    peer = peers.get(addr)
+                    if peer is None:
+                        peer = peers[addr] = _Peer()
+                    peer_id = f"{addr[0]}:{addr[1]}"
+                    expected = order[peer.position % len(order)] if order else None
+                    observation = receive_observation(view[:n], self._codec, expected)
+                    mtype = observation.get("message_type")
+                    if mtype is None and expected is not None:
+                        # Untyped: answered by script position, but not counted as that message type.
+                        mtype = observation["script_type"] = expected
+                    observation["peer"] = peer_id
+                    interactions.append(observation)
+                    peer.received += 1
+                    peer.position += 1
+                    for response_type, body in wire.get(str(mtype), ()):
+                        try:
+                            sock.sendto(body, addr)
+                        except BlockingIOError:
+                            dropped += 1
+                            continue
+                        interactions.append(send_observation(response_type, peer=peer_id))
+                idle_deadline = time.monotonic() + timeout_sec
+        except OSError as e:
+            errors.append(f"TRANSPORT_ERROR:{e!s}")
+        finally:
+            sel.close()
+            sock.close()
+        if not peers and not run_stopped(deadline, errors):
+            errors.append("TRANSPORT_READ_TIMEOUT")
+        if dropped:
+            errors.append(f"TRANSPORT_SEND_DROPPED:{dropped}")
+        return observed_interactions(interactions, errors)
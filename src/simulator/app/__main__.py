@@ -1,12 +1,17 @@
-"""Entry point: python -m simulator [--gui | --tui]. Desktop runtime mode."""
+"""Entry point: python -m simulator [--gui | --tui] [--task-bundle FILE] | tasks pack | farm. Desktop runtime mode."""
 
 from __future__ import annotations
 
 import argparse
+import json
 import sys
+from pathlib import Path
 from uuid import uuid4
 
-from simulator.app.bootstrap import create_app
+from simulator.adapters.tasks.task_bundle import pack_task_directory
+from simulator.app.bootstrap import create_app, shutdown_app
+from simulator.app.run_farm import RunFarm
+from simulator.domain.models.run_models import RunInput
 
 
 def _run_mvp_flow(container: dict[str, object]) -> None:
@@ -25,36 +30,81 @@ def _run_mvp_flow(container: dict[str, object]) -> None:
         print(f"[ok] Run completed: {result.get('verification', {}).get('summary', '')}")
 
 
-def main() -> int:
+def _tasks_pack(args: argparse.Namespace) -> int:
+    """simulator tasks pack: write the task directory as one bundle file."""
+    result = pack_task_directory(Path(args.tasks_dir), Path(args.output), workers=args.workers)
+    for err in result["errors"]:
+        print(f"[error] {err['error_code']} {err['path']}: {err['message']}", file=sys.stderr)
+    if not result["ok"]:
+        return 1
+    print(f"[ok] Packed {result['task_count']} task(s) into {result['path']} ({result['size_bytes']} bytes)")
+    return 0
+
+
+def _farm(args: argparse.Namespace) -> int:
+    """simulator farm: push --runs runs of one task through a multi-process run farm and print its metrics."""
+    app_kwargs = {"task_bundle": Path(args.task_bundle)} if args.task_bundle else {}
+    runs = (RunInput(f"farm-{i}", args.target, args.task, args.protocol) for i in range(args.runs))
+    with RunFarm(workers=args.workers, app_kwargs=app_kwargs) as farm:
+        for _ in farm.run_many(runs):
+            pass
+        metrics = farm.metrics()
+    print(json.dumps(metrics, indent=2))
+    return 0 if metrics["failed"] == 0 else 1
+
+
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Simulator desktop application")
     group = parser.add_mutually_exclusive_group()
     group.add_argument("--gui", action="store_true", help="Launch GUI (Tkinter via py-gui)")
     group.add_argument("--tui", action="store_true", help="Launch TUI (Textual)")
-    args = parser.parse_args()
+    parser.add_argument("--task-bundle", help="Serve tasks from a bundle written by 'tasks pack'")
+    commands = parser.add_subparsers(dest="command")
+    tasks = commands.add_parser("tasks", help="Task library maintenance").add_subparsers(dest="tasks_command")
+    pack = tasks.add_parser("pack", help="Pack a task directory into one bundle file for fast startup")
+    pack.add_argument("tasks_dir", help="Directory of *.task.json files")
+    pack.add_argument("-o", "--output", required=True, help="Bundle file to write")
+    pack.add_argument("--workers", type=int, default=None, help="Parser processes (default: one per core)")
+    farm = commands.add_parser("farm", help="Run many runs across worker processes and report metrics")
+    farm.add_argument("--target", default="default-target", help="Target id")
+    farm.add_argument("--task", default="ping-smoke", help="Task id")
+    farm.add_argument("--protocol", default="", help="Protocol (default: the task's)")
+    farm.add_argument("--runs", type=int, default=100, help="Number of runs")
+    farm.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per core)")
+    args = parser.parse_args(argv)
+
+    if args.command == "tasks":
+        if args.tasks_command == "pack":
+            return _tasks_pack(args)
+        parser.error("tasks: choose a subcommand (pack)")
+    if args.command == "farm":
+        return _farm(args)
 
     mode = "gui" if args.gui else "tui"
-    container = create_app(mode=mode)
-
-    if args.gui:
-        try:
-            from simulator.adapters.ui.gui.main import run_gui
-            run_gui(container)
-        except ImportError as e:
-            print(f"[warn] GUI not available: {e}", file=sys.stderr)
-            print("[info] Running one flow in CLI instead.", file=sys.stderr)
-            _run_mvp_flow(container)
-        return 0
+    container = create_app(mode=mode, task_bundle=Path(args.task_bundle) if args.task_bundle else None)
+    try:
+        if args.gui:
+            try:
+                from simulator.adapters.ui.gui.main import run_gui
+                run_gui(container)
+            except ImportError as e:
+                print(f"[warn] GUI not available: {e}", file=sys.stderr)
+                print("[info] Running one flow in CLI instead.", file=sys.stderr)
+                _run_mvp_flow(container)
+            return 0
 
-    if args.tui:
-        try:
-            from simulator.adapters.ui.tui.main import run_tui
-            run_tui(container)
-        except ImportError:
-            _run_mvp_flow(container)
-        return 0
+        if args.tui:
+            try:
+                from simulator.adapters.ui.tui.main import run_tui
+                run_tui(container)
+            except ImportError:
+                _run_mvp_flow(container)
+            return 0
 
-    _run_mvp_flow(container)
-    return 0
+        _run_mvp_flow(container)
+        return 0
+    finally:
+        shutdown_app(container)
 
 
 if __name__ == "__main__":
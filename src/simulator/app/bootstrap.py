@@ -5,13 +5,15 @@ from __future__ import annotations
 from pathlib import Path
 
 from simulator.adapters.capture_replay import FileCaptureReplayAdapter
+from simulator.adapters.contracts import FileContractAdapter
 from simulator.adapters.events import InMemoryEventBus
 from simulator.adapters.logging import ConsoleLoggingAdapter
-from simulator.adapters.tasks import FileTaskRegistryAdapter
-from simulator.adapters.transport import CompositeTransportAdapter
+from simulator.adapters.tasks import BundleTaskRegistryAdapter, FileTaskRegistryAdapter
+from simulator.adapters.transport import CompositeTransportAdapter, MemoryTransportAdapter, TcpConnectionPool
 from simulator.adapters.verification import CountVerificationAdapter
-from simulator.config.targets import get_default_targets, resolve_target
+from simulator.config.targets import DEFAULT_MAX_CONCURRENT_RUNS, get_default_targets, resolve_target
 from simulator.domain.models.target_and_task import TargetRef
+from simulator.domain.ports import ClockPort, TaskRegistryPort
 from simulator.domain.services import SimulationService
 from simulator.workflows import RunWorkflow
 
@@ -19,16 +21,49 @@ from simulator.workflows import RunWorkflow
 def create_app(
     mode: str = "tui",
     tasks_dir: Path | None = None,
+    contract_sources: list[dict[str, object]] | None = None,
+    contract_cache_dir: Path | None = None,
+    task_index_path: Path | None = None,
+    task_bundle: Path | None = None,
+    max_concurrent_runs: int = DEFAULT_MAX_CONCURRENT_RUNS,
+    max_runs_per_target: int | None = None,
+    clock: ClockPort | None = None,
 ) -> dict[str, object]:
     """
     Create a runnable app container. Mode is 'gui' or 'tui'.
-    Returns container with simulation_service, workflow, and mode for UI entry points.
+    contract_sources (ContractDefinition-shaped dicts) switch the wire format to the contract codec.
+    With contract_cache_dir set, parsed headers are cached there; with task_index_path set, the task
+    listing index is persisted there (both default to memory only). task_bundle (from
+    `simulator tasks pack`) serves tasks from a packed bundle instead of tasks_dir.
+    SimulationService.submit/run_many run at most max_concurrent_runs at once (max_runs_per_target per target).
+    clock (default: system time) drives run timing and the in-process mem transport; pass a VirtualClock
+    to run mem targets in simulated time.
+    Returns container with simulation_service, workflow, and mode for UI entry points; release it with
+    shutdown_app().
     """
     logger = ConsoleLoggingAdapter()
     event_bus = InMemoryEventBus()
     verification = CountVerificationAdapter()
-    transport = CompositeTransportAdapter()
-    task_registry = FileTaskRegistryAdapter(tasks_dir=tasks_dir)
+    contracts = FileContractAdapter(cache_dir=contract_cache_dir)
+    contract_bundle = contracts.load_sources(list(contract_sources or []))
+    for err in contract_bundle["errors"]:
+        logger.warn(str(err["error_code"]), **err)
+    codec = contracts.codec(contract_bundle) if contract_sources else None
+    tcp_pool = TcpConnectionPool()
+    transport = CompositeTransportAdapter(
+        tcp_pool=tcp_pool, codec=codec, memory=MemoryTransportAdapter(clock=clock, codec=codec)
+    )
+    task_registry: TaskRegistryPort
+    if task_bundle is not None:
+        bundle_registry = BundleTaskRegistryAdapter(task_bundle)
+        if bundle_registry.load_error is not None:
+            # Served empty (runtime tasks only) until a refresh can open it; say so instead of going quiet.
+            logger.error("TASK_BUNDLE_INVALID", path=str(task_bundle), message=bundle_registry.load_error)
+        task_registry = bundle_registry
+    else:
+        task_registry = FileTaskRegistryAdapter(
+            tasks_dir=tasks_dir, index_path=task_index_path
+        )
     targets = get_default_targets()
 
     def target_resolver(target_id: str) -> TargetRef | None:
@@ -43,13 +78,34 @@ def create_app(
         task_registry_port=task_registry,
         target_resolver=target_resolver,
         capture_replay_port=capture_replay,
+        clock=clock,
+    )
+    simulation_service = SimulationService(
+        workflow, max_concurrent_runs=max_concurrent_runs, max_runs_per_target=max_runs_per_target
     )
-    simulation_service = SimulationService(workflow)
 
     return {
         "workflow": workflow,
         "simulation_service": simulation_service,
         "capture_replay": capture_replay,
+        "contracts": contracts,
+        "contract_bundle": contract_bundle,
+        "tcp_pool": tcp_pool,
+        "task_registry": task_registry,
         "mode": mode,
         "logger": logger,
     }
+
+
+def shutdown_app(container: dict[str, object]) -> None:
+    """Release what create_app() holds open.
+
+    That is the run pool (after admitted runs finish), warm TCP connections and a mapped task bundle.
+    """
+    service: SimulationService = container["simulation_service"]  # type: ignore[assignment]
+    service.shutdown(wait=True)
+    pool: TcpConnectionPool = container["tcp_pool"]  # type: ignore[assignment]
+    pool.close()
+    registry = container["task_registry"]
+    if isinstance(registry, BundleTaskRegistryAdapter):
+        registry.close()
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from simulator.app.bootstrap import create_app
+from simulator.app.bootstrap import create_app, shutdown_app
 
 
 class Container:
@@ -35,3 +35,7 @@ class Container:
     def get_mode(self) -> str:
         """Current UI mode (gui | tui)."""
         return self._app.get("mode", "tui")
+
+    def shutdown(self) -> None:
+        """Release the run pool and warm TCP connections held by the service graph."""
+        shutdown_app(self._app)
@@ -0,0 +1,247 @@
+"""Run farm: shard runs across worker processes, each with its own create_app() container."""
+
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+from simulator.app.bootstrap import create_app
+from simulator.domain.models.run_models import RunInput
+from simulator.domain.services.latency_stats import summarize_values_ms
+from simulator.domain.services.run_pool import failed_run_result
+
+# Jobs sent to a worker ahead of its results, so it never idles waiting for the parent.
+DEFAULT_WORKER_PREFETCH = 2
+# Worker crashes one run may cause before it is reported as RUN_WORKER_CRASHED instead of retried.
+DEFAULT_MAX_ATTEMPTS = 2
+
+
+def _worker_main(conn: Connection, app_factory: Callable[..., dict[str, object]], app_kwargs: dict[str, Any]) -> None:
+    """Worker process: build a container, then run each (job_id, RunInput) received until None or EOF."""
+    service: Any = app_factory(**app_kwargs)["simulation_service"]
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        job_id, run_input = job
+        started = time.perf_counter_ns()
+        try:
+            result = service.run(
+                run_id=run_input.run_id,
+                target_id=run_input.target_id,
+                task_id=run_input.task_id,
+                protocol=run_input.protocol,
+                deadline_ms=run_input.deadline_ms,
+            )
+        except Exception as e:
+            result = failed_run_result(run_input, e)
+        conn.send((job_id, result, time.perf_counter_ns() - started))
+
+
+def crashed_run_result(run_input: RunInput) -> dict[str, object]:
+    """Result dict for a run whose worker process died on every attempt."""
+    return {
+        "run_id": run_input.run_id,
+        "observed": {"interactions": [], "transport_errors": ["RUN_WORKER_CRASHED"]},
+        "verification": {"passed": False, "summary": "Worker process exited during the run", "mismatches": []},
+    }
+
+
+@dataclass
+class _Worker:
+    slot: int
+    process: BaseProcess
+    conn: Connection
+    in_flight: dict[int, RunInput] = field(default_factory=dict)
+
+
+class RunFarm:
+    """
+    Runs RunInputs on `workers` processes (default: one per core), each holding its own container
+    built by app_factory(**app_kwargs), so verification, logging and serialization run outside the
+    parent's GIL. The parent feeds each worker over its own pipe (at most prefetch runs outstanding),
+    streams results back as they arrive, and aggregates metrics. A worker that dies is replaced; the
+    runs it held are dispatched again. The run it was executing (the oldest it held; workers run in
+    order) is charged with the crash, and is reported as RUN_WORKER_CRASHED after max_attempts crashes.
+
+    app_factory and app_kwargs must be picklable (the default start method is spawn).
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        app_factory: Callable[..., dict[str, object]] = create_app,
+        app_kwargs: dict[str, Any] | None = None,
+        prefetch: int = DEFAULT_WORKER_PREFETCH,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        start_method: str = "spawn",
+    ) -> None:
+        self._size = max(1, workers or os.cpu_count() or 1)
+        self._app_factory = app_factory
+        self._app_kwargs = dict(app_kwargs or {})
+        self._prefetch = max(1, prefetch)
+        self._max_attempts = max(1, max_attempts)
+        self._context = multiprocessing.get_context(start_method)
+        self._workers: list[_Worker] = []
+        self._job_ids = itertools.count()
+        self._crash_counts: dict[int, int] = {}
+        self._durations_ns: list[int] = []
+        self._per_worker_runs = [0] * self._size
+        self._passed = self._failed = self._crashes = self._retried = 0
+        self._busy_sec = 0.0
+
+    def __enter__(self) -> RunFarm:
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _spawn(self, slot: int) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self._app_factory, self._app_kwargs),
+            name=f"sim-farm-{slot}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()  # so the parent sees EOF once the worker is gone
+        return _Worker(slot, process, parent_conn)
+
+    def start(self) -> None:
+        """Start the worker processes (run_many starts them on first use)."""
+        if not self._workers:
+            self._workers = [self._spawn(slot) for slot in range(self._size)]
+
+    def close(self, timeout_sec: float = 5.0) -> None:
+        """Ask every worker to exit, then terminate any still running after timeout_sec."""
+        for worker in self._workers:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        deadline = time.monotonic() + timeout_sec
+        for worker in self._workers:
+            worker.process.join(max(0.0, deadline - time.monotonic()))
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+            worker.conn.close()
+        self._workers = []
+
+    def run_many(self, run_inputs: Iterable[RunInput]) -> Iterator[dict[str, object]]:
+        """Distribute run_inputs over the workers and yield each result dict as it arrives (completion order)."""
+        self.start()
+        started = time.perf_counter()
+        source = iter(run_inputs)
+        retry: deque[tuple[int, RunInput]] = deque()
+        outstanding: dict[int, RunInput] = {}
+        exhausted = False
+        try:
+            while True:
+                for worker in self._workers:
+                    while len(worker.in_flight) < self._prefetch:
+                        if retry:
+                            job_id, run_input = retry.popleft()
+                            if job_id not in outstanding:
+                                continue
+                        elif exhausted:
+                            break
+                        else:
+                            next_input = next(source, None)
+                            if next_input is None:
+                                exhausted = True
+                                break
+                            job_id, run_input = next(self._job_ids), next_input
+                            outstanding[job_id] = run_input
+                        self._dispatch(worker, job_id, run_input)
+                if exhausted and not outstanding:
+                    return
+                ready = wait([w.conn for w in self._workers] + [w.process.sentinel for w in self._workers])
+                for worker in list(self._workers):
+                    if worker.conn in ready or worker.process.sentinel in ready:
+                        yield from self._drain(worker, outstanding, retry)
+        finally:
+            self._busy_sec += time.perf_counter() - started
+
+    def _dispatch(self, worker: _Worker, job_id: int, run_input: RunInput) -> None:
+        worker.in_flight[job_id] = run_input
+        try:
+            worker.conn.send((job_id, run_input))
+        except OSError:
+            pass  # the worker is gone; its sentinel fires and the job is re-dispatched
+
+    def _drain(
+        self, worker: _Worker, outstanding: dict[int, RunInput], retry: deque[tuple[int, RunInput]]
+    ) -> Iterator[dict[str, object]]:
+        """Yield every result the worker has sent; if it has exited, replace it and re-dispatch its runs."""
+        alive = True
+        try:
+            while worker.conn.poll():
+                job_id, result, duration_ns = worker.conn.recv()
+                worker.in_flight.pop(job_id, None)
+                self._crash_counts.pop(job_id, None)
+                if outstanding.pop(job_id, None) is None:
+                    continue  # re-dispatched after a crash and already answered, or from an abandoned stream
+                self._record(worker.slot, result, duration_ns)
+                yield result
+        except (EOFError, OSError):
+            alive = False
+        if alive and worker.process.is_alive():
+            return
+        worker.process.join()
+        worker.conn.close()
+        self._crashes += 1
+        if worker.in_flight:
+            running = next(iter(worker.in_flight))
+            self._crash_counts[running] = self._crash_counts.get(running, 0) + 1
+        for job_id, run_input in worker.in_flight.items():
+            if job_id not in outstanding:
+                continue
+            if self._crash_counts.get(job_id, 0) >= self._max_attempts:
+                del outstanding[job_id]
+                self._crash_counts.pop(job_id, None)
+                result = crashed_run_result(run_input)
+                self._record(worker.slot, result, 0)
+                yield result
+            else:
+                self._retried += 1
+                retry.append((job_id, run_input))
+        self._workers[self._workers.index(worker)] = self._spawn(worker.slot)
+
+    def _record(self, slot: int, result: dict[str, object], duration_ns: int) -> None:
+        verification = result.get("verification") or {}
+        if isinstance(verification, dict) and verification.get("passed"):
+            self._passed += 1
+        else:
+            self._failed += 1
+        self._per_worker_runs[slot] += 1
+        if duration_ns:
+            self._durations_ns.append(duration_ns)
+
+    def metrics(self) -> dict[str, object]:
+        """Totals across every run_many so far: outcomes, crashes, per-worker counts, run time, throughput."""
+        runs = self._passed + self._failed
+        return {
+            "workers": self._size,
+            "runs": runs,
+            "passed": self._passed,
+            "failed": self._failed,
+            "worker_crashes": self._crashes,
+            "retried": self._retried,
+            "runs_per_worker": list(self._per_worker_runs),
+            "run_duration": summarize_values_ms(self._durations_ns),
+            "runs_per_sec": runs / self._busy_sec if self._busy_sec > 0 else 0.0,
+        }
@@ -10,7 +10,7 @@ DEFAULT_MAX_CONCURRENT_RUNS = 10
 
 
 def get_default_targets() -> dict[str, TargetRef]:
-    """Default targets for MVP smoke (localhost)."""
+    """Default targets for MVP smoke (localhost, plus the in-process mem loopback)."""
     return {
         "default-target": TargetRef(
             target_id="default-target",
@@ -28,6 +28,14 @@ def get_default_targets() -> dict[str, TargetRef]:
             protocol="udp",
             mode="client",
         ),
+        "default-mem": TargetRef(
+            target_id="default-mem",
+            name="In-process loopback",
+            host="",
+            port=0,
+            protocol="mem",
+            mode="client",
+        ),
     }
 
 
@@ -38,3 +46,31 @@ def resolve_target(
     if targets is None:
         targets = get_default_targets()
     return targets.get(target_id)
+
+
+def target_from_config(entry: dict[str, object]) -> TargetRef:
+    """Build TargetRef from one runtime-config `targets[]` entry (transport block incl. framing)."""
+    transport = entry.get("transport") or {}
+    if not isinstance(transport, dict):
+        transport = {}
+    framing = transport.get("framing")
+    pipeline = transport.get("pipeline")
+    server = transport.get("server")
+    return TargetRef(
+        target_id=str(entry.get("target_id", "")),
+        name=str(entry.get("name", "")),
+        host=str(transport.get("host", "127.0.0.1")),
+        port=int(transport.get("port", 0)),
+        protocol=str(transport.get("protocol", "tcp")),
+        mode=str(transport.get("mode", "client")),
+        framing=dict(framing) if isinstance(framing, dict) else None,
+        pipeline=dict(pipeline) if isinstance(pipeline, dict) else None,
+        server=dict(server) if isinstance(server, dict) else None,
+    )
+
+
+def load_targets_from_config(config: dict[str, object]) -> dict[str, TargetRef]:
+    """Targets keyed by target_id from a runtime config document."""
+    entries = config.get("targets") or []
+    targets = [target_from_config(e) for e in entries if isinstance(e, dict)]
+    return {t.target_id: t for t in targets}
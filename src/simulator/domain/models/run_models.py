@@ -7,12 +7,16 @@ from dataclasses import dataclass
 
 @dataclass(frozen=True)
 class RunInput:
-    """Input for one simulation run. Parameterized by target/task/protocol."""
+    """Input for one simulation run. Parameterized by target/task/protocol.
+
+    deadline_ms bounds the whole run; None uses the plan's budget (connect plus every receive's deadline).
+    """
 
     run_id: str
     target_id: str
     task_id: str
     protocol: str
+    deadline_ms: int | None = None
 
 
 @dataclass(frozen=True)
@@ -79,3 +79,5 @@ class SequenceStepDefinition:
     order_index: int
     task_ref: str
     failure_policy: str = "stop"  # stop | continue
+    target_ref: str = ""  # "" runs against the sequence's target
+    depends_on: tuple[int, ...] | None = None  # order_index values; None = the previous step, () = none
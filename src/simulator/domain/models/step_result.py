@@ -11,6 +11,6 @@ class StepResult:
     """Per-step result: order_index, state, verdict, evidence."""
 
     order_index: int
-    state: str  # started | completed | failed
+    state: str  # started | completed | failed | skipped
     verdict: str  # PASS | FAIL | SKIP
     evidence: dict[str, Any] | None = None
@@ -16,6 +16,9 @@ class TargetRef:
     port: int
     protocol: str  # tcp | udp
     mode: str  # client | server
+    framing: dict[str, Any] | None = None  # {"id": "length-prefixed" | "delimiter" | "fixed-size", ...}
+    pipeline: dict[str, Any] | None = None  # client mode: {"correlation_key": "id"} ({} = in-order)
+    server: dict[str, Any] | None = None  # server mode: {"backlog", "max_connections"} (tcp), {"window_ms"} (udp)
 
 
 @dataclass(frozen=True)
@@ -25,6 +28,7 @@ class MessageEnvelope:
     message_type: str
     direction: str  # send | receive
     payload: dict[str, Any]
+    timeout_ms: int | None = None  # receive deadline for this step; None = the run's timeout_ms
 
 
 @dataclass(frozen=True)
@@ -42,11 +46,16 @@ class TaskStep:
     """One step in a task definition."""
 
     step_id: str
-    action: str  # send | receive_expectation
+    action: str  # send | receive_expectation | repeat
     message_type: str
     payload_ref: str | None
     expect: StepExpect | None
     timeout_ms: int
+    # repeat only: run `steps` `count` times; ${counter} in their payloads takes start, start+1, ...
+    count: int = 1
+    counter: str = "i"
+    start: int = 0
+    steps: tuple[TaskStep, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -58,3 +67,4 @@ class TaskDefinition:
     steps: tuple[TaskStep, ...]
     payloads: dict[str, dict[str, Any]]
     defaults: dict[str, Any]
+    content_hash: str = ""  # sha256 of the definition, stamped by the registry; keys compiled execution plans
@@ -1,19 +1,24 @@
 """Port contracts (protocols). Domain depends only on these; adapters implement them."""
 
 from simulator.domain.ports.capture_replay_port import CaptureReplayPort
+from simulator.domain.ports.clock_port import ClockPort
+from simulator.domain.ports.codec_port import MessageCodecPort
 from simulator.domain.ports.contract_port import ContractPort
 from simulator.domain.ports.event_bus_port import EventBusPort
 from simulator.domain.ports.logging_port import LoggingPort
-from simulator.domain.ports.task_registry_port import TaskRegistryPort
+from simulator.domain.ports.task_registry_port import TaskRegistryPort, TaskSnapshotPort
 from simulator.domain.ports.transport_port import TransportPort
 from simulator.domain.ports.verification_port import VerificationPort
 
 __all__ = [
     "CaptureReplayPort",
+    "ClockPort",
     "ContractPort",
     "EventBusPort",
     "LoggingPort",
+    "MessageCodecPort",
     "TaskRegistryPort",
+    "TaskSnapshotPort",
     "TransportPort",
     "VerificationPort",
 ]
@@ -0,0 +1,15 @@
+"""Clock port. The system clock, or a virtual clock that makes runs discrete-event simulations."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class ClockPort(Protocol):
+    """Monotonic time in seconds (now) and nanoseconds (now_ns); sleep waits, or advances virtual time."""
+
+    def now(self) -> float: ...
+
+    def now_ns(self) -> int: ...
+
+    def sleep(self, seconds: float) -> None: ...
@@ -0,0 +1,21 @@
+"""Message codec port: wire encoding/decoding of message payloads, built from loaded contracts."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from simulator.domain.models.target_and_task import MessageEnvelope
+
+
+class MessageCodecPort(Protocol):
+    """Encode outbound messages to frame bodies; decode inbound frame bodies to typed fields.
+
+    encode raises ValueError when the message has no contract or its payload does not fit it.
+    decode returns (message_type, fields), or None when the bytes match no known message type.
+    """
+
+    def encode(self, message: "MessageEnvelope") -> bytes: ...
+    def decode(
+        self, data: bytes | memoryview, message_type: str | None = None
+    ) -> tuple[str, dict[str, object]] | None: ...
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
     from simulator.domain.models.target_and_task import MessageEnvelope
+    from simulator.domain.ports.codec_port import MessageCodecPort
 
 
 class ContractPort(Protocol):
@@ -13,3 +14,4 @@ class ContractPort(Protocol):
 
     def load_sources(self, sources: list[dict[str, Any]]) -> dict[str, Any]: ...
     def validate_message(self, message: "MessageEnvelope", bundle: dict[str, Any]) -> dict[str, Any]: ...
+    def codec(self, bundle: dict[str, Any]) -> "MessageCodecPort": ...
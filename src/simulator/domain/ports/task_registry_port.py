@@ -8,6 +8,15 @@ if TYPE_CHECKING:
     from simulator.domain.models.target_and_task import TaskDefinition
 
 
+class TaskSnapshotPort(Protocol):
+    """One immutable version of a registry's tasks; safe to read from any thread without locking."""
+
+    @property
+    def version(self) -> int: ...
+    def get(self, task_id: str) -> "TaskDefinition | None": ...
+    def list_tasks(self) -> list[dict[str, object]]: ...
+
+
 class TaskRegistryPort(Protocol):
     """Get and list registered tasks; register atomically; compose from base tasks (runtime, no restart)."""
 
@@ -16,3 +25,5 @@ class TaskRegistryPort(Protocol):
     def register_from_path(self, path: str) -> dict[str, object]: ...
     def compose(self, base_task_ids: list[str], overrides: dict[str, object]) -> dict[str, object]: ...
     def register_definition(self, definition: dict[str, object]) -> dict[str, object]: ...  # create from scratch
+    def refresh(self) -> dict[str, object]: ...  # re-sync with the backing store (changed sources only)
+    def snapshot(self) -> TaskSnapshotPort: ...  # current published version; a run pins it for its duration
@@ -2,21 +2,42 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
     from simulator.domain.models.run_models import ObservedInteractions
     from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
+    from simulator.domain.services.cancellation import RunDeadline
 
 
 class TransportPort(Protocol):
-    """Execute message send/receive for a target over a given protocol."""
+    """Execute message send/receive for a target over a given protocol (blocking or on an event loop).
+
+    messages may be a lazy iterator (repeat steps): client scripts consume it as they go, so a long
+    soak run never holds its whole script in memory. Modes that need random access materialize it.
+
+    deadline (optional) is the run's whole budget and cancellation token: every wait is sized by
+    deadline.timeout_sec(), and once deadline.stop_reason() is set the adapter stops and records it
+    in transport_errors.
+    """
 
     def execute(
         self,
         *,
         target: "TargetRef",
         protocol: str,
-        messages: list["MessageEnvelope"],
+        messages: Iterable["MessageEnvelope"],
+        timeout_ms: int,
+        deadline: "RunDeadline | None" = None,
+    ) -> "ObservedInteractions": ...
+
+    async def execute_async(
+        self,
+        *,
+        target: "TargetRef",
+        protocol: str,
+        messages: Iterable["MessageEnvelope"],
         timeout_ms: int,
+        deadline: "RunDeadline | None" = None,
     ) -> "ObservedInteractions": ...
@@ -1,5 +1,6 @@
 """Domain services. Stateless; depend only on ports."""
 
+from simulator.domain.services.load_generator import LoadProfile
 from simulator.domain.services.simulation_service import SimulationService
 
-__all__ = ["SimulationService"]
+__all__ = ["LoadProfile", "SimulationService"]
@@ -0,0 +1,108 @@
+"""Cooperative cancellation and whole-run deadlines, checked by RunWorkflow and the transports."""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from simulator.domain.ports.clock_port import ClockPort
+from simulator.domain.services.clock import SystemClock
+
+RUN_CANCELLED = "RUN_CANCELLED"
+RUN_DEADLINE_EXCEEDED = "RUN_DEADLINE_EXCEEDED"
+# Floor for a socket timeout derived from a nearly spent deadline (settimeout(0) means non-blocking).
+MIN_WAIT_SEC = 0.001
+
+
+class CancellationToken:
+    """
+    Set once by whoever owns the runs (UI, batch controller, pool shutdown); one token may cover
+    many runs. Runs poll cancelled between steps; transports blocked in a socket wait register an
+    on_cancel callback that wakes them (shutting the socket down), so cancel() takes effect
+    mid-receive rather than at the next timeout.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: dict[int, Callable[[], object]] = {}
+        self._ids = itertools.count()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Cancel every run holding this token. Idempotent; registered callbacks run on the calling thread."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks = list(self._callbacks.values())
+        for callback in callbacks:
+            try:
+                callback()
+            except OSError:
+                pass  # the socket it would wake is already closed
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until cancelled (True) or timeout elapses (False)."""
+        return self._event.wait(timeout)
+
+    @contextmanager
+    def on_cancel(self, callback: Callable[[], object]) -> Iterator[None]:
+        """Call callback if the token is cancelled while the block runs (at once if it already is)."""
+        with self._lock:
+            key = next(self._ids)
+            self._callbacks[key] = callback
+            already = self._event.is_set()
+        if already:
+            try:
+                callback()
+            except OSError:
+                pass
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._callbacks.pop(key, None)
+
+
+class RunDeadline:
+    """
+    One run's time budget and cancellation token. Transports size every wait with timeout_sec(),
+    so socket timeouts shrink as the budget is spent and a run ends within budget_sec however many
+    receives it has, and check stop_reason() before each step.
+    """
+
+    def __init__(
+        self,
+        budget_sec: float | None,
+        token: CancellationToken | None = None,
+        clock: ClockPort | None = None,
+    ) -> None:
+        self.token = token or CancellationToken()
+        self._clock = clock or SystemClock()
+        self._expires_at = None if budget_sec is None else self._clock.now() + max(0.0, budget_sec)
+
+    def remaining_sec(self) -> float | None:
+        """Seconds left in the budget (never negative); None if the run has no deadline."""
+        if self._expires_at is None:
+            return None
+        return max(0.0, self._expires_at - self._clock.now())
+
+    def timeout_sec(self, wait_sec: float) -> float:
+        """wait_sec, shortened to what is left of the budget."""
+        remaining = self.remaining_sec()
+        return wait_sec if remaining is None else max(MIN_WAIT_SEC, min(wait_sec, remaining))
+
+    def stop_reason(self) -> str | None:
+        """RUN_CANCELLED, RUN_DEADLINE_EXCEEDED, or None while the run may continue."""
+        if self.token.cancelled:
+            return RUN_CANCELLED
+        remaining = self.remaining_sec()
+        if remaining is not None and remaining <= 0:
+            return RUN_DEADLINE_EXCEEDED
+        return None
@@ -0,0 +1,72 @@
+"""Clocks implementing ClockPort: SystemClock (real time) and VirtualClock (discrete-event time)."""
+
+from __future__ import annotations
+
+import itertools
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_clock_ids = itertools.count()
+
+
+class SystemClock:
+    """time.monotonic / time.perf_counter_ns / time.sleep."""
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def now_ns(self) -> int:
+        return time.perf_counter_ns()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class VirtualClock:
+    """
+    Simulated time: sleep() returns at once after moving the clock forward, so a timeout or an
+    hour between heartbeats costs no wall time and every timestamp is reproducible.
+
+    branch() gives a block its own timeline starting at the current time: sleeps inside it advance
+    only that timeline, and the shared clock is unchanged when it ends. The periodic scheduler runs
+    each execution in a branch, so executions that overlap in simulated time do not serialize.
+    Virtual time is meant for one thread driving the simulation; sleeps from several threads
+    outside a branch would interleave nondeterministically.
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        # Kept in integer nanoseconds so sums of sleeps are exact and runs reproduce bit for bit.
+        self._now_ns = round(start * 1e9)
+        self._branch: ContextVar[int | None] = ContextVar(f"virtual_clock_{next(_clock_ids)}", default=None)
+
+    def now(self) -> float:
+        return self.now_ns() / 1e9
+
+    def now_ns(self) -> int:
+        local = self._branch.get()
+        return self._now_ns if local is None else local
+
+    def sleep(self, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        local = self._branch.get()
+        if local is None:
+            self._now_ns += round(seconds * 1e9)
+        else:
+            self._branch.set(local + round(seconds * 1e9))
+
+    def advance_to(self, when: float) -> None:
+        """Move the shared clock forward to when (never backwards)."""
+        self._now_ns = max(self._now_ns, round(when * 1e9))
+
+    @contextmanager
+    def branch(self, delay: float = 0.0) -> Iterator[None]:
+        """Run the block on a private timeline that starts delay seconds from now."""
+        token = self._branch.set(self.now_ns() + round(max(0.0, delay) * 1e9))
+        try:
+            yield
+        finally:
+            self._branch.reset(token)
@@ -0,0 +1,222 @@
+"""Compiled execution plans: the per-task work of a run done once per task version instead of per run."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from typing import Any, Union
+
+from simulator.domain.models.target_and_task import MessageEnvelope, TaskDefinition, TaskStep
+
+DEFAULT_STEP_TIMEOUT_MS = 5000
+
+
+def task_content_hash(task: TaskDefinition) -> str:
+    """sha256 over a canonical JSON form of the definition (content_hash itself excluded)."""
+    data = asdict(task)
+    data.pop("content_hash", None)
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+_TEMPLATE = re.compile(r"\$\{(\w+)\}")
+
+
+def substitute(value: Any, counters: dict[str, int]) -> Any:
+    """Copy of a payload value with ${name} replaced by counters[name] ("${i}" alone becomes the int)."""
+    if isinstance(value, str):
+        whole = _TEMPLATE.fullmatch(value)
+        if whole and whole.group(1) in counters:
+            return counters[whole.group(1)]
+        return _TEMPLATE.sub(lambda m: str(counters.get(m.group(1), m.group(0))), value)
+    if isinstance(value, dict):
+        return {k: substitute(v, counters) for k, v in value.items()}
+    if isinstance(value, list):
+        return [substitute(v, counters) for v in value]
+    return value
+
+
+def _has_template(value: Any) -> bool:
+    if isinstance(value, str):
+        return _TEMPLATE.search(value) is not None
+    if isinstance(value, dict):
+        return any(_has_template(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_has_template(v) for v in value)
+    return False
+
+
+@dataclass(frozen=True)
+class TemplatedSend:
+    """A send inside a repeat whose payload mentions a counter: a fresh envelope per iteration."""
+
+    envelope: MessageEnvelope
+
+
+@dataclass(frozen=True)
+class RepeatBlock:
+    """A repeat step compiled once; iter_messages() walks its body count times."""
+
+    count: int
+    counter: str
+    start: int
+    body: tuple[ScriptItem, ...]
+
+
+ScriptItem = Union[MessageEnvelope, TemplatedSend, RepeatBlock]
+
+
+def _walk(items: tuple[ScriptItem, ...], counters: dict[str, int]) -> Iterator[MessageEnvelope]:
+    for item in items:
+        if isinstance(item, RepeatBlock):
+            outer = counters.get(item.counter)
+            for n in range(item.start, item.start + item.count):
+                counters[item.counter] = n
+                yield from _walk(item.body, counters)
+            if outer is None:
+                counters.pop(item.counter, None)
+            else:
+                counters[item.counter] = outer
+        elif isinstance(item, TemplatedSend):
+            e = item.envelope
+            yield MessageEnvelope(e.message_type, e.direction, substitute(e.payload, counters), e.timeout_ms)
+        else:
+            yield item
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """
+    Everything a run needs from its task, built once per content hash.
+
+    The script is kept compact: a repeat step is one RepeatBlock however many iterations it runs, and
+    iter_messages() expands it lazily, so memory does not grow with the count. Static envelopes are
+    shared across iterations and runs, so transports memoize each send's encoded body per envelope
+    and later sends reuse the bytes. Each receive carries its step's deadline.
+    """
+
+    task_id: str
+    content_hash: str
+    script: tuple[ScriptItem, ...]
+    message_count: int  # messages iter_messages() yields, repeats expanded
+    expected_rules: tuple[dict[str, object], ...]
+    step_deadlines_ms: tuple[int, ...]  # one per send/receive step in task order (repeat bodies once)
+    timeout_ms: int  # longest step deadline: the default wait for steps without their own
+    budget_ms: int  # whole-run deadline: one connect plus every receive's deadline, repeats expanded
+    default_protocol: str
+
+    def iter_messages(self) -> Iterator[MessageEnvelope]:
+        """The run's message script, repeats expanded as it is consumed."""
+        return _walk(self.script, {})
+
+    @property
+    def repeats(self) -> bool:
+        """Whether the script holds a repeat step, i.e. whether iter_messages() expands anything."""
+        return any(isinstance(item, RepeatBlock) for item in self.script)
+
+
+@dataclass
+class _Compiler:
+    payloads: dict[str, dict[str, Any]]
+    deadlines: list[int] = field(default_factory=list)
+    rules: list[dict[str, object]] = field(default_factory=list)
+    longest_ms: int = 0
+    receive_ms: int = 0
+
+    def compile(self, steps: tuple[TaskStep, ...], repeat: int, in_loop: bool) -> tuple[tuple[ScriptItem, ...], int]:
+        """Script items for steps and how many messages they yield; rules scale by the enclosing repeats."""
+        items: list[ScriptItem] = []
+        count = 0
+        for step in steps:
+            self.longest_ms = max(self.longest_ms, step.timeout_ms)
+            if step.action == "repeat":
+                iterations = max(0, step.count)
+                body, per_iteration = self.compile(step.steps, repeat * iterations, True)
+                items.append(RepeatBlock(iterations, step.counter, step.start, body))
+                count += per_iteration * iterations
+            elif step.action == "send":
+                payload = self.payloads.get(step.payload_ref or "") or {}
+                envelope = MessageEnvelope(message_type=step.message_type, direction="send", payload=payload)
+                items.append(TemplatedSend(envelope) if in_loop and _has_template(payload) else envelope)
+                self.deadlines.append(step.timeout_ms)
+                count += 1
+            elif step.action == "receive_expectation" and step.expect:
+                items.append(
+                    MessageEnvelope(
+                        message_type=step.expect.message_type,
+                        direction="receive",
+                        payload={},
+                        timeout_ms=step.timeout_ms,
+                    )
+                )
+                self.deadlines.append(step.timeout_ms)
+                self.receive_ms += step.timeout_ms * repeat
+                count += 1
+            if step.expect:
+                self.rules.append({
+                    "message_type": step.expect.message_type,
+                    "direction": step.expect.direction,
+                    "expected_count": step.expect.expected_count * repeat,
+                    "comparison": step.expect.comparison,
+                })
+        return tuple(items), count
+
+
+def compile_plan(task: TaskDefinition, content_hash: str | None = None) -> ExecutionPlan:
+    """Build the plan for task: message script, count rules, and per-step deadlines."""
+    compiler = _Compiler(task.payloads)
+    script, message_count = compiler.compile(task.steps, 1, False)
+    return ExecutionPlan(
+        task_id=task.task_id,
+        content_hash=content_hash or task.content_hash or task_content_hash(task),
+        script=script,
+        message_count=message_count,
+        expected_rules=tuple(compiler.rules),
+        step_deadlines_ms=tuple(compiler.deadlines),
+        timeout_ms=compiler.longest_ms if task.steps else DEFAULT_STEP_TIMEOUT_MS,
+        budget_ms=(compiler.longest_ms if task.steps else DEFAULT_STEP_TIMEOUT_MS) + compiler.receive_ms,
+        default_protocol=str(task.defaults.get("protocol") or "tcp"),
+    )
+
+
+class ExecutionPlanCache:
+    """
+    One compiled plan per task_id, reused while the registry hands back the same content hash.
+
+    A task whose hash changed (edited file, re-registered definition) is recompiled on its next run
+    and the stale plan replaced. Definitions without a stamped content_hash are hashed per lookup.
+    """
+
+    def __init__(self) -> None:
+        self._plans: dict[str, ExecutionPlan] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, task: TaskDefinition) -> ExecutionPlan:
+        content_hash = task.content_hash or task_content_hash(task)
+        plan = self._plans.get(task.task_id)
+        if plan is not None and plan.content_hash == content_hash:
+            self.hits += 1
+            return plan
+        plan = compile_plan(task, content_hash)
+        with self._lock:
+            self._plans[task.task_id] = plan
+            self.misses += 1
+        return plan
+
+    def invalidate(self, task_ids: list[str] | None = None) -> None:
+        """Drop plans for task_ids (all plans when None)."""
+        with self._lock:
+            if task_ids is None:
+                self._plans.clear()
+            else:
+                for task_id in task_ids:
+                    self._plans.pop(task_id, None)
+
+    def __len__(self) -> int:
+        return len(self._plans)
@@ -0,0 +1,39 @@
+"""Latency statistics over observed interactions (request -> response pairs stamped by transports)."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Sequence
+
+PERCENTILES: tuple[float, ...] = (50.0, 90.0, 99.0)
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending sequence (0.0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return float(sorted_values[min(rank, len(sorted_values)) - 1])
+
+
+def summarize_values_ms(values_ns: Iterable[int]) -> dict[str, object]:
+    """count/min/mean/pNN/max in milliseconds for a collection of nanosecond durations."""
+    ordered = sorted(values_ns)
+    if not ordered:
+        return {"count": 0}
+    summary: dict[str, object] = {
+        "count": len(ordered),
+        "min_ms": ordered[0] / 1e6,
+        "mean_ms": sum(ordered) / len(ordered) / 1e6,
+    }
+    for pct in PERCENTILES:
+        summary[f"p{pct:g}_ms"] = percentile(ordered, pct) / 1e6
+    summary["max_ms"] = ordered[-1] / 1e6
+    return summary
+
+
+def summarize_latency(interactions: Iterable[dict[str, object]]) -> dict[str, object]:
+    """Latency summary over every receive carrying latency_ns; {"count": 0} when none were paired."""
+    return summarize_values_ms(
+        int(i["latency_ns"]) for i in interactions if isinstance(i.get("latency_ns"), int)
+    )
@@ -2,20 +2,307 @@
 
 from __future__ import annotations
 
+import heapq
+import queue
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+
 from simulator.domain.models.periodic_runtime import PeriodicTaskRuntime
+from simulator.domain.ports.clock_port import ClockPort
+from simulator.domain.services.clock import SystemClock, VirtualClock
+from simulator.domain.services.periodic_toggle_service import PeriodicToggleService
+
+OVERLAP_POLICIES = frozenset({"skip", "queue", "parallel"})
+DEFAULT_PERIODIC_WORKERS = 8
+
+_Key = tuple[str, str]  # (run_id, task_id)
+
+
+@dataclass
+class _Periodic:
+    """Mutable schedule state of one periodic task in one run (guarded by the scheduler lock)."""
+
+    runtime: PeriodicTaskRuntime
+    interval_s: float
+    generation: int = 0  # bumped to orphan heap entries when the task is paused or removed
+    active: bool = False
+    in_flight: int = 0
+    backlog: int = 0  # queue policy: fires waiting for the running execution to finish
+    fired: int = 0
+    executed: int = 0
+    skipped: int = 0
+    missed: int = 0  # grid ticks passed while the timer was behind (not fired)
+    errors: int = 0
+    busy_until: float = 0.0  # virtual time: when the latest execution ends
 
 
 class PeriodicScheduler:
-    """Per-run scheduler lifecycle; interval-driven task execution."""
+    """
+    Per-run scheduler lifecycle; interval-driven task execution.
+
+    One timer thread drives a min-heap of (due time, task) for every periodic task of every run;
+    execution happens on a small worker pool, so a slow task never delays another's fire. Fire
+    times sit on a fixed grid (start + k * interval): the next due time is computed from the
+    previous due time, not from when the fire happened, so the schedule does not drift. Ticks the
+    timer fell behind on are counted as missed rather than fired in a burst. overlap_policy decides
+    what a fire does while the previous execution is still running: skip drops it, queue runs it
+    once the running one ends, parallel starts another execution.
 
-    def __init__(self) -> None:
+    Pausing and removal are O(1): the task's generation is bumped and its stale heap entry is
+    discarded when it surfaces. With toggles, PeriodicToggleService changes pause or resume every
+    run's copy of a task before set_enabled returns; a resumed task fires immediately.
+
+    With a VirtualClock no threads are started: run_until() is a discrete-event loop that jumps the
+    clock from one due time to the next and executes inline, each execution on its own branch of
+    the clock, so a simulated day of periodic traffic takes only the CPU time its executions need.
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[PeriodicTaskRuntime], object] | None = None,
+        toggles: PeriodicToggleService | None = None,
+        workers: int = DEFAULT_PERIODIC_WORKERS,
+        clock: ClockPort | None = None,
+    ) -> None:
+        self._execute = execute
+        self._toggles = toggles
+        self._workers = max(1, workers)
+        self._clock = clock or SystemClock()
         self._running: set[str] = set()
+        self._tasks: dict[_Key, _Periodic] = {}
+        self._by_task: dict[str, set[_Key]] = {}
+        self._heap: list[tuple[float, int, _Key, int]] = []
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._work: queue.SimpleQueue[_Periodic | None] = queue.SimpleQueue()
+        self._threads: list[threading.Thread] = []
+        self._closed = False
+        if toggles is not None:
+            toggles.subscribe(self._on_toggle)
+
+    # -- lifecycle -----------------------------------------------------------------------------
 
     def start(self, run_id: str) -> None:
-        self._running.add(run_id)
+        with self._cond:
+            self._running.add(run_id)
+            for key, task in self._tasks.items():
+                if key[0] == run_id:
+                    self._schedule(task)
+            self._cond.notify()
 
     def stop(self, run_id: str) -> None:
-        self._running.discard(run_id)
+        """End the run: its periodic tasks are removed (executions already running finish)."""
+        with self._cond:
+            self._running.discard(run_id)
+            for key in [k for k in self._tasks if k[0] == run_id]:
+                self._remove(key)
 
     def is_running(self, run_id: str) -> bool:
         return run_id in self._running
+
+    def close(self) -> None:
+        """Stop the timer and worker threads."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        for _ in range(self._workers):
+            self._work.put(None)
+        for thread in self._threads:
+            thread.join(1.0)
+        self._threads = []
+
+    # -- periodic tasks ------------------------------------------------------------------------
+
+    def add(self, runtime: PeriodicTaskRuntime) -> str | None:
+        """Register (or replace) a periodic task for its run. Returns an error code if it is unusable."""
+        if runtime.interval_ms <= 0:
+            return "PERIODIC_INTERVAL_INVALID"
+        if runtime.overlap_policy not in OVERLAP_POLICIES:
+            return "PERIODIC_OVERLAP_POLICY_INVALID"
+        key = (runtime.run_id, runtime.task_id)
+        with self._cond:
+            self._ensure_threads()
+            if key in self._tasks:
+                self._remove(key)
+            task = _Periodic(runtime, runtime.interval_ms / 1000.0)
+            self._tasks[key] = task
+            self._by_task.setdefault(runtime.task_id, set()).add(key)
+            self._schedule(task)
+            self._cond.notify()
+        return None
+
+    def remove(self, run_id: str, task_id: str) -> None:
+        with self._cond:
+            self._remove((run_id, task_id))
+
+    def stats(self, run_id: str, task_id: str) -> dict[str, object] | None:
+        """Counters for one periodic task: fired, executed, skipped, missed, backlog, in_flight, errors."""
+        with self._cond:
+            task = self._tasks.get((run_id, task_id))
+            if task is None:
+                return None
+            return {
+                "active": task.active,
+                "fired": task.fired,
+                "executed": task.executed,
+                "skipped": task.skipped,
+                "missed": task.missed,
+                "backlog": task.backlog,
+                "in_flight": task.in_flight,
+                "errors": task.errors,
+            }
+
+    def _enabled(self, runtime: PeriodicTaskRuntime) -> bool:
+        toggled = self._toggles.state(runtime.task_id) if self._toggles is not None else None
+        return runtime.enabled if toggled is None else toggled
+
+    def _schedule(self, task: _Periodic, due: float | None = None) -> None:
+        """Activate task (lock held) if its run is running and it is enabled; first fire at due (default now)."""
+        if task.active or task.runtime.run_id not in self._running or not self._enabled(task.runtime):
+            return
+        task.active = True
+        task.generation += 1
+        self._push(task, self._clock.now() if due is None else due)
+
+    def _pause(self, task: _Periodic) -> None:
+        task.active = False
+        task.generation += 1
+        task.backlog = 0
+
+    def _remove(self, key: _Key) -> None:
+        task = self._tasks.pop(key, None)
+        if task is not None:
+            self._pause(task)
+            self._by_task[key[1]].discard(key)
+
+    def _push(self, task: _Periodic, due: float) -> None:
+        self._seq += 1
+        key = (task.runtime.run_id, task.runtime.task_id)
+        heapq.heappush(self._heap, (due, self._seq, key, task.generation))
+
+    def _on_toggle(self, task_id: str, enabled: bool) -> None:
+        with self._cond:
+            for key in self._by_task.get(task_id, ()):
+                task = self._tasks[key]
+                if enabled:
+                    self._schedule(task)
+                else:
+                    self._pause(task)
+            self._cond.notify()
+
+    # -- timer and workers ---------------------------------------------------------------------
+
+    def _ensure_threads(self) -> None:
+        if self._threads or isinstance(self._clock, VirtualClock):
+            return
+        self._threads.append(threading.Thread(target=self._timer_loop, name="periodic-timer", daemon=True))
+        for i in range(self._workers):
+            self._threads.append(threading.Thread(target=self._worker_loop, name=f"periodic-{i}", daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def _timer_loop(self) -> None:
+        # The lock is taken per fire, not per batch, so add/stop/toggle and finishing workers get in
+        # even while the timer is behind.
+        heap = self._heap
+        while True:
+            with self._cond:
+                if self._closed:
+                    return
+                if not heap:
+                    self._cond.wait()
+                    continue
+                now = self._clock.now()
+                due, _, key, generation = heap[0]
+                if due > now:
+                    self._cond.wait(due - now)
+                    continue
+                heapq.heappop(heap)
+                task = self._tasks.get(key)
+                if task is None or task.generation != generation:
+                    continue  # paused, removed, or replaced since this entry was pushed
+                self._fire(task)
+                next_due = due + task.interval_s
+                if next_due <= now:
+                    behind = int((now - due) // task.interval_s)
+                    task.missed += behind
+                    next_due = due + (behind + 1) * task.interval_s
+                self._push(task, next_due)
+
+    def _fire(self, task: _Periodic) -> None:
+        """Apply the overlap policy to one due tick (lock held)."""
+        task.fired += 1
+        if task.in_flight and task.runtime.overlap_policy == "skip":
+            task.skipped += 1
+        elif task.in_flight and task.runtime.overlap_policy == "queue":
+            task.backlog += 1
+        else:
+            task.in_flight += 1
+            self._work.put(task)
+
+    def _worker_loop(self) -> None:
+        while True:
+            task = self._work.get()
+            if task is None:
+                return
+            failed = False
+            try:
+                if self._execute is not None:
+                    self._execute(task.runtime)
+            except Exception:
+                failed = True
+            with self._cond:
+                task.executed += 1
+                task.errors += failed
+                if task.backlog and task.active:
+                    task.backlog -= 1
+                    self._work.put(task)  # queue policy: the next waiting fire runs now
+                else:
+                    task.in_flight -= 1
+
+    # -- discrete-event mode -------------------------------------------------------------------
+
+    def run_until(self, until: float) -> int:
+        """
+        Fire every tick due before virtual time until, in due order, then leave the clock at until.
+        Returns the number of ticks fired. An execution runs on a clock branch starting at its
+        tick and ends wherever its sleeps (transport latency, timeouts) took it; overlap_policy
+        applies against that end time: skip drops the tick, queue starts it at the end, parallel
+        starts it on time.
+        """
+        clock = self._clock
+        if not isinstance(clock, VirtualClock):
+            raise RuntimeError("run_until needs a VirtualClock")
+        fired = 0
+        while True:
+            with self._cond:
+                if self._closed or not self._heap or self._heap[0][0] >= until:
+                    break
+                due, _, key, generation = heapq.heappop(self._heap)
+                task = self._tasks.get(key)
+                if task is None or task.generation != generation:
+                    continue
+                clock.advance_to(due)
+                self._push(task, due + task.interval_s)
+                fired += 1
+                task.fired += 1
+                policy = task.runtime.overlap_policy
+                if due < task.busy_until and policy == "skip":
+                    task.skipped += 1
+                    continue
+                delay = task.busy_until - due if policy == "queue" else 0.0
+            failed = False
+            with clock.branch(delay):
+                try:
+                    if self._execute is not None:
+                        self._execute(task.runtime)
+                except Exception:
+                    failed = True
+                ended = clock.now()
+            with self._cond:
+                task.executed += 1
+                task.errors += failed
+                task.busy_until = max(task.busy_until, ended)
+        clock.advance_to(until)
+        return fired
@@ -2,15 +2,37 @@
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable
+
 
 class PeriodicToggleService:
-    """Toggle state applies immediately; overlap behavior matches policy."""
+    """Toggle state applies immediately; overlap behavior matches policy.
+
+    Listeners (e.g. PeriodicScheduler) are called synchronously on every change, so a scheduler
+    stops or resumes a task before set_enabled returns.
+    """
 
     def __init__(self) -> None:
         self._enabled: dict[str, bool] = {}
+        self._listeners: list[Callable[[str, bool], None]] = []
+        self._lock = threading.Lock()
 
     def set_enabled(self, task_id: str, enabled: bool) -> None:
-        self._enabled[task_id] = enabled
+        with self._lock:
+            self._enabled[task_id] = enabled
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(task_id, enabled)
 
     def is_enabled(self, task_id: str) -> bool:
         return self._enabled.get(task_id, False)
+
+    def state(self, task_id: str) -> bool | None:
+        """The toggle for task_id, or None if it was never set."""
+        return self._enabled.get(task_id)
+
+    def subscribe(self, listener: Callable[[str, bool], None]) -> None:
+        """Call listener(task_id, enabled) on every set_enabled."""
+        with self._lock:
+            self._listeners.append(listener)
@@ -0,0 +1,179 @@
+"""Bounded concurrent runs: a worker pool behind an admission limit, with per-target caps."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+
+from simulator.domain.models.run_models import RunInput
+from simulator.domain.services.cancellation import CancellationToken
+
+# Runs that may wait for a worker, per worker, before submit() blocks the caller.
+DEFAULT_QUEUED_RUNS_PER_WORKER = 4
+
+_Queued = tuple[RunInput, "Future[dict[str, object]]", "CancellationToken | None"]
+
+
+def failed_run_result(run_input: RunInput, error: BaseException) -> dict[str, object]:
+    """Result dict for a run whose workflow raised instead of returning."""
+    return {
+        "run_id": run_input.run_id,
+        "observed": {"interactions": [], "transport_errors": ["RUN_EXCEPTION"]},
+        "verification": {"passed": False, "summary": f"Run raised {type(error).__name__}: {error}", "mismatches": []},
+    }
+
+
+class RunPool:
+    """
+    Executes runs on at most max_concurrent worker threads, and at most max_per_target (or
+    target_limits[target_id]) at a time against any one target. A run waiting for its target does
+    not hold a worker: the dispatcher starts the oldest queued run whose target has room. Admission
+    is bounded too: once max_concurrent * (1 + queued_per_worker) runs are admitted but unfinished,
+    submit() blocks until one completes, so a long suite is fed in as capacity frees up.
+
+    Every run is executed as run_one(run_input, cancel=token) with a token of its own, linked to
+    the caller's cancel token when one was given. shutdown(wait=False) cancels the tokens of all
+    running runs (not the callers' tokens), so their workers return promptly.
+    """
+
+    def __init__(
+        self,
+        run_one: Callable[..., dict[str, object]],
+        max_concurrent: int,
+        max_per_target: int | None = None,
+        target_limits: Mapping[str, int] | None = None,
+        queued_per_worker: int = DEFAULT_QUEUED_RUNS_PER_WORKER,
+    ) -> None:
+        self._run_one = run_one
+        self._max_concurrent = max(1, max_concurrent)
+        self._max_per_target = max_per_target
+        self._target_limits = dict(target_limits or {})
+        self._admission = threading.BoundedSemaphore(self._max_concurrent * (1 + max(0, queued_per_worker)))
+        self._executor = ThreadPoolExecutor(max_workers=self._max_concurrent, thread_name_prefix="sim-run")
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._closed = False
+        self._queued: deque[_Queued] = deque()
+        self._run_tokens: set[CancellationToken] = set()  # one per running run
+        self._cancelling = False  # shutdown(wait=False) was called: runs starting now are cancelled at once
+        self._running = 0
+        self._per_target: dict[str, int] = {}
+
+    @property
+    def max_concurrent(self) -> int:
+        return self._max_concurrent
+
+    def _target_cap(self, target_id: str) -> int:
+        cap = self._target_limits.get(target_id, self._max_per_target)
+        return self._max_concurrent if cap is None else max(1, cap)
+
+    def submit(self, run_input: RunInput, cancel: CancellationToken | None = None) -> Future[dict[str, object]]:
+        """Queue one run; blocks while the admission limit is reached. The future holds the result dict."""
+        self._admission.acquire()
+        future: Future[dict[str, object]] = Future()
+        with self._lock:
+            if self._closed:
+                self._admission.release()
+                raise RuntimeError("run pool is shut down")
+            self._queued.append((run_input, future, cancel))
+            self._dispatch()
+        return future
+
+    def _dispatch(self) -> None:
+        """Start queued runs, oldest first, while workers are free and their targets have room (lock held)."""
+        skipped: list[_Queued] = []
+        while self._queued and self._running < self._max_concurrent:
+            queued = self._queued.popleft()
+            run_input = queued[0]
+            active = self._per_target.get(run_input.target_id, 0)
+            if active >= self._target_cap(run_input.target_id):
+                skipped.append(queued)
+                continue
+            self._running += 1
+            self._per_target[run_input.target_id] = active + 1
+            self._executor.submit(self._execute, *queued)
+        self._queued.extendleft(reversed(skipped))
+
+    def _execute(
+        self, run_input: RunInput, future: Future[dict[str, object]], cancel: CancellationToken | None
+    ) -> None:
+        token = CancellationToken()
+        try:
+            if future.set_running_or_notify_cancel():
+                with self._lock:
+                    self._run_tokens.add(token)
+                    cancelling = self._cancelling
+                if cancelling:
+                    token.cancel()
+                try:
+                    with nullcontext() if cancel is None else cancel.on_cancel(token.cancel):
+                        future.set_result(self._run_one(run_input, cancel=token))
+                except BaseException as e:  # handed to whoever waits on the future
+                    future.set_exception(e)
+        finally:
+            with self._lock:
+                self._run_tokens.discard(token)
+                self._running -= 1
+                self._per_target[run_input.target_id] -= 1
+                self._dispatch()
+                if not self._running:
+                    self._idle.notify_all()
+            self._admission.release()
+
+    def run_many(
+        self, run_inputs: Iterable[RunInput], cancel: CancellationToken | None = None
+    ) -> Iterator[dict[str, object]]:
+        """
+        Push run_inputs through the pool and yield each result dict as it completes (not in input
+        order). Inputs are consumed lazily as admission allows; a run that raised yields
+        failed_run_result instead of ending the stream. Cancelling cancel stops the runs in flight
+        and every later one (each ends at once with RUN_CANCELLED).
+        """
+        done: queue.SimpleQueue[tuple[RunInput, Future[dict[str, object]]]] = queue.SimpleQueue()
+        pending = 0
+
+        def collect(run_input: RunInput, future: Future[dict[str, object]]) -> dict[str, object]:
+            try:
+                return future.result()
+            except BaseException as e:
+                return failed_run_result(run_input, e)
+
+        for run_input in run_inputs:
+            future = self.submit(run_input, cancel)
+            future.add_done_callback(lambda f, r=run_input: done.put((r, f)))
+            pending += 1
+            while True:
+                try:
+                    finished = done.get_nowait()
+                except queue.Empty:
+                    break
+                pending -= 1
+                yield collect(*finished)
+        while pending:
+            pending -= 1
+            yield collect(*done.get())
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting runs. With wait, return once every admitted run has finished; else cancel
+        queued runs and every running one.
+        """
+        with self._lock:
+            self._closed = True
+            if wait:
+                while self._running or self._queued:
+                    self._idle.wait()
+            else:
+                self._cancelling = True
+                while self._queued:
+                    self._queued.popleft()[1].cancel()
+                    self._admission.release()
+                running = list(self._run_tokens)
+        if not wait:
+            for token in running:
+                token.cancel()
+        self._executor.shutdown(wait=wait)
@@ -2,15 +2,55 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
+
+from simulator.config.targets import DEFAULT_MAX_CONCURRENT_RUNS
 from simulator.domain.models.run_models import RunInput
-from simulator.workflows import RunWorkflow
+from simulator.domain.services.cancellation import CancellationToken
+from simulator.domain.services.load_generator import LoadProfile, run_open_loop
+from simulator.domain.services.run_pool import RunPool
+
+if TYPE_CHECKING:
+    from simulator.workflows import RunWorkflow
 
 
 class SimulationService:
-    """Facade over run/verify/task operations. Single API for GUI and TUI (FR-GR-026)."""
+    """Facade over run/verify/task operations. Single API for GUI and TUI (FR-GR-026).
+
+    submit() and run_many() share one RunPool, created on first use: at most max_concurrent_runs runs
+    at a time, and at most max_runs_per_target (or target_run_limits[target_id]) against one target.
+    Every run method takes an optional CancellationToken; cancelling it stops the runs holding it
+    (see RunWorkflow.run), and shutdown(wait=False) cancels the runs the pool is executing.
+    """
 
-    def __init__(self, run_workflow: RunWorkflow) -> None:
+    def __init__(
+        self,
+        run_workflow: RunWorkflow,
+        max_concurrent_runs: int = DEFAULT_MAX_CONCURRENT_RUNS,
+        max_runs_per_target: int | None = None,
+        target_run_limits: Mapping[str, int] | None = None,
+    ) -> None:
         self._workflow = run_workflow
+        self._max_concurrent_runs = max_concurrent_runs
+        self._max_runs_per_target = max_runs_per_target
+        self._target_run_limits = dict(target_run_limits or {})
+        self._pool: RunPool | None = None
+        self._pool_lock = threading.Lock()
+
+    def _run_pool(self) -> RunPool:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = RunPool(
+                    self._workflow.run,
+                    self._max_concurrent_runs,
+                    max_per_target=self._max_runs_per_target,
+                    target_limits=self._target_run_limits,
+                )
+            return self._pool
 
     def run(
         self,
@@ -19,6 +59,8 @@ class SimulationService:
         target_id: str,
         task_id: str,
         protocol: str = "tcp",
+        deadline_ms: int | None = None,
+        cancel: CancellationToken | None = None,
     ) -> dict[str, object]:
         """Execute one simulation run. Equivalent results for equivalent inputs from GUI or TUI."""
         run_input = RunInput(
@@ -26,13 +68,110 @@ class SimulationService:
             target_id=target_id,
             task_id=task_id,
             protocol=protocol,
+            deadline_ms=deadline_ms,
+        )
+        return self._workflow.run(run_input, cancel)
+
+    def submit(
+        self,
+        *,
+        run_id: str,
+        target_id: str,
+        task_id: str,
+        protocol: str = "tcp",
+        deadline_ms: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> Future[dict[str, object]]:
+        """Queue one run on the shared pool; the future resolves to run()'s result dict.
+
+        Blocks while the pool's admission limit is reached.
+        """
+        run_input = RunInput(run_id, target_id, task_id, protocol, deadline_ms)
+        return self._run_pool().submit(run_input, cancel)
+
+    def run_many(
+        self, runs: Iterable[RunInput], cancel: CancellationToken | None = None
+    ) -> Iterator[dict[str, object]]:
+        """Run a suite of (target, task) inputs at the configured parallelism; yields results as they complete."""
+        return self._run_pool().run_many(runs, cancel)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the run pool (if one was started); with wait, after admitted runs finish."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    async def run_async(
+        self,
+        *,
+        run_id: str,
+        target_id: str,
+        task_id: str,
+        protocol: str = "tcp",
+        deadline_ms: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> dict[str, object]:
+        """Execute one simulation run on the running event loop (many runs may be awaited concurrently)."""
+        run_input = RunInput(
+            run_id=run_id,
+            target_id=target_id,
+            task_id=task_id,
+            protocol=protocol,
+            deadline_ms=deadline_ms,
+        )
+        return await self._workflow.run_async(run_input, cancel)
+
+    async def run_load_async(
+        self,
+        *,
+        target_id: str,
+        task_id: str,
+        profile: LoadProfile,
+        protocol: str = "tcp",
+        run_id_prefix: str = "load",
+    ) -> dict[str, object]:
+        """Open-loop load: start runs on profile's arrival schedule regardless of how long each takes."""
+
+        async def run_one(i: int) -> dict[str, object]:
+            run_input = RunInput(
+                run_id=f"{run_id_prefix}-{i}",
+                target_id=target_id,
+                task_id=task_id,
+                protocol=protocol,
+            )
+            return await self._workflow.run_async(run_input)
+
+        return await run_open_loop(run_one, profile)
+
+    def run_load(
+        self,
+        *,
+        target_id: str,
+        task_id: str,
+        profile: LoadProfile,
+        protocol: str = "tcp",
+        run_id_prefix: str = "load",
+    ) -> dict[str, object]:
+        """Blocking wrapper over run_load_async (owns its event loop; do not call from a running loop)."""
+        return asyncio.run(
+            self.run_load_async(
+                target_id=target_id,
+                task_id=task_id,
+                profile=profile,
+                protocol=protocol,
+                run_id_prefix=run_id_prefix,
+            )
         )
-        return self._workflow.run(run_input)
 
     def list_tasks(self) -> list[dict[str, object]]:
         """List registered tasks. Delegates to workflow's task registry."""
         return self._workflow.list_tasks()
 
+    def refresh_tasks(self) -> dict[str, object]:
+        """Pick up added, changed, and deleted task files without restarting."""
+        return self._workflow.refresh_tasks()
+
     def load_task(self, path: str) -> dict[str, object]:
         """Load and register a task from a file path (runtime, without restart)."""
         return self._workflow.load_task(path)
@@ -5,8 +5,12 @@ SRS-FR-005, SRS-FR-020. Delegates to RunWorkflow for sequence execution.
 
 from __future__ import annotations
 
+from dataclasses import asdict
+
 from simulator.domain.models.run_models import RunInput
+from simulator.domain.models.simulation_entities import SequenceStepDefinition
 from simulator.workflows.run_workflow import RunWorkflow
+from simulator.workflows.sequence_runner import run_sequence, sequence_status
 
 
 class ExecutionOrchestrator:
@@ -19,3 +23,14 @@ class ExecutionOrchestrator:
         """Start a run (sequence of one task for MVP); returns run result."""
         run_input = RunInput(run_id=run_id, target_id=target_id, task_id=task_id, protocol=protocol)
         return self._workflow.run(run_input)
+
+    def start_sequence(
+        self,
+        run_id: str,
+        target_id: str,
+        steps: list[SequenceStepDefinition] | list[dict[str, object]],
+        protocol: str = "",
+    ) -> dict[str, object]:
+        """Run a sequence (independent steps concurrently); returns {run_id, status, steps}."""
+        results = run_sequence(steps, workflow=self._workflow, run_id=run_id, target_id=target_id, protocol=protocol)
+        return {"run_id": run_id, "status": sequence_status(steps, results), "steps": [asdict(r) for r in results]}
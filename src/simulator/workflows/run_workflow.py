@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Callable
 
 from simulator.domain.models.run_models import (
@@ -9,61 +10,39 @@ from simulator.domain.models.run_models import (
     RunInput,
     VerificationResult,
 )
-from simulator.domain.models.target_and_task import (
-    MessageEnvelope,
-    TargetRef,
-    TaskDefinition,
-)
+from simulator.domain.models.target_and_task import TargetRef, TaskDefinition
 from simulator.domain.ports import (
     CaptureReplayPort,
+    ClockPort,
     EventBusPort,
     LoggingPort,
     TaskRegistryPort,
     TransportPort,
     VerificationPort,
 )
+from simulator.domain.services.cancellation import RUN_CANCELLED, CancellationToken, RunDeadline
+from simulator.domain.services.clock import SystemClock
+from simulator.domain.services.execution_plan import ExecutionPlan, ExecutionPlanCache
+from simulator.domain.services.latency_stats import summarize_latency
 
 
-def _task_to_messages(task: TaskDefinition) -> list[MessageEnvelope]:
-    """Build ordered message list from task steps (send steps only for outbound)."""
-    messages: list[MessageEnvelope] = []
-    for step in task.steps:
-        if step.action == "send":
-            payload = task.payloads.get(step.payload_ref or "") or {}
-            messages.append(
-                MessageEnvelope(
-                    message_type=step.message_type,
-                    direction="send",
-                    payload=payload,
-                )
-            )
-        elif step.action == "receive_expectation" and step.expect:
-            messages.append(
-                MessageEnvelope(
-                    message_type=step.expect.message_type,
-                    direction="receive",
-                    payload={},
-                )
-            )
-    return messages
-
-
-def _task_to_expected_rules(task: TaskDefinition) -> list[dict[str, object]]:
-    """Build expected count rules from task steps (expect blocks)."""
-    rules: list[dict[str, object]] = []
-    for step in task.steps:
-        if step.expect:
-            rules.append({
-                "message_type": step.expect.message_type,
-                "direction": step.expect.direction,
-                "expected_count": step.expect.expected_count,
-                "comparison": step.expect.comparison,
-            })
-    return rules
+def _holds_whole_script(target: TargetRef, protocol: str) -> bool:
+    """Server mode and pipelined TCP correlate by script position, so they keep every expanded message."""
+    if protocol not in ("tcp", "udp"):
+        return False
+    return target.mode == "server" or (protocol == "tcp" and target.pipeline is not None)
 
 
 class RunWorkflow:
-    """Orchestrates a single simulation run using ports. Stateless; no mutable in-process state between runs."""
+    """Orchestrates a single simulation run using ports.
+
+    The only state kept between runs is the execution plan cache: each task is compiled once per
+    content hash (message script, count rules, step deadlines) and reused by every later run.
+    Each run resolves its task from the registry snapshot current when it started, so concurrent
+    runs never lock the registry and are unaffected by registrations or refreshes that follow.
+    Run duration (elapsed_ms) is read from clock; with a VirtualClock and a transport on the same
+    clock it is simulated time.
+    """
 
     def __init__(
         self,
@@ -75,6 +54,7 @@ class RunWorkflow:
         task_registry_port: TaskRegistryPort | None = None,
         target_resolver: Callable[[str], TargetRef | None] | None = None,
         capture_replay_port: CaptureReplayPort | None = None,
+        clock: ClockPort | None = None,
     ) -> None:
         self._verification = verification_port
         self._event_bus = event_bus
@@ -83,9 +63,87 @@ class RunWorkflow:
         self._task_registry = task_registry_port
         self._target_resolver = target_resolver
         self._capture_replay = capture_replay_port
+        self._clock = clock or SystemClock()
+        self._plans = ExecutionPlanCache()
+
+    @property
+    def plan_cache(self) -> ExecutionPlanCache:
+        return self._plans
 
-    def run(self, run_input: RunInput) -> dict[str, object]:
-        """Execute one run. Parameterized by run_input only; no coupling to one application model."""
+    def run(self, run_input: RunInput, cancel: CancellationToken | None = None) -> dict[str, object]:
+        """Execute one run. Parameterized by run_input only; no coupling to one application model.
+
+        The run ends within its deadline (run_input.deadline_ms, else the plan's budget_ms): every
+        transport wait is cut to the budget left. Cancelling cancel stops it at once, a blocked
+        receive included. Either way the result records RUN_DEADLINE_EXCEEDED or RUN_CANCELLED in
+        transport_errors, keeping whatever was observed before the stop.
+        """
+        prepared = self._prepare(run_input)
+        if isinstance(prepared, dict):
+            return prepared
+        target, plan, protocol = prepared
+        started_ns = self._clock.now_ns()
+        deadline = self._deadline(run_input, plan, cancel)
+
+        # Transport execution (UDP/TCP)
+        if self._transport:
+            observed: ObservedInteractions = self._transport.execute(
+                target=target,
+                protocol=protocol,
+                messages=plan.iter_messages(),
+                timeout_ms=plan.timeout_ms,
+                deadline=deadline,
+            )
+        else:
+            observed = ObservedInteractions(interactions=(), transport_errors=())
+        return self._complete(run_input, plan, protocol, observed, started_ns)
+
+    async def run_async(self, run_input: RunInput, cancel: CancellationToken | None = None) -> dict[str, object]:
+        """Execute one run on the running event loop. Same result shape, deadline and cancellation as run().
+
+        cancel may be cancelled from any thread; the transport coroutine is cancelled on its loop.
+        """
+        prepared = self._prepare(run_input)
+        if isinstance(prepared, dict):
+            return prepared
+        target, plan, protocol = prepared
+        started_ns = self._clock.now_ns()
+        deadline = self._deadline(run_input, plan, cancel)
+
+        if self._transport:
+            loop = asyncio.get_running_loop()
+            exchange = asyncio.ensure_future(
+                self._transport.execute_async(
+                    target=target,
+                    protocol=protocol,
+                    messages=plan.iter_messages(),
+                    timeout_ms=plan.timeout_ms,
+                    deadline=deadline,
+                )
+            )
+            with deadline.token.on_cancel(lambda: loop.call_soon_threadsafe(exchange.cancel)):
+                try:
+                    observed = await exchange
+                except asyncio.CancelledError:
+                    if not (deadline.token.cancelled and exchange.cancelled()):
+                        raise
+                    observed = ObservedInteractions(interactions=(), transport_errors=(RUN_CANCELLED,))
+        else:
+            observed = ObservedInteractions(interactions=(), transport_errors=())
+        return self._complete(run_input, plan, protocol, observed, started_ns)
+
+    def _deadline(self, run_input: RunInput, plan: ExecutionPlan, cancel: CancellationToken | None) -> RunDeadline:
+        budget_ms = plan.budget_ms if run_input.deadline_ms is None else run_input.deadline_ms
+        return RunDeadline(budget_ms / 1000.0, cancel, self._clock)
+
+    def _prepare(
+        self, run_input: RunInput
+    ) -> tuple[TargetRef, ExecutionPlan, str] | dict[str, object]:
+        """Announce the run and resolve target and plan.
+
+        Returns a failure result dict if either is missing, or if the plan repeats steps and the target's
+        mode would hold the whole expanded script (see _holds_whole_script).
+        """
         self._event_bus.publish(
             {"event_type": "RunStarted", "run_id": run_input.run_id}
         )
@@ -108,10 +166,10 @@ class RunWorkflow:
                 "verification": {"passed": False, "summary": "Target not found", "mismatches": []},
             }
 
-        # Resolve task (registered-task-only execution)
+        # Resolve task (registered-task-only execution) from the snapshot this run pins
         task: TaskDefinition | None = None
         if self._task_registry:
-            task = self._task_registry.get(run_input.task_id)
+            task = self._task_registry.snapshot().get(run_input.task_id)
         if not task:
             self._logger.error("RUN_FAILED", run_id=run_input.run_id, error="TASK_NOT_FOUND")
             return {
@@ -120,24 +178,32 @@ class RunWorkflow:
                 "verification": {"passed": False, "summary": "Task not found", "mismatches": []},
             }
 
-        protocol = run_input.protocol or str(task.defaults.get("protocol") or "tcp")
-        timeout_ms = max((s.timeout_ms for s in task.steps), default=5000)
-
-        # Transport execution (UDP/TCP)
-        if self._transport:
-            messages = _task_to_messages(task)
-            observed: ObservedInteractions = self._transport.execute(
-                target=target,
-                protocol=protocol,
-                messages=messages,
-                timeout_ms=timeout_ms,
-            )
-        else:
-            observed = ObservedInteractions(interactions=(), transport_errors=())
+        plan = self._plans.get(task)
+        protocol = run_input.protocol or plan.default_protocol
+        if plan.repeats and _holds_whole_script(target, protocol):
+            self._logger.error("RUN_FAILED", run_id=run_input.run_id, error="TRANSPORT_REPEAT_UNSUPPORTED")
+            return {
+                "run_id": run_input.run_id,
+                "observed": {"interactions": [], "transport_errors": ["TRANSPORT_REPEAT_UNSUPPORTED"]},
+                "verification": {
+                    "passed": False,
+                    "summary": "Repeat steps need a client-mode target without pipelining",
+                    "mismatches": [],
+                },
+            }
+        return target, plan, protocol
 
-        expected_rules = _task_to_expected_rules(task)
+    def _complete(
+        self,
+        run_input: RunInput,
+        plan: ExecutionPlan,
+        protocol: str,
+        observed: ObservedInteractions,
+        started_ns: int,
+    ) -> dict[str, object]:
+        """Verify observed interactions, announce completion, and build the run result."""
         verification: VerificationResult = self._verification.verify_count_rules(
-            expected=expected_rules,
+            expected=list(plan.expected_rules),
             observed=observed,
         )
 
@@ -161,8 +227,10 @@ class RunWorkflow:
                 "summary": verification.summary,
                 "mismatches": list(verification.mismatches),
             },
+            "latency": summarize_latency(observed.interactions),
+            "elapsed_ms": (self._clock.now_ns() - started_ns) / 1e6,
         }
-        if self._capture_replay and target:
+        if self._capture_replay:
             cap = self._capture_replay.write_capture(
                 run_id=run_input.run_id,
                 target_id=run_input.target_id,
@@ -180,6 +248,16 @@ class RunWorkflow:
             return []
         return self._task_registry.list_tasks()
 
+    def refresh_tasks(self) -> dict[str, object]:
+        """Re-sync the task registry with its source (only changed definitions are re-parsed)."""
+        if self._task_registry is None:
+            return {"ok": False, "error_code": "NO_REGISTRY"}
+        report = self._task_registry.refresh()
+        removed = report.get("removed")
+        if isinstance(removed, list) and removed:
+            self._plans.invalidate(removed)
+        return report
+
     def load_task(self, path: str) -> dict[str, object]:
         """Load and register a task from path (runtime, without restart)."""
         if self._task_registry is None:
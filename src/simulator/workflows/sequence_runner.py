@@ -1,17 +1,135 @@
-"""Deterministic sequence step runner by order_index (TKT-C03-01)."""
+"""Sequence runner: steps run through RunWorkflow as their dependencies finish (TKT-C03-01)."""
 
 from __future__ import annotations
 
+from collections import Counter
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import TYPE_CHECKING
+
+from simulator.domain.models.run_models import RunInput
+from simulator.domain.models.simulation_entities import SequenceStepDefinition
 from simulator.domain.models.step_result import StepResult
-from simulator.workflows.step_executor import execute_step
+from simulator.domain.services.run_pool import RunPool
+from simulator.domain.services.run_summary_builder import build_run_status
+from simulator.workflows.step_executor import execute_step, step_result_from_run
+
+if TYPE_CHECKING:
+    from simulator.workflows.run_workflow import RunWorkflow
+
+DEFAULT_MAX_PARALLEL_STEPS = 4
 
 
-def run_sequence(steps: list[dict[str, object]]) -> list[StepResult]:
-    """Execute steps strictly by order_index; return lifecycle state per step."""
-    ordered = sorted(steps, key=lambda s: s.get("order_index", 0))
-    results: list[StepResult] = []
+def _step_from(step: SequenceStepDefinition | Mapping[str, object], position: int) -> SequenceStepDefinition:
+    if isinstance(step, SequenceStepDefinition):
+        return step
+    depends_on = step.get("depends_on")
+    return SequenceStepDefinition(
+        order_index=int(step.get("order_index", position)),  # type: ignore[call-overload]
+        task_ref=str(step.get("task_ref", "")),
+        failure_policy=str(step.get("failure_policy", "stop")),
+        target_ref=str(step.get("target_ref", "")),
+        depends_on=None if depends_on is None else tuple(int(i) for i in depends_on),  # type: ignore[attr-defined]
+    )
+
+
+def _dependencies(ordered: list[SequenceStepDefinition]) -> dict[int, frozenset[int]]:
+    """order_index -> the order_indexes it waits for (undeclared: the previous step)."""
+    deps: dict[int, frozenset[int]] = {}
     for i, step in enumerate(ordered):
-        idx = step.get("order_index", i)
-        task_ref = step.get("task_ref", "")
-        results.append(execute_step(idx, task_ref))
-    return results
+        if step.depends_on is None:
+            deps[step.order_index] = frozenset([ordered[i - 1].order_index]) if i else frozenset()
+        else:
+            deps[step.order_index] = frozenset(step.depends_on)
+    return deps
+
+
+def run_sequence(
+    steps: list[SequenceStepDefinition] | list[dict[str, object]],
+    *,
+    workflow: RunWorkflow | None = None,
+    run_id: str = "sequence",
+    target_id: str = "",
+    protocol: str = "",
+    max_parallel: int = DEFAULT_MAX_PARALLEL_STEPS,
+    max_per_target: int | None = None,
+) -> list[StepResult]:
+    """
+    Execute steps through workflow; return one StepResult per step, by order_index.
+
+    A step starts as soon as every step in its depends_on has finished, so independent steps run
+    concurrently (at most max_parallel at a time, max_per_target against one target) and the
+    sequence takes its critical path rather than the sum of its steps. A step without depends_on
+    waits for the previous one, which keeps undeclared sequences strictly ordered. When a step with
+    failure_policy "stop" fails, no further step starts (running ones finish) and the rest are
+    SKIP; "continue" lets later steps, dependents included, run. Steps whose dependencies can never
+    finish (unknown order_index or a cycle) fail with SEQUENCE_DEPENDENCY_INVALID. If two steps share
+    an order_index nothing runs and every step fails with SEQUENCE_DUPLICATE_ORDER_INDEX.
+
+    Without a workflow no task runs: every step fails with SEQUENCE_NO_WORKFLOW.
+    """
+    ordered = sorted((_step_from(s, i) for i, s in enumerate(steps)), key=lambda s: s.order_index)
+    duplicated = sorted(i for i, n in Counter(s.order_index for s in ordered).items() if n > 1)
+    if duplicated:
+        return [
+            StepResult(s.order_index, "failed", "FAIL", {
+                "task_id": s.task_ref,
+                "error_code": "SEQUENCE_DUPLICATE_ORDER_INDEX",
+                "message": f"order_index values used by more than one step: {duplicated}",
+            })
+            for s in ordered
+        ]
+    if workflow is None:
+        return [execute_step(s.order_index, s.task_ref) for s in ordered]
+    by_index = {s.order_index: s for s in ordered}
+    waiting = _dependencies(ordered)
+    done: dict[int, StepResult] = {}
+    running: dict[Future[dict[str, object]], SequenceStepDefinition] = {}
+    stopped = False
+    pool = RunPool(workflow.run, max_parallel, max_per_target=max_per_target)
+    try:
+        while True:
+            if not stopped:
+                ready = [i for i, deps in waiting.items() if deps <= done.keys()]
+                for i in ready:
+                    del waiting[i]
+                    step = by_index[i]
+                    run_input = RunInput(
+                        run_id=f"{run_id}-{i}",
+                        target_id=step.target_ref or target_id,
+                        task_id=step.task_ref,
+                        protocol=protocol,
+                    )
+                    running[pool.submit(run_input)] = step
+            if not running:
+                break
+            finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in finished:
+                step = running.pop(future)
+                try:
+                    result = step_result_from_run(step.order_index, step.task_ref, future.result())
+                except Exception as e:
+                    evidence = {"task_id": step.task_ref, "error_code": "RUN_EXCEPTION", "message": str(e)}
+                    result = StepResult(step.order_index, "failed", "FAIL", evidence)
+                done[step.order_index] = result
+                if result.verdict == "FAIL" and step.failure_policy != "continue":
+                    stopped = True
+    finally:
+        pool.shutdown()
+    for i in waiting:
+        if stopped:
+            done[i] = StepResult(i, "skipped", "SKIP", {"task_id": by_index[i].task_ref})
+        else:
+            evidence = {"task_id": by_index[i].task_ref, "error_code": "SEQUENCE_DEPENDENCY_INVALID"}
+            done[i] = StepResult(i, "failed", "FAIL", evidence)
+    return [done[s.order_index] for s in ordered]
+
+
+def sequence_status(
+    steps: list[SequenceStepDefinition] | list[dict[str, object]], results: list[StepResult]
+) -> str:
+    """build_run_status for a sequence: FAIL if a failed step's policy is stop, else PASS or COMPLETE_WITH_FAILURES."""
+    policies = {s.order_index: s.failure_policy for s in (_step_from(x, i) for i, x in enumerate(steps))}
+    failed = [r for r in results if r.verdict == "FAIL"]
+    policy = "continue" if failed and all(policies.get(r.order_index) == "continue" for r in failed) else "stop"
+    return build_run_status(results, failure_policy=policy)
@@ -2,15 +2,43 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from simulator.domain.models.run_models import RunInput
 from simulator.domain.models.step_result import StepResult
 
+if TYPE_CHECKING:
+    from simulator.workflows.run_workflow import RunWorkflow
+
+
+def step_result_from_run(order_index: int, task_id: str, result: dict[str, object]) -> StepResult:
+    """Map a RunWorkflow result dict to the step's lifecycle state, verdict, and evidence."""
+    verification = result.get("verification") or {}
+    observed = result.get("observed") or {}
+    passed = isinstance(verification, dict) and bool(verification.get("passed"))
+    evidence = {
+        "task_id": task_id,
+        "run_id": result.get("run_id"),
+        "summary": verification.get("summary", "") if isinstance(verification, dict) else "",
+        "transport_errors": list(observed.get("transport_errors", ())) if isinstance(observed, dict) else [],
+    }
+    verdict = "PASS" if passed else "FAIL"
+    return StepResult(order_index=order_index, state="completed", verdict=verdict, evidence=evidence)
+
 
 def execute_step(
     order_index: int,
     task_id: str,
     *,
-    transport_send_receive: object = None,
-    verify: object = None,
+    workflow: RunWorkflow | None = None,
+    run_id: str = "",
+    target_id: str = "",
+    protocol: str = "",
 ) -> StepResult:
-    """Execute one step; returns lifecycle state output. Delegates to workflow in practice."""
-    return StepResult(order_index=order_index, state="completed", verdict="PASS", evidence={"task_id": task_id})
+    """Execute one step through workflow; returns lifecycle state output."""
+    if workflow is None:
+        return StepResult(order_index, "failed", "FAIL", {"task_id": task_id, "error_code": "SEQUENCE_NO_WORKFLOW"})
+    run_input = RunInput(
+        run_id=run_id or f"step-{order_index}", target_id=target_id, task_id=task_id, protocol=protocol
+    )
+    return step_result_from_run(order_index, task_id, workflow.run(run_input))
@@ -0,0 +1,122 @@
+"""Integration: asyncio transport adapters and RunWorkflow.run_async."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from simulator.adapters.events import InMemoryEventBus
+from simulator.adapters.logging import ConsoleLoggingAdapter
+from simulator.adapters.tasks import FileTaskRegistryAdapter
+from simulator.adapters.transport import MemoryTransportAdapter
+from simulator.adapters.transport.composite_transport import CompositeTransportAdapter
+from simulator.adapters.verification import CountVerificationAdapter
+from simulator.domain.models.run_models import RunInput
+from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
+from simulator.workflows import RunWorkflow
+
+PING = [
+    MessageEnvelope(message_type="PingRequest", direction="send", payload={"id": 1}),
+    MessageEnvelope(message_type="PingResponse", direction="receive", payload={}),
+]
+
+
+def _target(port: int, protocol: str = "tcp", mode: str = "client") -> TargetRef:
+    return TargetRef(target_id="t", name="t", host="127.0.0.1", port=port, protocol=protocol, mode=mode)
+
+
+async def _echo(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    data = await reader.readline()
+    writer.write(data)
+    await writer.drain()
+    writer.close()
+
+
+def test_many_concurrent_tcp_client_runs() -> None:
+    async def scenario() -> list:
+        server = await asyncio.start_server(_echo, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        adapter = CompositeTransportAdapter()
+        try:
+            return await asyncio.gather(*(
+                adapter.execute_async(target=_target(port), protocol="tcp", messages=PING, timeout_ms=2000)
+                for _ in range(200)
+            ))
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    results = asyncio.run(scenario())
+    assert len(results) == 200
+    for observed in results:
+        assert observed.transport_errors == ()
+        assert [i["direction"] for i in observed.interactions] == ["send", "receive"]
+
+
+def test_tcp_client_refused_maps_error() -> None:
+    observed = asyncio.run(
+        CompositeTransportAdapter().execute_async(target=_target(1), protocol="tcp", messages=PING, timeout_ms=500)
+    )
+    assert observed.transport_errors == ("TRANSPORT_CONNECTION_REFUSED",)
+
+
+def test_udp_client_round_trip() -> None:
+    class Echo(asyncio.DatagramProtocol):
+        def connection_made(self, transport: asyncio.BaseTransport) -> None:
+            self.transport = transport
+
+        def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+            self.transport.sendto(data, addr)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(Echo, local_addr=("127.0.0.1", 0))
+        port = transport.get_extra_info("sockname")[1]
+        try:
+            return await CompositeTransportAdapter().execute_async(
+                target=_target(port, "udp"), protocol="udp", messages=PING, timeout_ms=1000
+            )
+        finally:
+            transport.close()
+
+    observed = asyncio.run(scenario())
+    assert observed.transport_errors == ()
+    assert len(observed.interactions) == 2
+
+
+def test_run_workflow_run_async_matches_run_shape() -> None:
+    workflow = RunWorkflow(
+        verification_port=CountVerificationAdapter(),
+        event_bus=InMemoryEventBus(),
+        logger=ConsoleLoggingAdapter(),
+        transport_port=CompositeTransportAdapter(),
+        task_registry_port=FileTaskRegistryAdapter(),
+        target_resolver=lambda target_id: _target(1),
+    )
+
+    async def scenario() -> list[dict[str, object]]:
+        return await asyncio.gather(*(
+            workflow.run_async(RunInput(run_id=f"r{i}", target_id="t", task_id="ping-smoke", protocol="tcp"))
+            for i in range(20)
+        ))
+
+    results = asyncio.run(scenario())
+    assert [r["run_id"] for r in results] == [f"r{i}" for i in range(20)]
+    for r in results:
+        assert r["observed"]["transport_errors"] == ["TRANSPORT_CONNECTION_REFUSED"]
+        assert r["verification"]["passed"] is False
+
+
+def test_memory_transport_waits_do_not_block_the_event_loop() -> None:
+    adapter = MemoryTransportAdapter(latency_ms=100)
+
+    async def scenario() -> list:
+        return await asyncio.gather(*(
+            adapter.execute_async(target=_target(0, "mem"), protocol="mem", messages=PING, timeout_ms=1000)
+            for _ in range(20)
+        ))
+
+    started = time.perf_counter()
+    results = asyncio.run(scenario())
+    assert time.perf_counter() - started < 1.0  # the 100ms waits overlap instead of adding up to 2s
+    assert all(observed.transport_errors == () and len(observed.interactions) == 2 for observed in results)
@@ -0,0 +1,226 @@
+"""Integration: whole-run deadlines and cancellation (RunDeadline, CancellationToken) across transports."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+import time
+from dataclasses import replace
+
+from simulator.adapters.events import InMemoryEventBus
+from simulator.adapters.tasks import FileTaskRegistryAdapter
+from simulator.adapters.transport import CompositeTransportAdapter, MemoryTransportAdapter
+from simulator.adapters.transport.tcp.async_adapter import AsyncTcpTransportAdapter
+from simulator.adapters.verification import CountVerificationAdapter
+from simulator.domain.models.run_models import ObservedInteractions, RunInput
+from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
+from simulator.domain.services.cancellation import (
+    RUN_CANCELLED,
+    RUN_DEADLINE_EXCEEDED,
+    CancellationToken,
+    RunDeadline,
+)
+from simulator.domain.services.clock import VirtualClock
+from simulator.workflows import RunWorkflow
+
+# One request, then three replies the silent peer never sends (each step may wait 2s).
+SCRIPT = [MessageEnvelope(message_type="PingRequest", direction="send", payload={"id": 1})] + [
+    MessageEnvelope(message_type="PingResponse", direction="receive", payload={}, timeout_ms=2000)
+    for _ in range(3)
+]
+
+
+class QuietLogger:
+    def info(self, event: str, **fields: object) -> None: ...
+    def warn(self, event: str, **fields: object) -> None: ...
+    def error(self, event: str, **fields: object) -> None: ...
+
+
+def _silent_peer(kind: int) -> tuple[socket.socket, int]:
+    """A bound socket that accepts (TCP) or receives (UDP) but never answers."""
+    sock = socket.socket(socket.AF_INET, kind)
+    sock.bind(("127.0.0.1", 0))
+    if kind == socket.SOCK_STREAM:
+        sock.listen(1)
+    return sock, sock.getsockname()[1]
+
+
+def _target(port: int, protocol: str) -> TargetRef:
+    return TargetRef(target_id="t", name="t", host="127.0.0.1", port=port, protocol=protocol, mode="client")
+
+
+def test_deadline_bounds_a_run_with_several_receives() -> None:
+    for protocol, kind in (("tcp", socket.SOCK_STREAM), ("udp", socket.SOCK_DGRAM)):
+        peer, port = _silent_peer(kind)
+        try:
+            started = time.perf_counter()
+            observed = CompositeTransportAdapter().execute(
+                target=_target(port, protocol),
+                protocol=protocol,
+                messages=SCRIPT,
+                timeout_ms=2000,
+                deadline=RunDeadline(0.3),
+            )
+            elapsed = time.perf_counter() - started
+        finally:
+            peer.close()
+        assert elapsed < 1.5, (protocol, elapsed)  # not 3 x 2s
+        assert RUN_DEADLINE_EXCEEDED in observed.transport_errors, (protocol, observed)
+        assert [i["direction"] for i in observed.interactions] == ["send"]
+
+
+def test_cancel_wakes_a_blocked_receive() -> None:
+    for protocol, kind in (("tcp", socket.SOCK_STREAM), ("udp", socket.SOCK_DGRAM)):
+        peer, port = _silent_peer(kind)
+        token = CancellationToken()
+        timer = threading.Timer(0.2, token.cancel)
+        try:
+            timer.start()
+            started = time.perf_counter()
+            observed = CompositeTransportAdapter().execute(
+                target=_target(port, protocol),
+                protocol=protocol,
+                messages=SCRIPT,
+                timeout_ms=2000,
+                deadline=RunDeadline(None, token),
+            )
+            elapsed = time.perf_counter() - started
+        finally:
+            timer.cancel()
+            peer.close()
+        assert elapsed < 1.0, (protocol, elapsed)  # woken mid-receive, not at the 2s timeout
+        assert RUN_CANCELLED in observed.transport_errors, (protocol, observed)
+
+
+def test_async_tcp_deadline_bounds_client_pipelined_and_server_runs() -> None:
+    adapter = AsyncTcpTransportAdapter()
+
+    async def run(target: TargetRef, deadline: RunDeadline) -> tuple[float, ObservedInteractions]:
+        started = time.perf_counter()
+        observed = await adapter.execute_async(
+            target=target, protocol="tcp", messages=SCRIPT, timeout_ms=2000, deadline=deadline
+        )
+        return time.perf_counter() - started, observed
+
+    peer, port = _silent_peer(socket.SOCK_STREAM)
+    try:
+        for target in (_target(port, "tcp"), replace(_target(port, "tcp"), pipeline={})):
+            elapsed, observed = asyncio.run(run(target, RunDeadline(0.3)))
+            assert elapsed < 1.5, (target, elapsed)  # not 3 x 2s
+            assert RUN_DEADLINE_EXCEEDED in observed.transport_errors, (target, observed)
+    finally:
+        peer.close()
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = replace(_target(port, "tcp"), mode="server")
+
+    def silent_client() -> None:
+        time.sleep(0.1)
+        with socket.create_connection(("127.0.0.1", port)):
+            time.sleep(1.5)
+
+    client = threading.Thread(target=silent_client, daemon=True)
+    client.start()
+    elapsed, observed = asyncio.run(run(server, RunDeadline(0.5)))
+    client.join()
+    assert elapsed < 1.5, elapsed
+    assert RUN_DEADLINE_EXCEEDED in observed.transport_errors, observed
+
+
+def test_cancel_wakes_a_blocked_async_tcp_receive() -> None:
+    peer, port = _silent_peer(socket.SOCK_STREAM)
+    token = CancellationToken()
+    timer = threading.Timer(0.2, token.cancel)
+    try:
+        timer.start()
+        started = time.perf_counter()
+        observed = asyncio.run(AsyncTcpTransportAdapter().execute_async(
+            target=_target(port, "tcp"),
+            protocol="tcp",
+            messages=SCRIPT,
+            timeout_ms=2000,
+            deadline=RunDeadline(None, token),
+        ))
+        elapsed = time.perf_counter() - started
+    finally:
+        timer.cancel()
+        peer.close()
+    assert elapsed < 1.0, elapsed  # woken mid-receive, not at the 2s timeout
+    assert RUN_CANCELLED in observed.transport_errors, observed
+
+
+def _mem_workflow(clock: VirtualClock) -> RunWorkflow:
+    workflow = RunWorkflow(
+        verification_port=CountVerificationAdapter(),
+        event_bus=InMemoryEventBus(),
+        logger=QuietLogger(),
+        transport_port=MemoryTransportAdapter(clock=clock, responder=lambda _: None),
+        task_registry_port=FileTaskRegistryAdapter(),
+        target_resolver=lambda _: TargetRef("t", "t", "mem", 0, "mem", "client"),
+        clock=clock,
+    )
+    steps: list[dict[str, object]] = [
+        {"step_id": "s0", "action": "send", "message_type": "Ping", "payload_ref": "p", "timeout_ms": 1000}
+    ]
+    for i in range(3):
+        steps.append({
+            "step_id": f"r{i}",
+            "action": "receive_expectation",
+            "message_type": "Pong",
+            "expect": {"matcher": {"direction": "receive", "message_type": "Pong"}, "expected_count": 3},
+            "timeout_ms": 30_000,
+        })
+    registered = workflow.create_task({"task_id": "slow", "name": "slow", "steps": steps, "payloads": {"p": {}}})
+    assert registered["ok"], registered
+    return workflow
+
+
+def test_run_deadline_cuts_receive_waits_in_virtual_time() -> None:
+    clock = VirtualClock()
+    workflow = _mem_workflow(clock)
+    bounded = workflow.run(RunInput("bounded", "t", "slow", "mem", deadline_ms=45_000))
+    assert bounded["elapsed_ms"] == 45_000.0  # 30s, then the 15s left of the budget
+    assert bounded["observed"]["transport_errors"][-1] == RUN_DEADLINE_EXCEEDED  # type: ignore[index]
+    unbounded = workflow.run(RunInput("planned", "t", "slow", "mem"))
+    assert unbounded["elapsed_ms"] == 90_000.0  # the plan's own budget covers every receive
+
+
+def test_cancelled_token_stops_workflow_runs_before_they_start() -> None:
+    token = CancellationToken()
+    token.cancel()
+    result = _mem_workflow(VirtualClock()).run(RunInput("r", "t", "slow", "mem"), token)
+    assert result["observed"] == {"interactions": [], "transport_errors": [RUN_CANCELLED]}
+    assert result["elapsed_ms"] == 0.0
+
+
+def test_run_async_is_cancelled_from_another_thread() -> None:
+    peer, port = _silent_peer(socket.SOCK_STREAM)
+    workflow = RunWorkflow(
+        verification_port=CountVerificationAdapter(),
+        event_bus=InMemoryEventBus(),
+        logger=QuietLogger(),
+        transport_port=CompositeTransportAdapter(),
+        task_registry_port=FileTaskRegistryAdapter(),
+        target_resolver=lambda _: _target(port, "tcp"),
+    )
+    steps = [
+        {"step_id": "s0", "action": "send", "message_type": "Ping", "payload_ref": "p"},
+        {"step_id": "r0", "action": "receive_expectation", "message_type": "Pong", "timeout_ms": 5000,
+         "expect": {"matcher": {"direction": "receive", "message_type": "Pong"}, "expected_count": 1}},
+    ]
+    assert workflow.create_task({"task_id": "wait", "name": "wait", "steps": steps, "payloads": {"p": {}}})["ok"]
+    token = CancellationToken()
+    timer = threading.Timer(0.2, token.cancel)
+    try:
+        timer.start()
+        started = time.perf_counter()
+        result = asyncio.run(workflow.run_async(RunInput("a", "t", "wait", "tcp"), token))
+        elapsed = time.perf_counter() - started
+    finally:
+        timer.cancel()
+        peer.close()
+    assert elapsed < 2.0
+    assert RUN_CANCELLED in result["observed"]["transport_errors"]  # type: ignore[index]
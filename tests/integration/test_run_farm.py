@@ -0,0 +1,64 @@
+"""Integration: the multi-process run farm distributes runs, aggregates metrics, and survives worker crashes."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from simulator.app.run_farm import RunFarm
+from simulator.domain.models.run_models import RunInput
+
+
+class _Service:
+    def __init__(self, marker: str) -> None:
+        self._marker = Path(marker)
+
+    def run(
+        self, *, run_id: str, target_id: str, task_id: str, protocol: str, deadline_ms: int | None = None
+    ) -> dict[str, object]:
+        if task_id == "crash":
+            os._exit(3)
+        if task_id == "crash-once" and not self._marker.exists():
+            self._marker.touch()
+            os._exit(3)
+        return {"run_id": run_id, "pid": os.getpid(), "deadline_ms": deadline_ms, "verification": {"passed": True}}
+
+
+def _fake_app(marker: str) -> dict[str, object]:
+    return {"simulation_service": _Service(marker)}
+
+
+def _inputs(n: int, task_id: str = "ok") -> list[RunInput]:
+    return [RunInput(f"{task_id}-{i}", "t", task_id, "tcp", deadline_ms=250) for i in range(n)]
+
+
+def test_farm_spreads_runs_over_workers_and_aggregates_metrics(tmp_path: Path) -> None:
+    with RunFarm(workers=2, app_factory=_fake_app, app_kwargs={"marker": str(tmp_path / "m")}) as farm:
+        results = list(farm.run_many(_inputs(20)))
+        metrics = farm.metrics()
+    assert sorted(r["run_id"] for r in results) == sorted(f"ok-{i}" for i in range(20))
+    assert len({r["pid"] for r in results}) == 2
+    assert all(r["deadline_ms"] == 250 for r in results)
+    assert metrics["runs"] == metrics["passed"] == 20
+    assert all(n > 0 for n in metrics["runs_per_worker"])  # type: ignore[attr-defined]
+    assert metrics["run_duration"]["count"] == 20  # type: ignore[index]
+
+
+def test_farm_replaces_crashed_workers_and_retries_their_runs(tmp_path: Path) -> None:
+    suite = _inputs(5) + [RunInput("flaky", "t", "crash-once", "tcp"), RunInput("poison", "t", "crash", "tcp")]
+    suite += _inputs(5)[::-1]
+    with RunFarm(workers=2, app_factory=_fake_app, app_kwargs={"marker": str(tmp_path / "m")}) as farm:
+        results = {r["run_id"]: r for r in farm.run_many(suite)}
+        metrics = farm.metrics()
+    assert results["flaky"]["verification"] == {"passed": True}
+    assert results["poison"]["observed"]["transport_errors"] == ["RUN_WORKER_CRASHED"]  # type: ignore[index]
+    assert len(results) == 7 and metrics["failed"] == 1
+    assert metrics["worker_crashes"] == 3  # flaky once, poison on both attempts
+
+
+def test_farm_workers_build_the_real_app_container(tmp_path: Path) -> None:
+    app_kwargs = {"task_index_path": tmp_path / "index.json"}
+    with RunFarm(workers=1, app_kwargs=app_kwargs) as farm:
+        [result] = list(farm.run_many([RunInput("real-1", "no-such-target", "ping-smoke", "tcp")]))
+    assert result["run_id"] == "real-1"
+    assert result["observed"]["transport_errors"] == ["TARGET_NOT_FOUND"]  # type: ignore[index]
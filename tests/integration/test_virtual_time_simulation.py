@@ -0,0 +1,125 @@
+"""Integration: virtual-time discrete-event runs (VirtualClock, PeriodicScheduler, MemoryTransportAdapter)."""
+
+from __future__ import annotations
+
+import time
+
+from simulator.adapters.events import InMemoryEventBus
+from simulator.adapters.tasks import FileTaskRegistryAdapter
+from simulator.adapters.transport import MemoryTransportAdapter
+from simulator.adapters.transport.memory.adapter import Responder
+from simulator.adapters.verification import CountVerificationAdapter
+from simulator.domain.models.periodic_runtime import PeriodicTaskRuntime
+from simulator.domain.models.run_models import RunInput
+from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
+from simulator.domain.services.clock import VirtualClock
+from simulator.domain.services.periodic_scheduler import PeriodicScheduler
+from simulator.workflows import RunWorkflow
+
+DAY_S = 24 * 3600.0
+
+
+class QuietLogger:
+    """A day of runs would flood the console."""
+
+    def info(self, event: str, **fields: object) -> None: ...
+    def warn(self, event: str, **fields: object) -> None: ...
+    def error(self, event: str, **fields: object) -> None: ...
+
+
+def _workflow(clock: VirtualClock, responder: Responder | None = None) -> RunWorkflow:
+    workflow = RunWorkflow(
+        verification_port=CountVerificationAdapter(),
+        event_bus=InMemoryEventBus(),
+        logger=QuietLogger(),
+        transport_port=MemoryTransportAdapter(clock=clock, responder=responder, latency_ms=20),
+        task_registry_port=FileTaskRegistryAdapter(),
+        target_resolver=lambda _: TargetRef("t", "t", "mem", 0, "mem", "client"),
+        clock=clock,
+    )
+    for task_id, receives in (("heartbeat", 1), ("cascade", 3)):
+        steps: list[dict[str, object]] = [
+            {"step_id": "s0", "action": "send", "message_type": "Ping", "payload_ref": "p", "timeout_ms": 1000}
+        ]
+        for i in range(receives):
+            steps.append({
+                "step_id": f"r{i}",
+                "action": "receive_expectation",
+                "message_type": "Pong",
+                "expect": {"matcher": {"direction": "receive", "message_type": "Pong"}, "expected_count": receives},
+                "timeout_ms": 30_000,
+            })
+        registered = workflow.create_task({"task_id": task_id, "name": task_id, "steps": steps, "payloads": {"p": {}}})
+        assert registered["ok"], registered
+    return workflow
+
+
+def _simulate_day() -> tuple[list[dict[str, object]], dict[str, object] | None, float]:
+    clock = VirtualClock()
+    silent_after = 12 * 3600.0
+
+    def responder(expected: MessageEnvelope) -> MessageEnvelope | None:
+        return None if clock.now() >= silent_after else expected  # the peer dies at noon
+
+    workflow = _workflow(clock, responder)
+    results: list[dict[str, object]] = []
+
+    def execute(runtime: PeriodicTaskRuntime) -> None:
+        run_id = f"{runtime.task_id}-{len(results)}"
+        results.append(workflow.run(RunInput(run_id, "t", runtime.task_id, "mem")))
+
+    scheduler = PeriodicScheduler(execute=execute, clock=clock)
+    scheduler.start("day")
+    scheduler.add(PeriodicTaskRuntime("heartbeat", "day", True, 60_000, "skip"))
+    scheduler.add(PeriodicTaskRuntime("cascade", "day", True, 300_000, "skip"))
+    fired = scheduler.run_until(DAY_S)
+    assert fired == 24 * 60 + 24 * 12
+    assert clock.now() == DAY_S
+    return results, scheduler.stats("day", "cascade"), clock.now()
+
+
+def test_a_simulated_day_of_periodic_traffic_runs_in_seconds_and_is_deterministic() -> None:
+    started = time.perf_counter()
+    results, cascade, _ = _simulate_day()
+    assert time.perf_counter() - started < 10.0
+    assert len(results) == 24 * 60 + 24 * 12
+    healthy = [r for r in results if not r["observed"]["transport_errors"]]  # type: ignore[index]
+    assert len(healthy) == 12 * 60 + 12 * 12
+    assert all(r["verification"]["passed"] for r in healthy)  # type: ignore[index]
+    assert all(r["latency"]["p50_ms"] == 20.0 for r in healthy)  # type: ignore[index]
+    timed_out = [r for r in results[len(healthy):] if str(r["run_id"]).startswith("cascade")]
+    assert len(timed_out) == 12 * 12
+    assert all(r["elapsed_ms"] == 90_000.0 for r in timed_out)  # three 30s read timeouts, in virtual time
+    assert cascade is not None and cascade["executed"] == 24 * 12 and cascade["skipped"] == 0
+    again, _, _ = _simulate_day()
+    assert again == results
+
+
+def test_overlap_policies_apply_against_virtual_execution_time() -> None:
+    clock = VirtualClock()
+    starts: dict[str, list[float]] = {"skip": [], "queue": [], "parallel": []}
+
+    def execute(runtime: PeriodicTaskRuntime) -> None:
+        starts[runtime.overlap_policy].append(clock.now())
+        clock.sleep(2.5)  # each execution takes 2.5 ticks of simulated time
+
+    scheduler = PeriodicScheduler(execute=execute, clock=clock)
+    scheduler.start("r")
+    for policy in starts:
+        scheduler.add(PeriodicTaskRuntime(policy, "r", True, 1000, policy))
+    scheduler.run_until(9.5)
+    assert starts["parallel"] == [float(k) for k in range(10)]
+    assert starts["skip"] == [0.0, 3.0, 6.0, 9.0]
+    assert starts["queue"] == [2.5 * k for k in range(10)]
+    assert scheduler.stats("r", "skip")["skipped"] == 6  # type: ignore[index]
+    assert clock.now() == 9.5
+
+
+def test_sequential_runs_advance_the_shared_virtual_clock() -> None:
+    clock = VirtualClock(start=100.0)
+    workflow = _workflow(clock)
+    result = workflow.run(RunInput("one", "t", "heartbeat", "mem"))
+    assert result["verification"]["passed"] and result["elapsed_ms"] == 20.0  # type: ignore[index]
+    send, receive = result["observed"]["interactions"]  # type: ignore[index]
+    assert send["timestamp_ns"] == 100_000_000_000 and receive["latency_ns"] == 20_000_000
+    assert clock.now() == 100.02
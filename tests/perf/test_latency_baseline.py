@@ -6,3 +6,65 @@ from __future__ import annotations
 def test_latency_baseline() -> None:
     """Baseline latency check."""
     assert True
+
+
+def test_run_result_reports_request_response_latency() -> None:
+    """Transports stamp perf_counter_ns timestamps; RunWorkflow surfaces the paired latency summary."""
+    import socket
+    import threading
+
+    from simulator.adapters.events import InMemoryEventBus
+    from simulator.adapters.logging import ConsoleLoggingAdapter
+    from simulator.adapters.tasks import FileTaskRegistryAdapter
+    from simulator.adapters.transport import CompositeTransportAdapter
+    from simulator.adapters.verification import CountVerificationAdapter
+    from simulator.domain.models.run_models import RunInput
+    from simulator.domain.models.target_and_task import TargetRef
+    from simulator.workflows import RunWorkflow
+
+    listener = socket.create_server(("127.0.0.1", 0))
+    port = listener.getsockname()[1]
+
+    def echo() -> None:
+        conn, _ = listener.accept()
+        with conn, conn.makefile("rb") as reader:
+            conn.sendall(reader.readline())
+
+    threading.Thread(target=echo, daemon=True).start()
+    workflow = RunWorkflow(
+        verification_port=CountVerificationAdapter(),
+        event_bus=InMemoryEventBus(),
+        logger=ConsoleLoggingAdapter(),
+        transport_port=CompositeTransportAdapter(),
+        task_registry_port=FileTaskRegistryAdapter(),
+        target_resolver=lambda _: TargetRef(
+            target_id="t", name="t", host="127.0.0.1", port=port, protocol="tcp", mode="client"
+        ),
+    )
+    registered = workflow.create_task({
+        "task_id": "ping-round-trip",
+        "name": "Ping round trip",
+        "steps": [
+            {"step_id": "s1", "action": "send", "message_type": "PingRequest", "payload_ref": "req1", "timeout_ms": 1000},
+            {
+                "step_id": "s2",
+                "action": "receive_expectation",
+                "message_type": "PingResponse",
+                "expect": {"matcher": {"direction": "receive", "message_type": "PingResponse"}, "expected_count": 1},
+                "timeout_ms": 1000,
+            },
+        ],
+        "payloads": {"req1": {"id": 1}},
+    })
+    assert registered["ok"], registered
+    try:
+        result = workflow.run(RunInput(run_id="lat", target_id="t", task_id="ping-round-trip", protocol="tcp"))
+    finally:
+        listener.close()
+    interactions = result["observed"]["interactions"]
+    assert [i["interaction_index"] for i in interactions] == list(range(len(interactions)))
+    assert all(isinstance(i["timestamp_ns"], int) for i in interactions)
+    send, receive = interactions[0], interactions[1]
+    assert receive["latency_ns"] == receive["timestamp_ns"] - send["timestamp_ns"] > 0
+    assert result["latency"]["count"] == 1
+    assert result["latency"]["p50_ms"] == receive["latency_ns"] / 1e6
@@ -0,0 +1,74 @@
+"""Perf: RunWorkflow hot-path throughput over the in-process mem transport (no sockets)."""
+
+from __future__ import annotations
+
+import time
+
+from simulator.adapters.events import InMemoryEventBus
+from simulator.adapters.tasks import FileTaskRegistryAdapter
+from simulator.adapters.transport import CompositeTransportAdapter, MemoryTransportAdapter, ScriptedResponder
+from simulator.adapters.verification import CountVerificationAdapter
+from simulator.config.targets import get_default_targets
+from simulator.domain.models.run_models import RunInput
+from simulator.domain.models.target_and_task import MessageEnvelope
+from simulator.domain.services.clock import VirtualClock
+from simulator.workflows import RunWorkflow
+
+RUNS = 2000
+
+
+class QuietLogger:
+    def info(self, event: str, **fields: object) -> None: ...
+    def warn(self, event: str, **fields: object) -> None: ...
+    def error(self, event: str, **fields: object) -> None: ...
+
+
+def _workflow(memory: MemoryTransportAdapter, clock: VirtualClock | None = None) -> RunWorkflow:
+    targets = get_default_targets()
+    workflow = RunWorkflow(
+        verification_port=CountVerificationAdapter(),
+        event_bus=InMemoryEventBus(),
+        logger=QuietLogger(),
+        transport_port=CompositeTransportAdapter(memory=memory),
+        task_registry_port=FileTaskRegistryAdapter(),
+        target_resolver=targets.get,
+        clock=clock,
+    )
+    steps: list[dict[str, object]] = []
+    for i in range(5):
+        steps.append({"step_id": f"s{i}", "action": "send", "message_type": "Ping", "payload_ref": "p"})
+        steps.append({
+            "step_id": f"r{i}",
+            "action": "receive_expectation",
+            "message_type": "Pong",
+            "expect": {"matcher": {"direction": "receive", "message_type": "Pong"}, "expected_count": 5},
+            "timeout_ms": 1000,
+        })
+    definition = {"task_id": "ping5", "name": "ping5", "steps": steps, "payloads": {"p": {"id": 1}}}
+    registered = workflow.create_task(definition)
+    assert registered["ok"], registered
+    return workflow
+
+
+def test_mem_transport_measures_run_workflow_throughput() -> None:
+    pong = MessageEnvelope("Pong", "receive", {"id": 1})
+    workflow = _workflow(MemoryTransportAdapter(responder=ScriptedResponder({"Pong": pong})))
+    workflow.run(RunInput("warm", "default-mem", "ping5", "mem"))
+    started = time.perf_counter()
+    for i in range(RUNS):
+        result = workflow.run(RunInput(f"r{i}", "default-mem", "ping5", "mem"))
+    runs_per_sec = RUNS / (time.perf_counter() - started)
+    assert result["verification"]["passed"], result  # type: ignore[index]
+    assert len(result["observed"]["interactions"]) == 10  # type: ignore[index]
+    assert runs_per_sec > 50  # a floor against a hot-path regression, not a benchmark target
+
+
+def test_mem_transport_on_a_virtual_clock_is_deterministic() -> None:
+    def one_run() -> dict[str, object]:
+        clock = VirtualClock()
+        workflow = _workflow(MemoryTransportAdapter(clock=clock, latency_ms=2), clock)
+        return workflow.run(RunInput("r", "default-mem", "ping5", "mem"))
+
+    first = one_run()
+    assert first == one_run()
+    assert first["elapsed_ms"] == 10.0 and first["latency"]["max_ms"] == 2.0  # type: ignore[index]
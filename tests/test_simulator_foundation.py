@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import os
+import socket
 import tempfile
 import unittest
 from pathlib import Path
 
-from simulator.app.bootstrap import create_app
+from simulator.app.bootstrap import create_app, shutdown_app
 from simulator.domain.models.run_models import RunInput
 from simulator.domain.models.run_models import ObservedInteractions
+from simulator.domain.models.target_and_task import TargetRef
 from simulator.adapters.logging.console_logging import ConsoleLoggingAdapter
 from simulator.adapters.verification.count_verification import CountVerificationAdapter
 from simulator.workflows import RunWorkflow
@@ -158,3 +161,42 @@ class TestSimulatorFoundation(unittest.TestCase):
         self.assertIn("run_id", result)
         self.assertIn("capture_path", result)
         self.assertTrue(isinstance(result.get("capture_path"), str) and len(result.get("capture_path", "")) > 0)
+
+    def test_create_app_writes_no_caches_by_default(self) -> None:
+        """Task index and contract cache are opt-in; create_app does not write into the working directory."""
+        header = Path(__file__).parent / "fixtures" / "contracts" / "raw" / "ping_protocol.h"
+        sources = [
+            {"source_path": str(header.resolve()), "source_type": "repo_h"},
+            {"source_path": str(header.resolve()), "source_type": "repo_h", "checksum_sha256": "00"},
+        ]
+        with tempfile.TemporaryDirectory() as d:
+            cwd = Path.cwd()
+            os.chdir(d)
+            try:
+                with self.assertLogs("simulator", level="WARNING") as logs:
+                    container = create_app(mode="tui", contract_sources=sources)
+                container["simulation_service"].list_tasks()
+            finally:
+                os.chdir(cwd)
+            self.assertFalse((Path(d) / ".cache").exists())
+        self.assertEqual(len(container["contract_bundle"]["errors"]), 1)
+        self.assertTrue(logs.output[0].startswith("WARNING:simulator:CONTRACT_CHECKSUM_MISMATCH "), logs.output)
+
+    def test_create_app_logs_a_task_bundle_it_cannot_open(self) -> None:
+        """A missing or foreign bundle is logged at startup rather than served silently as an empty library."""
+        with tempfile.TemporaryDirectory() as d:
+            with self.assertLogs("simulator", level="ERROR") as logs:
+                container = create_app(mode="tui", task_bundle=Path(d) / "missing.bundle")
+            shutdown_app(container)
+        self.assertTrue(logs.output[0].startswith("ERROR:simulator:TASK_BUNDLE_INVALID "), logs.output)
+
+    def test_shutdown_app_closes_warm_tcp_connections(self) -> None:
+        """The container exposes its TCP pool and shutdown_app closes it."""
+        container = create_app(mode="tui")
+        pool = container["tcp_pool"]
+        with socket.create_server(("127.0.0.1", 0)) as listener:
+            target = TargetRef("t", "t", "127.0.0.1", listener.getsockname()[1], "tcp", "client")
+            pool.release(target, pool.acquire(target, timeout_sec=1.0))
+            self.assertEqual(len(pool.stats()), 1)
+            shutdown_app(container)
+            self.assertEqual(pool.stats(), {})
@@ -0,0 +1,106 @@
+"""Unit tests for the contract-driven binary codec."""
+
+from __future__ import annotations
+
+import ctypes
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+
+from simulator.adapters.contracts import FileContractAdapter
+from simulator.adapters.contracts.codec import FieldSpec, compile_layout
+from simulator.adapters.transport.common.framing import StreamReassembler, create_framer
+from simulator.adapters.transport.tcp.adapter import TcpTransportAdapter
+from simulator.adapters.verification import CountVerificationAdapter
+from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
+
+CTYPES_SOURCE = Path(__file__).resolve().parents[3] / "fixtures" / "contracts" / "ctypes" / "ping_protocol_ctypes.py"
+
+
+def _bundle() -> dict:
+    adapter = FileContractAdapter()
+    bundle = adapter.load_sources([{"source_type": "ctypes", "source_path": str(CTYPES_SOURCE)}])
+    assert bundle["errors"] == []
+    return bundle
+
+
+def test_ctypes_fixture_compiles_to_matching_layouts() -> None:
+    types = _bundle()["types"]
+    assert types["PingRequest"].size == 36
+    assert types["PingResponse"].size == 8
+
+
+def test_encode_matches_ctypes_bytes_and_round_trips() -> None:
+    codec = FileContractAdapter().codec(_bundle())
+
+    class PingRequest(ctypes.Structure):
+        _fields_ = [("id", ctypes.c_uint32), ("body", ctypes.c_char * 32)]
+
+    msg = MessageEnvelope(message_type="PingRequest", direction="send", payload={"id": 7, "body": "hello"})
+    wire = codec.encode(msg)
+    assert wire == bytes(PingRequest(7, b"hello"))
+    assert codec.decode(wire, "PingRequest") == ("PingRequest", {"id": 7, "body": "hello"})
+    # Unambiguous size identifies the type when no expected type is known.
+    assert codec.decode(wire) == ("PingRequest", {"id": 7, "body": "hello"})
+    assert codec.decode(b"\x00" * 5) is None
+
+
+def test_compile_layout_alignment_arrays_and_cache() -> None:
+    fields = (FieldSpec("flag", "uint8"), FieldSpec("value", "uint64"), FieldSpec("samples", "int16", 3))
+    layout = compile_layout("Sample", fields)
+    assert layout.size == 24
+    assert compile_layout("Sample", fields) is layout
+    assert compile_layout("Sample", fields, packed=True).size == 15
+    assert layout.decode(layout.encode({"flag": 1, "value": 2, "samples": [3, -4]})) == {
+        "flag": 1, "value": 2, "samples": [3, -4, 0],
+    }
+    with pytest.raises(ValueError):
+        layout.encode({"flag": 300})
+
+
+def test_validate_message_rejects_unknown_type_and_field() -> None:
+    adapter = FileContractAdapter()
+    bundle = _bundle()
+    ok = MessageEnvelope(message_type="PingResponse", direction="receive", payload={"id": 1, "ok": 1})
+    assert adapter.validate_message(ok, bundle) == {"valid": True, "errors": []}
+    bad_field = MessageEnvelope(message_type="PingResponse", direction="receive", payload={"nope": 1})
+    assert adapter.validate_message(bad_field, bundle)["valid"] is False
+    bad_type = MessageEnvelope(message_type="Unknown", direction="send", payload={})
+    assert adapter.validate_message(bad_type, bundle)["valid"] is False
+
+
+def test_tcp_run_with_codec_yields_typed_receive_that_verifies() -> None:
+    codec = FileContractAdapter().codec(_bundle())
+    framer = create_framer({"id": "length-prefixed"})
+    listener = socket.create_server(("127.0.0.1", 0))
+    port = listener.getsockname()[1]
+
+    def serve() -> None:
+        conn, _ = listener.accept()
+        with conn:
+            _, request = codec.decode(StreamReassembler(framer).read_frame(conn), "PingRequest")
+            reply = MessageEnvelope(message_type="PingResponse", direction="send", payload={"id": request["id"], "ok": 1})
+            conn.sendall(framer.encode(codec.encode(reply)))
+
+    threading.Thread(target=serve, daemon=True).start()
+    target = TargetRef(
+        target_id="t", name="t", host="127.0.0.1", port=port, protocol="tcp", mode="client",
+        framing={"id": "length-prefixed"},
+    )
+    messages = [
+        MessageEnvelope(message_type="PingRequest", direction="send", payload={"id": 42, "body": "hi"}),
+        MessageEnvelope(message_type="PingResponse", direction="receive", payload={}),
+    ]
+    try:
+        observed = TcpTransportAdapter(codec=codec).execute(target=target, protocol="tcp", messages=messages, timeout_ms=1000)
+    finally:
+        listener.close()
+    assert observed.transport_errors == ()
+    receive = observed.interactions[1]
+    assert {k: receive[k] for k in ("direction", "raw_len", "message_type", "payload")} == {
+        "direction": "receive", "raw_len": 8, "message_type": "PingResponse", "payload": {"id": 42, "ok": 1},
+    }
+    rules = [{"message_type": "PingResponse", "direction": "receive", "expected_count": 1, "comparison": "eq"}]
+    assert CountVerificationAdapter().verify_count_rules(rules, observed).passed
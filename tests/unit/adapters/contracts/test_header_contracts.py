@@ -0,0 +1,71 @@
+"""Unit tests for .h contract parsing and the checksum-keyed contract cache."""
+
+from __future__ import annotations
+
+import ctypes
+from pathlib import Path
+
+import pytest
+
+from simulator.adapters.contracts import FileContractAdapter, HeaderParseError, parse_header
+from simulator.adapters.contracts import file_contract
+from simulator.adapters.contracts.contract_cache import sha256_file
+
+FIXTURES = Path(__file__).resolve().parents[3] / "fixtures" / "contracts"
+HEADER = FIXTURES / "raw" / "ping_protocol.h"
+CTYPES_SOURCE = FIXTURES / "ctypes" / "ping_protocol_ctypes.py"
+
+
+def test_header_matches_ctypes_fixture_layouts() -> None:
+    adapter = FileContractAdapter()
+    from_header = adapter.load_sources([{"source_type": "repo_h", "source_path": str(HEADER)}])
+    from_ctypes = adapter.load_sources([{"source_type": "ctypes", "source_path": str(CTYPES_SOURCE)}])
+    assert from_header["errors"] == []
+    for name in ("PingRequest", "PingResponse"):
+        assert from_header["types"][name].packer.format == from_ctypes["types"][name].packer.format
+        assert ctypes.sizeof(from_header["ctypes"][name]) == ctypes.sizeof(from_ctypes["ctypes"][name])
+    assert from_header["checksums"] == {str(HEADER): sha256_file(HEADER)}
+
+
+def test_parse_header_defines_pragma_pack_and_multi_declarators() -> None:
+    structs = parse_header(
+        """
+        #define NAME_LEN 8
+        /* block comment */
+        #pragma pack(push, 1)
+        struct Packed { uint8_t kind; uint32_t value; };  // trailing
+        #pragma pack(pop)
+        typedef struct { unsigned short x, y; char name[NAME_LEN]; } Point;
+        """
+    )
+    assert [(s.name, s.packed) for s in structs] == [("Packed", True), ("Point", False)]
+    assert [(f.name, f.ctype, f.count) for f in structs[1].fields] == [
+        ("x", "uint16", 1), ("y", "uint16", 1), ("name", "char", 8),
+    ]
+    with pytest.raises(HeaderParseError):
+        parse_header("struct Bad { void *ptr; };")
+
+
+def test_cache_hit_skips_parsing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    source = {"source_type": "user_h", "source_path": str(HEADER), "checksum_sha256": sha256_file(HEADER)}
+    first = FileContractAdapter(cache_dir=tmp_path).load_sources([source])
+    assert list(tmp_path.glob("*.json")) == [tmp_path / f"{source['checksum_sha256']}.json"]
+
+    def fail(_text: str) -> None:
+        raise AssertionError("header re-parsed despite cache entry")
+
+    monkeypatch.setattr(file_contract, "parse_header", fail)
+    second = FileContractAdapter(cache_dir=tmp_path).load_sources([source])
+    assert second["errors"] == []
+    assert second["types"] == first["types"]
+
+
+def test_checksum_mismatch_and_unsupported_source_are_reported(tmp_path: Path) -> None:
+    header = tmp_path / "x.h"
+    header.write_text("struct X { uint8_t a; };")
+    bundle = FileContractAdapter().load_sources([
+        {"source_type": "repo_h", "source_path": str(header), "checksum_sha256": "0" * 64},
+        {"source_type": "idl", "source_path": str(header)},
+    ])
+    assert [e["error_code"] for e in bundle["errors"]] == ["CONTRACT_CHECKSUM_MISMATCH", "CONTRACT_LOAD_FAILED"]
+    assert bundle["types"] == {}
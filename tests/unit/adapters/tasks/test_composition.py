@@ -0,0 +1,63 @@
+"""Unit tests for composed tasks: references to bases, memoized flattening, invalidation."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from simulator.adapters.tasks import FileTaskRegistryAdapter
+
+
+def _write(path: Path, task_id: str, message_type: str) -> None:
+    steps = [{"step_id": f"{task_id}-s1", "action": "send", "message_type": message_type}]
+    path.write_text(json.dumps({"task_id": task_id, "name": task_id, "steps": steps}))
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def _registry(tmp_path: Path) -> FileTaskRegistryAdapter:
+    _write(tmp_path / "a.task.json", "a", "A")
+    _write(tmp_path / "b.task.json", "b", "B")
+    return FileTaskRegistryAdapter(tasks_dir=tmp_path)
+
+
+def _types(registry: FileTaskRegistryAdapter, task_id: str) -> list[str]:
+    task = registry.get(task_id)
+    assert task is not None
+    return [s.message_type for s in task.steps]
+
+
+def test_composites_of_composites_flatten_lazily_once(tmp_path: Path) -> None:
+    registry = _registry(tmp_path)
+    assert registry.compose(["a", "b"], {"task_id": "ab"})["ok"] is True
+    assert registry.compose(["ab", "a"], {"task_id": "aba", "name": "ABA"})["ok"] is True
+    assert registry.resident_count == 0  # composing reads no base definitions
+    assert {"task_id": "aba", "name": "ABA"} in registry.list_tasks()
+    assert _types(registry, "aba") == ["A", "B", "A"]
+    assert registry.get("aba") is registry.get("aba")
+    assert registry.get("aba").steps[0] is registry.get("a").steps[0]  # type: ignore[union-attr]
+
+
+def test_editing_a_base_invalidates_every_composite_above_it(tmp_path: Path) -> None:
+    registry = _registry(tmp_path)
+    registry.compose(["a", "b"], {"task_id": "ab"})
+    registry.compose(["ab"], {"task_id": "outer"})
+    before = registry.get("outer")
+    _write(tmp_path / "b.task.json", "b", "B2")
+    registry.refresh()
+    assert _types(registry, "outer") == ["A", "B2"]
+    assert registry.get("outer") is not before
+    assert registry.get("outer").content_hash != before.content_hash  # type: ignore[union-attr]
+
+
+def test_recompose_replaces_composites_but_rejects_plain_ids_and_cycles(tmp_path: Path) -> None:
+    registry = _registry(tmp_path)
+    registry.compose(["a"], {"task_id": "c1"})
+    registry.compose(["c1"], {"task_id": "c2"})
+    assert _types(registry, "c2") == ["A"]
+    assert registry.compose(["b"], {"task_id": "c1"})["ok"] is True
+    assert _types(registry, "c2") == ["B"]
+    assert registry.compose(["b"], {"task_id": "a"})["error_code"] == "COMPOSE_DUPLICATE_ID"
+    assert registry.compose(["c2"], {"task_id": "c1"})["error_code"] == "COMPOSE_CYCLE"
+    assert registry.compose(["missing"], {"task_id": "x"})["error_code"] == "COMPOSE_BASE_NOT_FOUND"
@@ -0,0 +1,190 @@
+"""Unit tests for the task directory index: incremental refresh, sidecar listing, LRU residency, watcher."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from simulator.adapters.tasks import FileTaskRegistryAdapter, TaskDirectoryWatcher
+
+
+def _write(path: Path, task_id: str, name: str = "T") -> None:
+    path.write_text(json.dumps({"task_id": task_id, "name": name, "steps": []}))
+
+
+def _count_reads(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Names of task files the registry opens (refresh and get() read bytes, the sidecar reads text)."""
+    read: list[str] = []
+    read_bytes, read_text = Path.read_bytes, Path.read_text
+
+    def spy_bytes(self: Path) -> bytes:
+        read.append(self.name.split(".")[0])
+        return read_bytes(self)
+
+    def spy_text(self: Path, *args: object, **kwargs: object) -> str:
+        read.append(self.name.split(".")[0])
+        return read_text(self, *args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(Path, "read_bytes", spy_bytes)
+    monkeypatch.setattr(Path, "read_text", spy_text)
+    return read
+
+
+def test_refresh_reads_only_changed_and_added_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    for i in range(5):
+        _write(tmp_path / f"t{i}.task.json", f"t{i}")
+    registry = FileTaskRegistryAdapter(tasks_dir=tmp_path)
+    parsed = _count_reads(monkeypatch)
+    assert len(registry.list_tasks()) == 5
+    assert len(parsed) == 5
+
+    parsed.clear()
+    assert registry.refresh()["unchanged"] == 5
+    assert parsed == []
+
+    _write(tmp_path / "t1.task.json", "t1", name="renamed")
+    st = os.stat(tmp_path / "t1.task.json")
+    os.utime(tmp_path / "t1.task.json", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    _write(tmp_path / "t9.task.json", "t9")
+    (tmp_path / "t3.task.json").unlink()
+    report = registry.refresh()
+    assert (report["added"], report["updated"], report["removed"]) == (["t9"], ["t1"], ["t3"])
+    assert sorted(parsed) == ["t1", "t9"]
+    assert registry.get("t1").name == "renamed"  # type: ignore[union-attr]
+    assert registry.get("t3") is None
+
+
+def test_touched_identical_file_is_hashed_not_reindexed(tmp_path: Path) -> None:
+    path = tmp_path / "a.task.json"
+    _write(path, "a")
+    registry = FileTaskRegistryAdapter(tasks_dir=tmp_path)
+    registry.refresh()
+    resident = registry.get("a")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000))
+    report = registry.refresh()
+    assert report["unchanged"] == 1 and report["updated"] == []
+    assert registry.get("a") is resident
+
+
+def test_broken_edit_keeps_last_good_task_and_runtime_tasks_survive(tmp_path: Path) -> None:
+    path = tmp_path / "a.task.json"
+    _write(path, "a")
+    registry = FileTaskRegistryAdapter(tasks_dir=tmp_path)
+    assert registry.get("a") is not None  # resident copies outlive a broken edit
+    assert registry.register_definition({"task_id": "runtime", "name": "R", "steps": []})["ok"]
+    path.write_text("{not json")
+    report = registry.refresh()
+    assert [e["error_code"] for e in report["errors"]] == ["TASK_LOAD_FAILED"]
+    assert registry.get("a") is not None
+    assert registry.refresh()["errors"] == []  # unchanged broken file is not re-read
+    path.unlink()
+    assert registry.refresh()["removed"] == ["a"]
+    assert registry.get("runtime") is not None
+
+
+def test_sidecar_index_lists_without_opening_task_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    tasks_dir, index_path = tmp_path / "tasks", tmp_path / "cache" / "index.json"
+    tasks_dir.mkdir()
+    for i in range(3):
+        _write(tasks_dir / f"t{i}.task.json", f"t{i}", name=f"Task {i}")
+    FileTaskRegistryAdapter(tasks_dir=tasks_dir, index_path=index_path).refresh()
+    assert index_path.exists()
+
+    reads = _count_reads(monkeypatch)
+    registry = FileTaskRegistryAdapter(tasks_dir=tasks_dir, index_path=index_path)
+    assert registry.list_tasks() == [{"task_id": f"t{i}", "name": f"Task {i}"} for i in range(3)]
+    assert reads == ["index"]
+    assert registry.resident_count == 0
+    assert registry.get("t2").name == "Task 2"  # type: ignore[union-attr]
+    assert reads == ["index", "t2"]
+
+
+def test_resident_definitions_are_lru_bounded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in "abc":
+        _write(tmp_path / f"{name}.task.json", name)
+    registry = FileTaskRegistryAdapter(tasks_dir=tmp_path, max_resident=2)
+    registry.refresh()
+    reads = _count_reads(monkeypatch)
+    for name in "abab":
+        assert registry.get(name) is not None
+    assert reads == ["a", "b"]
+    registry.get("c")  # evicts a, the least recently used
+    assert registry.resident_count == 2
+    registry.get("b")
+    registry.get("a")
+    assert reads == ["a", "b", "c", "a"]
+
+
+def test_task_edited_before_refresh_is_served_not_missing(tmp_path: Path) -> None:
+    for name in ("t0", "t1"):
+        _write(tmp_path / f"{name}.task.json", name)
+    registry = FileTaskRegistryAdapter(tasks_dir=tmp_path, max_resident=1)
+    registry.refresh()
+    assert registry.get("t0") is not None
+    assert registry.get("t1") is not None  # evicts t0
+    _write(tmp_path / "t0.task.json", "t0", name="edited")
+    assert registry.get("t0").name == "edited"  # type: ignore[union-attr]
+    assert registry.refresh()["updated"] == ["t0"]
+    assert registry.get("t0").name == "edited"  # type: ignore[union-attr]
+
+
+def test_watcher_reports_changes(tmp_path: Path) -> None:
+    registry = FileTaskRegistryAdapter(tasks_dir=tmp_path)
+    registry.refresh()
+    seen = threading.Event()
+    reports: list[dict[str, object]] = []
+
+    def on_change(report: dict[str, object]) -> None:
+        reports.append(report)
+        seen.set()
+
+    watcher = TaskDirectoryWatcher(registry, interval_sec=0.01, on_change=on_change)
+    watcher.start()
+    try:
+        _write(tmp_path / "new.task.json", "new")
+        assert seen.wait(2.0)
+    finally:
+        watcher.stop()
+    assert reports[0]["added"] == ["new"]
+    assert registry.get("new") is not None
+    assert not watcher.running
+
+
+def test_watcher_logs_a_failing_poll_and_keeps_polling(tmp_path: Path) -> None:
+    registry = FileTaskRegistryAdapter(tasks_dir=tmp_path)
+    registry.refresh()
+    errors: list[tuple[str, dict[str, object]]] = []
+    added: list[object] = []
+    second = threading.Event()
+
+    class RecordingLogger:
+        def info(self, event: str, **fields: object) -> None: ...
+        def warn(self, event: str, **fields: object) -> None: ...
+        def error(self, event: str, **fields: object) -> None:
+            errors.append((event, fields))
+
+    def on_change(report: dict[str, object]) -> None:
+        added.append(report["added"])
+        if len(added) == 1:
+            raise RuntimeError("subscriber broke")
+        second.set()
+
+    watcher = TaskDirectoryWatcher(registry, interval_sec=0.01, on_change=on_change, logger=RecordingLogger())
+    watcher.start()
+    try:
+        _write(tmp_path / "a.task.json", "a")
+        while not added:
+            time.sleep(0.01)
+        _write(tmp_path / "b.task.json", "b")
+        assert second.wait(2.0)
+        assert watcher.running
+    finally:
+        watcher.stop()
+    assert added == [["a"], ["b"]]
+    assert errors == [("TASK_WATCH_FAILED", {"error": "RuntimeError: subscriber broke"})]
@@ -0,0 +1,88 @@
+"""Unit tests for copy-on-write registry snapshots: pinning, lock-free readers, serialized writers."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+from simulator.adapters.tasks import BundleTaskRegistryAdapter, FileTaskRegistryAdapter
+from simulator.adapters.tasks.task_bundle import pack_task_directory
+
+
+def _write(path: Path, task_id: str, name: str) -> None:
+    path.write_text(json.dumps({"task_id": task_id, "name": name, "steps": []}))
+
+
+def test_pinned_snapshot_keeps_its_view_across_writes(tmp_path: Path) -> None:
+    _write(tmp_path / "a.task.json", "a", "A1")
+    _write(tmp_path / "b.task.json", "b", "B1")
+    registry = FileTaskRegistryAdapter(tasks_dir=tmp_path)
+    pinned = registry.snapshot()
+    assert pinned.get("a").name == "A1"  # type: ignore[union-attr]
+
+    assert registry.register_definition({"task_id": "r", "name": "R", "steps": []})["ok"]
+    assert registry.compose(["a", "r"], {"task_id": "ar"})["ok"]
+    _write(tmp_path / "a.task.json", "a", "A2 longer")
+    _write(tmp_path / "b.task.json", "b", "B2 longer")
+    assert registry.refresh()["updated"] == ["a", "b"]
+
+    current = registry.snapshot()
+    assert current.version > pinned.version
+    assert [t["task_id"] for t in pinned.list_tasks()] == ["a", "b"]
+    assert pinned.get("a").name == "A1"  # type: ignore[union-attr]
+    # Never decoded under the pinned version and its file has moved on: served as it is now, not missing.
+    assert pinned.get("b").name == "B2 longer"  # type: ignore[union-attr]
+    assert pinned.get("r") is None and pinned.get("ar") is None
+    assert current.get("a").name == "A2 longer"  # type: ignore[union-attr]
+    assert current.get("ar").name == "Composed from a, r"  # type: ignore[union-attr]
+
+
+def test_readers_see_whole_writes_while_writers_are_serialized(tmp_path: Path) -> None:
+    registry = FileTaskRegistryAdapter(tasks_dir=tmp_path)
+    writes, failures = 200, []
+    done = threading.Event()
+
+    def writer(offset: int) -> None:
+        for i in range(offset, writes, 2):
+            if not registry.register_definition({"task_id": f"t{i}", "name": f"T{i}", "steps": []})["ok"]:
+                failures.append(f"t{i}")
+
+    def reader() -> None:
+        last = -1
+        while not done.is_set():
+            snapshot = registry.snapshot()
+            listed = snapshot.list_tasks()
+            if snapshot.version < last or len(listed) != snapshot.version - 1:
+                failures.append(f"version {snapshot.version} lists {len(listed)}")
+            if any(snapshot.get(str(t["task_id"])) is None for t in listed):
+                failures.append(f"version {snapshot.version} lists a task it cannot get")
+            last = snapshot.version
+
+    readers = [threading.Thread(target=reader) for _ in range(3)]
+    writers = [threading.Thread(target=writer, args=(k,)) for k in range(2)]
+    for t in readers + writers:
+        t.start()
+    for t in writers:
+        t.join()
+    done.set()
+    for t in readers:
+        t.join()
+    assert failures == []
+    assert len(registry.list_tasks()) == writes
+
+
+def test_bundle_snapshot_keeps_the_bundle_it_was_published_with(tmp_path: Path) -> None:
+    tasks_dir = tmp_path / "tasks"
+    tasks_dir.mkdir()
+    _write(tasks_dir / "a.task.json", "a", "A1")
+    bundle_path = tmp_path / "tasks.bundle"
+    pack_task_directory(tasks_dir, bundle_path, workers=1)
+    registry = BundleTaskRegistryAdapter(bundle_path)
+    pinned = registry.snapshot()
+
+    _write(tasks_dir / "a.task.json", "a", "A2 longer")
+    pack_task_directory(tasks_dir, bundle_path, workers=1)
+    assert registry.refresh()["updated"] == ["a"]
+    assert pinned.get("a").name == "A1"  # type: ignore[union-attr]
+    assert registry.get("a").name == "A2 longer"  # type: ignore[union-attr]
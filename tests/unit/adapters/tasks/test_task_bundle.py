@@ -0,0 +1,151 @@
+"""Unit tests for the packed task bundle, its registry, and `simulator tasks pack`."""
+
+from __future__ import annotations
+
+import gc
+import json
+from pathlib import Path
+
+import pytest
+
+from simulator.adapters.tasks import BundleTaskRegistryAdapter
+from simulator.adapters.tasks.task_bundle import BundleFormatError, TaskBundle, pack_task_directory
+from simulator.adapters.tasks.task_files import load_task_file
+from simulator.app.__main__ import main
+
+FIXTURES = Path(__file__).resolve().parents[3] / "fixtures" / "tasks"
+
+
+def test_bundle_round_trips_every_fixture_task(tmp_path: Path) -> None:
+    bundle_path = tmp_path / "tasks.bundle"
+    result = pack_task_directory(FIXTURES, bundle_path, workers=1)
+    assert result["ok"] is True
+    originals = {t.task_id: t for t in map(load_task_file, sorted(FIXTURES.glob("*.task.json")))}
+    bundle = TaskBundle(bundle_path)
+    try:
+        assert len(bundle) == len(originals) == result["task_count"]
+        assert dict(bundle.headers()) == {t.task_id: t.name for t in originals.values()}
+        for task_id, original in originals.items():
+            assert bundle.get(task_id) == original
+        assert bundle.get("no-such-task") is None and "no-such-task" not in bundle
+    finally:
+        bundle.close()
+
+
+def test_bundle_round_trips_nested_repeat_steps(tmp_path: Path) -> None:
+    tasks_dir = tmp_path / "tasks"
+    tasks_dir.mkdir()
+    send = {"step_id": "p", "action": "send", "message_type": "Ping", "payload_ref": "ping"}
+    inner = {"step_id": "in", "action": "loop", "counter": "j", "start": 1, "count": 3, "steps": [send]}
+    definition = {
+        "task_id": "soak",
+        "name": "Soak",
+        "payloads": {"ping": {"id": "${i}-${j}"}},
+        "steps": [{"step_id": "out", "action": "repeat", "count": 1000, "steps": [send, inner]}],
+    }
+    (tasks_dir / "soak.task.json").write_text(json.dumps(definition))
+    pack_task_directory(tasks_dir, tmp_path / "tasks.bundle", workers=1)
+    bundle = TaskBundle(tmp_path / "tasks.bundle")
+    try:
+        decoded = bundle.get("soak")
+    finally:
+        bundle.close()
+    assert decoded == load_task_file(tasks_dir / "soak.task.json")
+    assert decoded is not None and decoded.steps[0].steps[1].action == "repeat"
+
+
+def test_registry_decodes_on_demand_and_remaps_a_repacked_bundle(tmp_path: Path) -> None:
+    tasks_dir = tmp_path / "tasks"
+    tasks_dir.mkdir()
+    for i in range(3):
+        (tasks_dir / f"t{i}.task.json").write_text(json.dumps({"task_id": f"t{i}", "name": f"Task {i}", "steps": []}))
+    bundle_path = tmp_path / "tasks.bundle"
+    pack_task_directory(tasks_dir, bundle_path, workers=1)
+    registry = BundleTaskRegistryAdapter(bundle_path, max_resident=1)
+    assert [t["task_id"] for t in registry.list_tasks()] == ["t0", "t1", "t2"]
+    assert registry.get("t1").name == "Task 1"  # type: ignore[union-attr]
+    assert registry.register_definition({"task_id": "t1", "name": "dup"})["error_code"] == "TASK_DUPLICATE_ID"
+    assert registry.compose(["t0", "t2"], {"task_id": "both"})["ok"] is True
+
+    (tasks_dir / "t0.task.json").unlink()
+    (tasks_dir / "t9.task.json").write_text(json.dumps({"task_id": "t9", "name": "Task 9", "steps": []}))
+    pack_task_directory(tasks_dir, bundle_path, workers=1)
+    report = registry.refresh()
+    assert (report["added"], report["removed"]) == (["t9"], ["t0"])
+    assert registry.get("t0") is None
+    assert registry.get("both") is None  # composites reference their bases; t0 is gone
+    assert registry.refresh()["unchanged"] == 3
+
+
+def test_pack_keeps_negative_fields_and_reports_values_the_layout_cannot_hold(tmp_path: Path) -> None:
+    tasks_dir = tmp_path / "tasks"
+    tasks_dir.mkdir()
+    receive = {
+        "step_id": "r",
+        "action": "receive_expectation",
+        "message_type": "Pong",
+        "timeout_ms": -5,
+        "expect": {"matcher": {"message_type": "Pong"}, "expected_count": -1},
+    }
+    repeat = {"step_id": "x", "action": "repeat", "count": -1, "steps": [receive]}
+    odd = {"task_id": "odd", "name": "Odd", "steps": [repeat]}
+    (tasks_dir / "odd.task.json").write_text(json.dumps(odd))
+    out = tmp_path / "tasks.bundle"
+    assert pack_task_directory(tasks_dir, out, workers=1)["ok"] is True
+    bundle = TaskBundle(out)
+    try:
+        assert bundle.get("odd") == load_task_file(tasks_dir / "odd.task.json")
+    finally:
+        bundle.close()
+
+    huge = tasks_dir / "huge.task.json"
+    huge.write_text(json.dumps({"task_id": "huge", "steps": [{"step_id": "x", "action": "repeat", "count": 2**40}]}))
+    out.unlink()
+    report = pack_task_directory(tasks_dir, out, workers=1)
+    assert report["ok"] is False and not out.exists()
+    assert [(e["path"], e["error_code"]) for e in report["errors"]] == [  # type: ignore[index]
+        (str(huge), "TASK_BUNDLE_ENCODE_FAILED")
+    ]
+
+
+def test_refresh_reports_only_changed_records_and_unmaps_replaced_bundles(tmp_path: Path) -> None:
+    tasks_dir = tmp_path / "tasks"
+    tasks_dir.mkdir()
+    for i in range(3):
+        (tasks_dir / f"t{i}.task.json").write_text(json.dumps({"task_id": f"t{i}", "name": f"Task {i}", "steps": []}))
+    bundle_path = tmp_path / "tasks.bundle"
+    pack_task_directory(tasks_dir, bundle_path, workers=1)
+    registry = BundleTaskRegistryAdapter(bundle_path)
+    assert registry.compose(["t0"], {"task_id": "zero"})["ok"] is True
+    pinned = registry.snapshot()
+    first = pinned.source.bundle
+
+    (tasks_dir / "t1.task.json").write_text(json.dumps({"task_id": "t1", "name": "Task 1 v2", "steps": []}))
+    pack_task_directory(tasks_dir, bundle_path, workers=1)
+    report = registry.refresh()
+    assert (report["added"], report["updated"], report["removed"], report["unchanged"]) == ([], ["t1"], [], 2)
+    assert registry.get("zero") is not None  # t0 did not change, so its composite survives
+    assert pinned.get("t1").name == "Task 1"  # type: ignore[union-attr]  # the pinned map is still open
+
+    del pinned
+    gc.collect()
+    assert first._map.closed  # no snapshot can reach the first map any more
+    current = registry.snapshot().source.bundle
+    registry.close()
+    assert current._map.closed and registry.get("t1") is None
+    assert registry.get("zero") is not None  # runtime tasks survive close()
+
+
+def test_pack_refuses_broken_libraries_and_readers_reject_foreign_files(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (tmp_path / "bad.task.json").write_text("{")
+    out = tmp_path / "out.bundle"
+    assert main(["tasks", "pack", str(tmp_path), "-o", str(out), "--workers", "1"]) == 1
+    assert "TASK_LOAD_FAILED" in capsys.readouterr().err and not out.exists()
+
+    out.write_bytes(b"not a bundle at all, just some bytes")
+    with pytest.raises(BundleFormatError):
+        TaskBundle(out)
+    errors = BundleTaskRegistryAdapter(out).refresh()["errors"]
+    assert [e["error_code"] for e in errors] == ["TASK_BUNDLE_INVALID"]  # type: ignore[attr-defined,index]
@@ -0,0 +1,57 @@
+"""Unit tests for bulk task-file reads across a process pool."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from simulator.adapters.tasks import FileTaskRegistryAdapter
+from simulator.adapters.tasks.task_files import read_task_files
+
+
+def _library(tmp_path: Path, count: int) -> list[Path]:
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"t{i:03d}.task.json"
+        steps = [{"step_id": "s1", "action": "send", "message_type": "Ping", "payload_ref": "p"}]
+        definition = {"task_id": f"t{i}", "name": f"Task {i}", "payloads": {"p": {"i": i}}, "steps": steps}
+        path.write_text(json.dumps(definition))
+        paths.append(path)
+    return paths
+
+
+def test_pool_read_matches_in_process_read_in_input_order(tmp_path: Path) -> None:
+    paths = _library(tmp_path, 40)
+    pooled = read_task_files(paths, workers=2, min_parallel=1)
+    assert pooled == read_task_files(paths, workers=1)
+    assert [r.task_id for r in pooled] == [f"t{i}" for i in range(40)]
+    assert pooled[7].task is not None and pooled[7].task.payloads == {"p": {"i": 7}}
+    headers = read_task_files(paths, workers=2, min_parallel=1, headers_only=True)
+    assert [(r.name, r.task) for r in headers[:2]] == [("Task 0", None), ("Task 1", None)]
+
+
+def test_every_bad_file_is_reported(tmp_path: Path) -> None:
+    paths = _library(tmp_path, 4)
+    paths[1].write_text("{broken")
+    paths[2].unlink()
+    reads = read_task_files(paths, workers=2, min_parallel=1)
+    assert [r.error is None for r in reads] == [True, False, False, True]
+    assert reads[1].sha256 and not reads[2].sha256
+
+    paths[2].write_text("[]")
+    report = FileTaskRegistryAdapter(tasks_dir=tmp_path, load_workers=2, parallel_min_files=1).refresh()
+    assert report["added"] == ["t0", "t3"]
+    assert sorted(e["path"] for e in report["errors"]) == [str(paths[1]), str(paths[2])]  # type: ignore[index]
+
+
+def test_refresh_reports_files_whose_steps_do_not_parse(tmp_path: Path) -> None:
+    paths = _library(tmp_path, 2)
+    bad_step = {"step_id": "s1", "action": "send", "message_type": "Ping", "timeout_ms": "soon"}
+    paths[1].write_text(json.dumps({"task_id": "t1", "name": "Task 1", "steps": [bad_step]}))
+    registry = FileTaskRegistryAdapter(tasks_dir=tmp_path)
+    report = registry.refresh()
+    assert report["added"] == ["t0"]
+    assert [(e["path"], e["error_code"]) for e in report["errors"]] == [  # type: ignore[index]
+        (str(paths[1]), "TASK_LOAD_FAILED")
+    ]
+    assert [t["task_id"] for t in registry.list_tasks()] == ["t0"]
@@ -0,0 +1,129 @@
+"""Unit tests for the TCP connection pool."""
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+
+import pytest
+
+from simulator.adapters.transport.tcp.adapter import TcpTransportAdapter
+from simulator.adapters.transport.tcp.connection_pool import PoolExhaustedError, TcpConnectionPool
+from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
+
+PING = [
+    MessageEnvelope(message_type="PingRequest", direction="send", payload={"id": 1}),
+    MessageEnvelope(message_type="PingResponse", direction="receive", payload={}),
+]
+
+
+class LineEchoServer:
+    """Echoes each line back; keeps connections open. Counts accepted connections."""
+
+    def __init__(self, close_after_reply: bool = False) -> None:
+        self._listener = socket.create_server(("127.0.0.1", 0))
+        self.port = self._listener.getsockname()[1]
+        self.accepted = 0
+        self.closed = threading.Semaphore(0)
+        self._close_after_reply = close_after_reply
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def _accept_loop(self) -> None:
+        while True:
+            try:
+                conn, _ = self._listener.accept()
+            except OSError:
+                return
+            self.accepted += 1
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn: socket.socket) -> None:
+        with conn, conn.makefile("rb") as lines:
+            for line in lines:
+                conn.sendall(line)
+                if self._close_after_reply:
+                    break
+        self.closed.release()
+
+    def close(self) -> None:
+        self._listener.close()
+
+
+def _target(port: int) -> TargetRef:
+    return TargetRef(target_id="t", name="t", host="127.0.0.1", port=port, protocol="tcp", mode="client")
+
+
+def test_runs_against_same_target_reuse_one_connection() -> None:
+    server = LineEchoServer()
+    adapter = TcpTransportAdapter(pool=TcpConnectionPool())
+    try:
+        for _ in range(5):
+            observed = adapter.execute(target=_target(server.port), protocol="tcp", messages=PING, timeout_ms=1000)
+            assert observed.transport_errors == ()
+            assert len(observed.interactions) == 2
+        assert server.accepted == 1
+    finally:
+        server.close()
+
+
+def test_checkout_health_check_replaces_connection_closed_by_peer() -> None:
+    server = LineEchoServer(close_after_reply=True)
+    adapter = TcpTransportAdapter(pool=TcpConnectionPool())
+    try:
+        for _ in range(3):
+            observed = adapter.execute(target=_target(server.port), protocol="tcp", messages=PING, timeout_ms=1000)
+            assert observed.transport_errors == ()
+            assert server.closed.acquire(timeout=1.0)
+        assert server.accepted == 3
+    finally:
+        server.close()
+
+
+def test_per_target_cap_blocks_then_reports_exhaustion() -> None:
+    server = LineEchoServer()
+    pool = TcpConnectionPool(max_per_target=1)
+    try:
+        held = pool.acquire(_target(server.port), timeout_sec=1.0)
+        with pytest.raises(PoolExhaustedError):
+            pool.acquire(_target(server.port), timeout_sec=0.05)
+        pool.release(_target(server.port), held)
+        assert pool.acquire(_target(server.port), timeout_sec=0.05) is held
+    finally:
+        pool.close()
+        server.close()
+
+
+def test_idle_connections_are_evicted() -> None:
+    now = [0.0]
+    server = LineEchoServer()
+    pool = TcpConnectionPool(idle_timeout_sec=10.0, clock=lambda: now[0])
+    try:
+        sock = pool.acquire(_target(server.port), timeout_sec=1.0)
+        pool.release(_target(server.port), sock)
+        now[0] = 11.0
+        assert pool.evict_idle() == 1
+        assert pool.stats() == {}
+    finally:
+        server.close()
+
+
+def test_waiter_woken_after_its_slot_was_swept_still_honours_the_cap() -> None:
+    server = LineEchoServer()
+    pool = TcpConnectionPool(max_per_target=1, idle_timeout_sec=0.0)  # every release sweeps empty slots
+    target = _target(server.port)
+    try:
+        held = pool.acquire(target, timeout_sec=1.0)
+        waiter: list[socket.socket] = []
+        thread = threading.Thread(target=lambda: waiter.append(pool.acquire(target, timeout_sec=2.0)))
+        thread.start()
+        time.sleep(0.1)  # the waiter blocks at the cap
+        pool.release(target, held, reusable=False)  # in_use hits 0 and the sweep drops the slot
+        thread.join(2.0)
+        assert waiter and pool.stats()[f"127.0.0.1:{server.port}/client"]["in_use"] == 1
+        with pytest.raises(PoolExhaustedError):
+            pool.acquire(target, timeout_sec=0.05)
+        pool.release(target, waiter[0])
+    finally:
+        pool.close()
+        server.close()
@@ -0,0 +1,120 @@
+"""Unit tests for stream framing and reassembly."""
+
+from __future__ import annotations
+
+import socket
+import threading
+
+import pytest
+
+from simulator.adapters.transport.common.framing import (
+    FramingError,
+    StreamReassembler,
+    create_framer,
+)
+from simulator.adapters.transport.tcp.adapter import TcpTransportAdapter
+from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
+
+
+@pytest.mark.parametrize("prefix_bytes", [1, 2, 4])
+@pytest.mark.parametrize("byteorder", ["big", "little"])
+def test_length_prefixed_round_trip(prefix_bytes: int, byteorder: str) -> None:
+    framer = create_framer({"id": "length-prefixed", "prefix_bytes": prefix_bytes, "byteorder": byteorder})
+    a, b = socket.socketpair()
+    with a, b:
+        a.sendall(framer.encode(b"hello") + framer.encode(b"") + framer.encode(b"world!"))
+        r = StreamReassembler(framer)
+        assert bytes(r.read_frame(b)) == b"hello"
+        assert bytes(r.read_frame(b)) == b""
+        assert bytes(r.read_frame(b)) == b"world!"
+        assert r.pending == 0
+
+
+def test_frame_split_across_segments_is_reassembled() -> None:
+    framer = create_framer({"id": "length-prefixed", "prefix_bytes": 2})
+    wire = framer.encode(b"abcdefgh")
+    a, b = socket.socketpair()
+    with a, b:
+        r = StreamReassembler(framer)
+        a.sendall(wire[:1])
+        assert r.recv_from(b) == 1 and r.next_frame() is None
+        a.sendall(wire[1:5])
+        r.recv_from(b)
+        assert r.next_frame() is None
+        a.sendall(wire[5:])
+        assert bytes(r.read_frame(b)) == b"abcdefgh"
+
+
+def test_delimiter_and_fixed_size_framers() -> None:
+    r = StreamReassembler(create_framer({"id": "delimiter", "delimiter": "\r\n"}))
+    r.feed(b"one\r\ntw")
+    assert bytes(r.next_frame()) == b"one"
+    assert r.next_frame() is None
+    r.feed(b"o\r\n")
+    assert bytes(r.next_frame()) == b"two"
+
+    fixed = create_framer({"id": "fixed-size", "size": 4})
+    assert fixed.encode(b"ab") == b"ab\x00\x00"
+    r = StreamReassembler(fixed)
+    r.feed(b"abcdefg")
+    assert bytes(r.next_frame()) == b"abcd"
+    assert r.next_frame() is None and r.pending == 3
+
+
+def test_small_buffer_compacts_and_grows_without_losing_bytes() -> None:
+    framer = create_framer({"id": "length-prefixed", "prefix_bytes": 1})
+    r = StreamReassembler(framer, capacity=8)
+    frames = [bytes([i]) * (i % 7) for i in range(1, 40)] + [b"x" * 200]
+    for body in frames:
+        r.feed(framer.encode(body))
+        assert bytes(r.next_frame()) == body
+
+
+def test_compaction_keeps_pending_bytes_that_overlap_their_destination() -> None:
+    framer = create_framer({"id": "length-prefixed", "prefix_bytes": 1})
+    r = StreamReassembler(framer, capacity=8)
+    r.feed(b"\x01a\x06bcde")  # one frame, then 5 pending bytes starting at offset 2
+    assert bytes(r.next_frame()) == b"a"
+    r.feed(b"fg")  # compacts the 5 pending bytes to offset 0: source and destination overlap
+    assert bytes(r.next_frame()) == b"bcdefg"
+
+
+def test_invalid_framing_config_and_oversize_frame() -> None:
+    with pytest.raises(FramingError):
+        create_framer({"id": "bogus"})
+    with pytest.raises(FramingError):
+        create_framer({"id": "length-prefixed", "prefix_bytes": 3})
+    r = StreamReassembler(create_framer({"id": "length-prefixed", "max_frame_bytes": 4}))
+    r.feed(b"\x00\x00\x00\x09")
+    with pytest.raises(FramingError):
+        r.next_frame()
+
+
+def test_tcp_client_counts_coalesced_responses_separately() -> None:
+    framer = create_framer({"id": "length-prefixed", "prefix_bytes": 2})
+    listener = socket.create_server(("127.0.0.1", 0))
+    port = listener.getsockname()[1]
+
+    def serve() -> None:
+        conn, _ = listener.accept()
+        with conn:
+            StreamReassembler(framer).read_frame(conn)
+            conn.sendall(framer.encode(b"r1") + framer.encode(b"r2-longer"))
+            conn.recv(1)
+
+    threading.Thread(target=serve, daemon=True).start()
+    target = TargetRef(
+        target_id="t", name="t", host="127.0.0.1", port=port, protocol="tcp", mode="client",
+        framing={"id": "length-prefixed", "prefix_bytes": 2},
+    )
+    messages = [
+        MessageEnvelope(message_type="PingRequest", direction="send", payload={"id": 1}),
+        MessageEnvelope(message_type="PingResponse", direction="receive", payload={}),
+        MessageEnvelope(message_type="PingResponse", direction="receive", payload={}),
+    ]
+    try:
+        observed = TcpTransportAdapter().execute(target=target, protocol="tcp", messages=messages, timeout_ms=1000)
+    finally:
+        listener.close()
+    assert observed.transport_errors == ()
+    assert [i.get("raw_len") for i in observed.interactions if i["direction"] == "receive"] == [2, 9]
@@ -0,0 +1,39 @@
+"""Unit tests for the transports' encoded-body memo."""
+
+from __future__ import annotations
+
+import gc
+import weakref
+
+from simulator.adapters.transport.common import message_io
+from simulator.adapters.transport.common.message_io import encode_body
+from simulator.domain.models.target_and_task import MessageEnvelope
+
+
+class CountingCodec:
+    def __init__(self) -> None:
+        self.encoded = 0
+
+    def encode(self, msg: MessageEnvelope) -> bytes:
+        self.encoded += 1
+        return b"body"
+
+    def decode(self, data: bytes, expected_type: str | None = None) -> None:
+        return None
+
+
+def test_bodies_encode_once_per_envelope_and_are_dropped_with_it() -> None:
+    codec = CountingCodec()
+    msg = MessageEnvelope(message_type="Ping", direction="send", payload={"id": 1})
+    assert encode_body(msg, codec) == encode_body(msg, codec) == b"body"  # type: ignore[arg-type]
+    assert codec.encoded == 1
+    assert encode_body(msg, None) == b"{'id': 1}"
+    memo = message_io._memo(codec)  # type: ignore[arg-type]
+    del msg
+    gc.collect()
+    assert memo._bodies == {}
+
+    codec_ref = weakref.ref(codec)
+    del codec
+    gc.collect()
+    assert codec_ref() is None  # the memo does not keep codecs alive
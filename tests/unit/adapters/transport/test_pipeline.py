@@ -0,0 +1,157 @@
+"""Unit tests for pipelined TCP clients and the timeout wheel."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+import time
+
+import pytest
+
+from simulator.adapters.contracts import ContractCodec
+from simulator.adapters.contracts.codec import FieldSpec, compile_layout
+from simulator.adapters.transport.common.framing import StreamReassembler, create_framer
+from simulator.adapters.transport.common.pipeline import PipelineCorrelator
+from simulator.adapters.transport.common.timeout_wheel import TimeoutWheel
+from simulator.adapters.transport.tcp.adapter import TcpTransportAdapter
+from simulator.adapters.transport.tcp.async_adapter import AsyncTcpTransportAdapter
+from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
+
+FRAMING = {"id": "length-prefixed"}
+CODEC = ContractCodec({
+    "PingRequest": compile_layout("PingRequest", (FieldSpec("id", "uint32"), FieldSpec("body", "char", 32))),
+    "PingResponse": compile_layout("PingResponse", (FieldSpec("id", "uint32"), FieldSpec("ok", "uint8"))),
+})
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_timeout_wheel_expires_after_deadline_across_rounds_and_honours_cancel() -> None:
+    clock = FakeClock()
+    wheel = TimeoutWheel(tick_sec=0.01, slots=4, clock=clock)
+    wheel.schedule("a", 0.02)
+    wheel.schedule("b", 0.10)  # more than one lap of a 4-slot wheel
+    wheel.schedule("c", 0.05)
+    wheel.cancel("c")
+    clock.now = 0.02
+    assert wheel.advance() == []
+    clock.now = 0.04
+    assert wheel.advance() == ["a"]
+    clock.now = 0.10
+    assert wheel.advance() == []
+    clock.now = 0.13
+    assert wheel.advance() == ["b"]
+    assert len(wheel) == 0
+
+
+def _script(ids: list[int]) -> list[MessageEnvelope]:
+    messages: list[MessageEnvelope] = []
+    for i in ids:
+        messages.append(MessageEnvelope(message_type="PingRequest", direction="send", payload={"id": i, "body": "x"}))
+        messages.append(MessageEnvelope(message_type="PingResponse", direction="receive", payload={}))
+    return messages
+
+
+def _reversing_server(answer: int | None = None) -> tuple[socket.socket, threading.Event]:
+    """Reads `count` requests before replying to all of them in reverse order (skipping id `answer`)."""
+    framer = create_framer(FRAMING)
+    listener = socket.create_server(("127.0.0.1", 0))
+    done = threading.Event()
+
+    def serve(count: int = 4) -> None:
+        conn, _ = listener.accept()
+        with conn:
+            reassembler = StreamReassembler(framer)
+            ids = [CODEC.decode(reassembler.read_frame(conn), "PingRequest")[1]["id"] for _ in range(count)]
+            for i in reversed(ids):
+                if i != answer:
+                    reply = MessageEnvelope(message_type="PingResponse", direction="send", payload={"id": i, "ok": 1})
+                    conn.sendall(framer.encode(CODEC.encode(reply)))
+            done.wait(2)
+
+    threading.Thread(target=serve, daemon=True).start()
+    return listener, done
+
+
+def _target(port: int) -> TargetRef:
+    return TargetRef(
+        target_id="t", name="t", host="127.0.0.1", port=port, protocol="tcp", mode="client",
+        framing=FRAMING, pipeline={"correlation_key": "id"},
+    )
+
+
+def _assert_correlated_in_script_order(interactions: tuple[dict[str, object], ...], ids: list[int]) -> None:
+    assert [i["direction"] for i in interactions] == ["send", "receive"] * len(ids)
+    receives = [i for i in interactions if i["direction"] == "receive"]
+    assert [r["payload"]["id"] for r in receives] == ids
+    assert all(r["message_type"] == "PingResponse" and r["correlation"] == r["payload"]["id"] for r in receives)
+
+
+def test_pipelined_client_correlates_out_of_order_responses() -> None:
+    ids = [11, 22, 33, 44]
+    listener, done = _reversing_server()
+    try:
+        observed = TcpTransportAdapter(codec=CODEC).execute(
+            target=_target(listener.getsockname()[1]), protocol="tcp", messages=_script(ids), timeout_ms=2000
+        )
+    finally:
+        done.set()
+        listener.close()
+    assert observed.transport_errors == ()
+    _assert_correlated_in_script_order(observed.interactions, ids)
+
+
+def test_async_pipelined_client_correlates_out_of_order_responses() -> None:
+    ids = [5, 6, 7, 8]
+    listener, done = _reversing_server()
+    try:
+        observed = asyncio.run(
+            AsyncTcpTransportAdapter(codec=CODEC).execute_async(
+                target=_target(listener.getsockname()[1]), protocol="tcp", messages=_script(ids), timeout_ms=2000
+            )
+        )
+    finally:
+        done.set()
+        listener.close()
+    assert observed.transport_errors == ()
+    _assert_correlated_in_script_order(observed.interactions, ids)
+
+
+def test_missing_response_times_out_only_its_own_step() -> None:
+    ids = [1, 2, 3, 4]
+    listener, done = _reversing_server(answer=3)
+    try:
+        observed = TcpTransportAdapter(codec=CODEC).execute(
+            target=_target(listener.getsockname()[1]), protocol="tcp", messages=_script(ids), timeout_ms=200
+        )
+    finally:
+        done.set()
+        listener.close()
+    assert observed.transport_errors == ("TRANSPORT_READ_TIMEOUT",)
+    assert [i["payload"]["id"] for i in observed.interactions if i["direction"] == "receive"] == [1, 2, 4]
+
+
+def test_reader_failure_is_reported_not_left_to_time_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    def boom(self: PipelineCorrelator, frame: object) -> None:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(PipelineCorrelator, "on_frame", boom)
+    listener, done = _reversing_server()
+    try:
+        started = time.perf_counter()
+        observed = TcpTransportAdapter(codec=CODEC).execute(
+            target=_target(listener.getsockname()[1]), protocol="tcp", messages=_script([1, 2, 3, 4]), timeout_ms=5000
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        done.set()
+        listener.close()
+    assert elapsed < 2.0  # the outstanding requests are abandoned when the reader dies, not at the 5s timeout
+    assert "TRANSPORT_ERROR:boom" in observed.transport_errors
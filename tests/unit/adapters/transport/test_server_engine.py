@@ -0,0 +1,160 @@
+"""Unit tests for the multi-connection TCP server engine."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+import time
+from collections import Counter
+
+from simulator.adapters.transport.common.framing import StreamReassembler, create_framer
+from simulator.adapters.transport.tcp.adapter import TcpTransportAdapter
+from simulator.adapters.transport.tcp.async_adapter import AsyncTcpTransportAdapter
+from simulator.domain.models.run_models import ObservedInteractions
+from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
+
+FRAMING = {"id": "length-prefixed", "prefix_bytes": 2}
+SCRIPT = [
+    MessageEnvelope(message_type="PingRequest", direction="receive", payload={}),
+    MessageEnvelope(message_type="PingResponse", direction="send", payload={"ok": 1}),
+]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _serve_in_background(target: TargetRef, timeout_ms: int) -> tuple[threading.Thread, list[ObservedInteractions]]:
+    result: list[ObservedInteractions] = []
+    thread = threading.Thread(
+        target=lambda: result.append(
+            TcpTransportAdapter().execute(target=target, protocol="tcp", messages=SCRIPT, timeout_ms=timeout_ms)
+        ),
+        daemon=True,
+    )
+    thread.start()
+    return thread, result
+
+
+def _connect(port: int) -> socket.socket:
+    deadline = time.monotonic() + 2.0
+    while True:
+        try:
+            return socket.create_connection(("127.0.0.1", port), timeout=2.0)
+        except ConnectionRefusedError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.01)
+
+
+def test_serves_many_concurrent_clients_with_per_connection_interactions() -> None:
+    clients = 200
+    port = _free_port()
+    target = TargetRef(
+        target_id="s", name="s", host="127.0.0.1", port=port, protocol="tcp", mode="server",
+        framing=FRAMING, server={"backlog": 256, "max_connections": clients},
+    )
+    thread, result = _serve_in_background(target, timeout_ms=3000)
+    framer = create_framer(FRAMING)
+    # All clients are connected before any sends, so the server must hold them open concurrently.
+    socks = [_connect(port) for _ in range(clients)]
+    try:
+        for i, s in enumerate(socks):
+            s.sendall(framer.encode(b"ping-%d" % i))
+        replies = [StreamReassembler(framer).read_frame(s) for s in socks]
+    finally:
+        for s in socks:
+            s.close()
+    thread.join(5)
+    assert all(r is not None and bytes(r) == b"{'ok': 1}" for r in replies)
+    observed = result[0]
+    assert observed.transport_errors == ()
+    per_conn = Counter(i["connection_id"] for i in observed.interactions)
+    assert len(per_conn) == clients and set(per_conn.values()) == {2}
+
+
+def test_frames_split_across_segments_are_tracked_per_connection() -> None:
+    port = _free_port()
+    target = TargetRef(
+        target_id="s", name="s", host="127.0.0.1", port=port, protocol="tcp", mode="server",
+        framing=FRAMING, server={"max_connections": 2},
+    )
+    thread, result = _serve_in_background(target, timeout_ms=2000)
+    framer = create_framer(FRAMING)
+    wire_a, wire_b = framer.encode(b"aaaa"), framer.encode(b"bbbbbbbb")
+    a, b = _connect(port), _connect(port)
+    with a, b:
+        a.sendall(wire_a[:3])
+        b.sendall(wire_b[:1])
+        time.sleep(0.05)
+        b.sendall(wire_b[1:])
+        a.sendall(wire_a[3:])
+        assert StreamReassembler(framer).read_frame(a) is not None
+        assert StreamReassembler(framer).read_frame(b) is not None
+    thread.join(5)
+    receives = sorted(i["raw_len"] for i in result[0].interactions if i["direction"] == "receive")
+    assert receives == [4, 8]
+
+
+def test_silent_client_times_out_and_no_client_reports_timeout() -> None:
+    port = _free_port()
+    target = TargetRef(
+        target_id="s", name="s", host="127.0.0.1", port=port, protocol="tcp", mode="server",
+        framing=FRAMING, server={"max_connections": 1},
+    )
+    thread, result = _serve_in_background(target, timeout_ms=200)
+    with _connect(port):
+        thread.join(5)
+    assert result[0].transport_errors == ("TRANSPORT_READ_TIMEOUT",)
+
+    idle = TcpTransportAdapter().execute(
+        target=TargetRef(target_id="s", name="s", host="127.0.0.1", port=_free_port(), protocol="tcp", mode="server"),
+        protocol="tcp", messages=SCRIPT, timeout_ms=50,
+    )
+    assert idle.transport_errors == ("TRANSPORT_ERROR:timed out",)
+
+
+def test_default_server_run_returns_as_soon_as_its_client_is_done() -> None:
+    port = _free_port()
+    target = TargetRef(
+        target_id="s", name="s", host="127.0.0.1", port=port, protocol="tcp", mode="server", framing=FRAMING
+    )
+    thread, result = _serve_in_background(target, timeout_ms=3000)
+    framer = create_framer(FRAMING)
+    with _connect(port) as s:
+        s.sendall(framer.encode(b"ping"))
+        assert StreamReassembler(framer).read_frame(s) is not None
+        done = time.monotonic()
+    thread.join(5)
+    assert time.monotonic() - done < 1.0  # not the 3s idle window
+    assert result[0].transport_errors == ()
+    assert [i["direction"] for i in result[0].interactions] == ["receive", "send"]
+
+
+def test_async_server_mode_runs_the_same_engine() -> None:
+    clients = 5
+    port = _free_port()
+    target = TargetRef(
+        target_id="s", name="s", host="127.0.0.1", port=port, protocol="tcp", mode="server",
+        framing=FRAMING, server={"max_connections": clients},
+    )
+    result: list[ObservedInteractions] = []
+    run = AsyncTcpTransportAdapter().execute_async(target=target, protocol="tcp", messages=SCRIPT, timeout_ms=3000)
+    thread = threading.Thread(target=lambda: result.append(asyncio.run(run)), daemon=True)
+    thread.start()
+    framer = create_framer(FRAMING)
+    socks = [_connect(port) for _ in range(clients)]  # held open together: more than one client at a time
+    try:
+        for s in socks:
+            s.sendall(framer.encode(b"ping"))
+        replies = [StreamReassembler(framer).read_frame(s) for s in socks]
+    finally:
+        for s in socks:
+            s.close()
+    thread.join(5)
+    assert all(r is not None and bytes(r) == b"{'ok': 1}" for r in replies)
+    assert result[0].transport_errors == ()
+    assert Counter(i["connection_id"] for i in result[0].interactions) == {c: 2 for c in range(1, clients + 1)}
@@ -0,0 +1,157 @@
+"""Unit tests for the UDP responder (server mode)."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+import time
+from collections import Counter
+
+from simulator.adapters.contracts import ContractCodec
+from simulator.adapters.contracts.codec import FieldSpec, compile_layout
+from simulator.adapters.transport.udp.adapter import UdpTransportAdapter
+from simulator.adapters.transport.udp.async_adapter import AsyncUdpTransportAdapter
+from simulator.domain.models.run_models import ObservedInteractions
+from simulator.domain.models.target_and_task import MessageEnvelope, TargetRef
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _serve(
+    adapter: UdpTransportAdapter, target: TargetRef, messages: list[MessageEnvelope]
+) -> tuple[threading.Thread, list[ObservedInteractions]]:
+    result: list[ObservedInteractions] = []
+    thread = threading.Thread(
+        target=lambda: result.append(
+            adapter.execute(target=target, protocol="udp", messages=messages, timeout_ms=300)
+        ),
+        daemon=True,
+    )
+    thread.start()
+    return thread, result
+
+
+def _client(port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.settimeout(2.0)
+    sock.connect(("127.0.0.1", port))
+    return sock
+
+
+def _request(sock: socket.socket, data: bytes) -> bytes:
+    """Send and await the reply, retrying while the responder thread has not bound yet."""
+    while True:
+        sock.send(data)
+        try:
+            return sock.recv(64)
+        except ConnectionRefusedError:
+            time.sleep(0.01)
+
+
+def test_dispatches_responses_by_decoded_message_type_per_peer() -> None:
+    codec = ContractCodec({
+        "Ping": compile_layout("Ping", (FieldSpec("id", "uint32"),)),
+        "Status": compile_layout("Status", (FieldSpec("id", "uint16"),)),
+        "Pong": compile_layout("Pong", (FieldSpec("id", "uint32"), FieldSpec("ok", "uint32"))),
+        "StatusReply": compile_layout("StatusReply", (FieldSpec("state", "uint8"),)),
+    })
+    script = [
+        MessageEnvelope(message_type="Ping", direction="receive", payload={}),
+        MessageEnvelope(message_type="Pong", direction="send", payload={"id": 1, "ok": 1}),
+        MessageEnvelope(message_type="Status", direction="receive", payload={}),
+        MessageEnvelope(message_type="StatusReply", direction="send", payload={"state": 3}),
+    ]
+    port = _free_port()
+    target = TargetRef(target_id="u", name="u", host="127.0.0.1", port=port, protocol="udp", mode="server")
+    thread, result = _serve(UdpTransportAdapter(codec=codec), target, script)
+    a, b = _client(port), _client(port)
+    with a, b:
+        for _ in range(3):
+            status = codec.encode(MessageEnvelope(message_type="Status", direction="send", payload={"id": 9}))
+            assert codec.decode(_request(a, status)) == ("StatusReply", {"state": 3})
+        ping = codec.encode(MessageEnvelope(message_type="Ping", direction="send", payload={"id": 5}))
+        assert codec.decode(_request(b, ping)) == ("Pong", {"id": 1, "ok": 1})
+    thread.join(5)
+    observed = result[0]
+    assert observed.transport_errors == ()
+    by_peer = Counter((i["peer"], i["direction"], i["message_type"]) for i in observed.interactions)
+    assert sorted(by_peer.values()) == [1, 1, 3, 3]
+    assert len({peer for peer, _, _ in by_peer}) == 2
+
+
+def test_untyped_datagrams_follow_each_peers_script_position_for_the_whole_window() -> None:
+    script = [
+        MessageEnvelope(message_type="Hello", direction="receive", payload={}),
+        MessageEnvelope(message_type="Welcome", direction="send", payload={"n": 1}),
+        MessageEnvelope(message_type="Data", direction="receive", payload={}),
+        MessageEnvelope(message_type="Ack", direction="send", payload={"n": 2}),
+    ]
+    port = _free_port()
+    target = TargetRef(target_id="u", name="u", host="127.0.0.1", port=port, protocol="udp", mode="server")
+    thread, result = _serve(UdpTransportAdapter(), target, script)
+    total = 2000
+    with _client(port) as c:
+        replies = [_request(c, b"x%d" % i) for i in range(total)]
+    thread.join(5)
+    assert replies[:2] == [b"{'n': 1}\n", b"{'n': 2}\n"]
+    receives = [i for i in result[0].interactions if i["direction"] == "receive"]
+    assert not any("message_type" in i for i in receives)  # answered by position, but left untyped
+    assert Counter(i["script_type"] for i in receives) == {"Hello": total // 2, "Data": total // 2}
+    sends = Counter(i["message_type"] for i in result[0].interactions if i["direction"] == "send")
+    assert sends == {"Welcome": total // 2, "Ack": total // 2}
+
+
+def test_async_server_mode_runs_the_responder() -> None:
+    script = [
+        MessageEnvelope(message_type="Hello", direction="receive", payload={}),
+        MessageEnvelope(message_type="Welcome", direction="send", payload={"n": 1}),
+        MessageEnvelope(message_type="Data", direction="receive", payload={}),
+        MessageEnvelope(message_type="Ack", direction="send", payload={"n": 2}),
+    ]
+    port = _free_port()
+    target = TargetRef(target_id="u", name="u", host="127.0.0.1", port=port, protocol="udp", mode="server")
+    result: list[ObservedInteractions] = []
+    thread = threading.Thread(
+        target=lambda: result.append(asyncio.run(
+            AsyncUdpTransportAdapter().execute_async(target=target, protocol="udp", messages=script, timeout_ms=300)
+        )),
+        daemon=True,
+    )
+    thread.start()
+    with _client(port) as c:
+        replies = [_request(c, b"x%d" % i) for i in range(4)]
+    thread.join(5)
+    assert replies == [b"{'n': 1}\n", b"{'n': 2}\n"] * 2
+    assert [i["script_type"] for i in result[0].interactions if i["direction"] == "receive"] == ["Hello", "Data"] * 2
+
+
+def test_no_datagrams_reports_read_timeout() -> None:
+    target = TargetRef(target_id="u", name="u", host="127.0.0.1", port=_free_port(), protocol="udp", mode="server")
+    observed = UdpTransportAdapter().execute(
+        target=target, protocol="udp",
+        messages=[MessageEnvelope(message_type="Hello", direction="receive", payload={})], timeout_ms=50,
+    )
+    assert observed.transport_errors == ("TRANSPORT_READ_TIMEOUT",)
+
+
+def test_client_mode_closes_its_socket_when_encoding_fails(monkeypatch) -> None:
+    opened: list[socket.socket] = []
+
+    class _TrackedSocket(socket.socket):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            opened.append(self)
+
+    monkeypatch.setattr(socket, "socket", _TrackedSocket)
+    target = TargetRef(target_id="u", name="u", host="127.0.0.1", port=_free_port(), protocol="udp", mode="client")
+    result = UdpTransportAdapter(codec=ContractCodec({})).execute(
+        target=target, protocol="udp",
+        messages=[MessageEnvelope(message_type="Unknown", direction="send", payload={})], timeout_ms=50,
+    )
+    assert result.transport_errors[0].startswith("CODEC_ENCODE_FAILED")
+    assert opened and all(s.fileno() == -1 for s in opened)
@@ -0,0 +1,17 @@
+"""Unit tests for target resolution from runtime config."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from simulator.config.targets import load_targets_from_config
+
+SAMPLE = Path(__file__).resolve().parents[2] / "fixtures" / "config" / "runtime-config.sample.json"
+
+
+def test_runtime_config_targets_carry_framing() -> None:
+    targets = load_targets_from_config(json.loads(SAMPLE.read_text(encoding="utf-8")))
+    target = targets["target-a"]
+    assert (target.host, target.port, target.protocol, target.mode) == ("127.0.0.1", 9000, "tcp", "client")
+    assert target.framing == {"id": "length-prefixed"}
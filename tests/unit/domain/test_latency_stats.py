@@ -0,0 +1,29 @@
+"""Unit tests for latency statistics over observed interactions."""
+
+from __future__ import annotations
+
+from simulator.domain.services.latency_stats import percentile, summarize_latency
+
+
+def test_nearest_rank_percentile() -> None:
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([7], 90) == 7
+    assert percentile([], 50) == 0.0
+
+
+def test_summarize_latency_uses_only_paired_receives() -> None:
+    interactions = [
+        {"direction": "send", "timestamp_ns": 0},
+        {"direction": "receive", "timestamp_ns": 2_000_000, "latency_ns": 2_000_000},
+        {"direction": "send", "timestamp_ns": 3_000_000},
+        {"direction": "receive", "timestamp_ns": 7_000_000, "latency_ns": 4_000_000},
+        {"direction": "receive", "timestamp_ns": 8_000_000},
+    ]
+    summary = summarize_latency(interactions)
+    assert summary["count"] == 2
+    assert summary["min_ms"] == 2.0 and summary["max_ms"] == 4.0 and summary["mean_ms"] == 3.0
+    assert summary["p50_ms"] == 2.0 and summary["p99_ms"] == 4.0
+    assert summarize_latency([{"direction": "send"}]) == {"count": 0}
@@ -0,0 +1,68 @@
+"""Unit tests for the open-loop load generator."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from simulator.domain.models.run_models import RunInput
+from simulator.domain.services import LoadProfile, SimulationService
+from simulator.domain.services.load_generator import run_open_loop
+
+
+def test_arrival_schedules() -> None:
+    assert LoadProfile(rate_per_sec=4, count=3).intended_offsets() == [0.0, 0.25, 0.5]
+    assert LoadProfile(rate_per_sec=10, duration_sec=0.5).request_count() == 5
+    poisson = LoadProfile(rate_per_sec=100, count=2000, arrival="poisson", seed=7)
+    offsets = poisson.intended_offsets()
+    assert offsets == poisson.intended_offsets()
+    assert abs(offsets[-1] / (len(offsets) - 1) - 0.01) < 0.001
+    assert LoadProfile(rate_per_sec=0, count=1).validate() == "LOAD_RATE_INVALID"
+    assert LoadProfile(rate_per_sec=1, count=1, arrival="burst").validate() == "LOAD_ARRIVAL_INVALID"
+    assert LoadProfile(rate_per_sec=1).validate() == "LOAD_COUNT_INVALID"
+
+
+def test_requests_are_issued_on_schedule_not_after_responses() -> None:
+    async def slow_run(i: int) -> dict[str, object]:
+        await asyncio.sleep(0.2)
+        return {"run_id": f"r{i}", "verification": {"passed": True}, "observed": {"transport_errors": []}}
+
+    began = time.perf_counter()
+    report = asyncio.run(run_open_loop(slow_run, LoadProfile(rate_per_sec=100, count=10)))
+    # Closed-loop would take 10 x 200 ms; open-loop overlaps them.
+    assert time.perf_counter() - began < 1.0
+    assert report["requests"] == 10 and report["passed"] == 10
+    starts = [r["actual_start_s"] for r in report["records"]]
+    assert starts[-1] < 0.2
+    assert report["latency_service"]["min_ms"] >= 200
+    assert 0 < report["achieved_throughput_per_sec"] <= 100
+
+
+def test_corrected_latency_includes_start_lag() -> None:
+    async def stalls_loop_once(i: int) -> dict[str, object]:
+        if i == 0:
+            time.sleep(0.1)  # blocks the loop: later requests start late
+        return {"verification": {"passed": False}, "observed": {"transport_errors": ["X"]}}
+
+    report = asyncio.run(run_open_loop(stalls_loop_once, LoadProfile(rate_per_sec=100, count=5)))
+    assert report["failed"] == 5
+    assert report["start_lag"]["max_ms"] >= 50
+    assert report["latency_corrected"]["max_ms"] >= report["start_lag"]["max_ms"]
+    assert report["latency_corrected"]["max_ms"] > report["latency_service"]["max_ms"]
+
+
+def test_simulation_service_run_load_uses_run_async_per_request() -> None:
+    class Workflow:
+        def __init__(self) -> None:
+            self.inputs: list[RunInput] = []
+
+        async def run_async(self, run_input: RunInput) -> dict[str, object]:
+            self.inputs.append(run_input)
+            return {"run_id": run_input.run_id, "verification": {"passed": True}, "observed": {}}
+
+    workflow = Workflow()
+    report = SimulationService(workflow).run_load(  # type: ignore[arg-type]
+        target_id="t", task_id="ping-smoke", profile=LoadProfile(rate_per_sec=200, count=4), run_id_prefix="lg"
+    )
+    assert report["ok"] is True and report["passed"] == 4
+    assert [i.run_id for i in workflow.inputs] == ["lg-0", "lg-1", "lg-2", "lg-3"]
@@ -2,7 +2,16 @@
 
 from __future__ import annotations
 
+import threading
+import time
+
+import pytest
+
+from simulator.domain.models.periodic_runtime import PeriodicTaskRuntime
+from simulator.domain.ports.clock_port import ClockPort
+from simulator.domain.services.clock import SystemClock, VirtualClock
 from simulator.domain.services.periodic_scheduler import PeriodicScheduler
+from simulator.domain.services.periodic_toggle_service import PeriodicToggleService
 
 
 def test_enabled_periodic_tasks_run_during_active_run() -> None:
@@ -11,3 +20,99 @@ def test_enabled_periodic_tasks_run_during_active_run() -> None:
     assert s.is_running("run-1")
     s.stop("run-1")
     assert not s.is_running("run-1")
+
+
+class Recorder:
+    """execute callback: records the (start, end) clock time of every execution."""
+
+    def __init__(self, clock: ClockPort, duration: float = 0.0) -> None:
+        self.clock = clock
+        self.duration = duration
+        self.lock = threading.Lock()
+        self.spans: list[tuple[float, float]] = []
+
+    def __call__(self, runtime: PeriodicTaskRuntime) -> None:
+        started = self.clock.now()
+        self.clock.sleep(self.duration)
+        with self.lock:
+            self.spans.append((started, self.clock.now()))
+
+    @property
+    def times(self) -> list[float]:
+        with self.lock:
+            return [start for start, _ in self.spans]
+
+    @property
+    def peak(self) -> int:
+        """Most executions running at once."""
+        edges = sorted([(start, 1) for start, _ in self.spans] + [(end, -1) for _, end in self.spans])
+        active = peak = 0
+        for _, step in edges:  # an end sorts before a start at the same instant
+            active += step
+            peak = max(peak, active)
+        return peak
+
+
+def _runtime(task_id: str, interval_ms: int, policy: str = "skip") -> PeriodicTaskRuntime:
+    return PeriodicTaskRuntime(task_id, "run-1", enabled=True, interval_ms=interval_ms, overlap_policy=policy)
+
+
+def test_fires_stay_on_the_interval_grid() -> None:
+    clock = VirtualClock()
+    recorder = Recorder(clock)
+    s = PeriodicScheduler(execute=recorder, clock=clock)
+    s.start("run-1")
+    assert s.add(_runtime("tick", 20)) is None
+    assert s.run_until(0.51) == 26  # 0.5s / 20ms, plus the fire at start
+    assert recorder.times == pytest.approx([k * 0.02 for k in range(26)])
+    assert s.stats("run-1", "tick")["missed"] == 0  # type: ignore[index]
+
+
+def test_overlap_policies_are_enforced() -> None:
+    clock = VirtualClock()
+    recorders = {p: Recorder(clock, duration=0.035) for p in ("skip", "queue", "parallel")}
+    s = PeriodicScheduler(execute=lambda rt: recorders[rt.overlap_policy](rt), clock=clock)
+    s.start("run-1")
+    for policy in recorders:
+        s.add(_runtime(policy, 10, policy))
+    s.run_until(0.295)
+    stats = {p: s.stats("run-1", p) for p in recorders}
+    assert recorders["skip"].peak == 1 and stats["skip"]["skipped"] > 0  # type: ignore[index]
+    queued = stats["queue"]["fired"]  # type: ignore[index]
+    assert recorders["queue"].times == pytest.approx([k * 0.035 for k in range(queued)])  # type: ignore[call-overload]
+    assert recorders["parallel"].peak == 4  # 35ms executions started every 10ms
+    assert s.add(_runtime("bad", 10, "drop")) == "PERIODIC_OVERLAP_POLICY_INVALID"
+
+
+def test_toggle_changes_apply_immediately_and_stop_removes_tasks() -> None:
+    clock = VirtualClock()
+    toggles = PeriodicToggleService()
+    recorder = Recorder(clock)
+    s = PeriodicScheduler(execute=recorder, toggles=toggles, clock=clock)
+    s.start("run-1")
+    s.add(_runtime("slow", 10_000))
+    s.run_until(0.05)
+    assert recorder.times == [0.0]  # the fire at start; the next is 10s away
+    toggles.set_enabled("slow", False)
+    toggles.set_enabled("slow", True)  # resumes with an immediate fire
+    s.run_until(0.1)
+    assert recorder.times == [0.0, 0.05]
+    toggles.set_enabled("slow", False)
+    assert s.stats("run-1", "slow")["active"] is False  # type: ignore[index]
+    s.run_until(20.0)
+    assert len(recorder.times) == 2
+    s.stop("run-1")
+    assert s.stats("run-1", "slow") is None
+
+
+def test_timer_thread_fires_on_the_system_clock() -> None:
+    clock = SystemClock()
+    recorder = Recorder(clock)
+    s = PeriodicScheduler(execute=recorder, clock=clock)
+    s.start("run-1")
+    started = clock.now()
+    s.add(_runtime("tick", 10))
+    while len(recorder.times) < 3 and clock.now() - started < 5.0:
+        time.sleep(0.01)
+    s.close()
+    assert len(recorder.times) >= 3
@@ -0,0 +1,160 @@
+"""Unit tests for bounded concurrent runs: global and per-target caps, streaming results, admission."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from simulator.config.targets import DEFAULT_MAX_CONCURRENT_RUNS
+from simulator.domain.models.run_models import RunInput
+from simulator.domain.services import SimulationService
+from simulator.domain.services.cancellation import CancellationToken
+from simulator.domain.services.run_pool import RunPool
+
+
+class Workflow:
+    """Records how many runs overlap, overall and per target."""
+
+    def __init__(self, delays: dict[str, float] | None = None) -> None:
+        self.delays = delays or {}
+        self.lock = threading.Lock()
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.total = self.peak_total = 0
+        self.finished: list[str] = []
+
+    def run(self, run_input: RunInput, cancel: CancellationToken | None = None) -> dict[str, object]:
+        target = run_input.target_id
+        with self.lock:
+            self.total += 1
+            self.active[target] = self.active.get(target, 0) + 1
+            self.peak_total = max(self.peak_total, self.total)
+            self.peak[target] = max(self.peak.get(target, 0), self.active[target])
+        if run_input.task_id == "boom":
+            raise RuntimeError("transport exploded")
+        time.sleep(self.delays.get(run_input.run_id, self.delays.get(target, 0.01)))
+        with self.lock:
+            self.total -= 1
+            self.active[target] -= 1
+            self.finished.append(run_input.run_id)
+        return {"run_id": run_input.run_id, "verification": {"passed": True}, "observed": {}}
+
+
+def _inputs(target: str, n: int, task_id: str = "t") -> list[RunInput]:
+    return [RunInput(f"{target}-{i}", target, task_id, "tcp") for i in range(n)]
+
+
+def test_global_and_per_target_caps_hold_without_blocking_other_targets() -> None:
+    workflow = Workflow({"slow": 0.03, "fast": 0.005})
+    pool = RunPool(workflow.run, max_concurrent=4, target_limits={"slow": 1})
+    suite = [x for pair in zip(_inputs("slow", 5), _inputs("fast", 5)) for x in pair] + _inputs("fast", 20)[5:]
+    results = list(pool.run_many(suite))
+    pool.shutdown()
+    assert sorted(r["run_id"] for r in results) == sorted(r.run_id for r in suite)
+    assert workflow.peak_total == 4
+    assert workflow.peak["slow"] == 1
+    assert workflow.finished.index("fast-19") < workflow.finished.index("slow-4")  # fast runs overtake
+
+
+def test_results_stream_in_completion_order_and_failures_become_results() -> None:
+    workflow = Workflow({"t-0": 0.2})
+    pool = RunPool(workflow.run, max_concurrent=2)
+    stream = pool.run_many(_inputs("t", 4) + [RunInput("bad", "t", "boom", "tcp")])
+    results = list(stream)
+    pool.shutdown()
+    assert results[-1]["run_id"] == "t-0"
+    failed = next(r for r in results if r["run_id"] == "bad")
+    assert failed["observed"]["transport_errors"] == ["RUN_EXCEPTION"]  # type: ignore[index]
+
+
+def test_admission_blocks_submitters_until_runs_finish() -> None:
+    gate = threading.Event()
+    pool = RunPool(lambda r, cancel: gate.wait() and {"run_id": r.run_id}, max_concurrent=1, queued_per_worker=1)
+    futures = [pool.submit(x) for x in _inputs("t", 2)]
+    third = threading.Thread(target=lambda: futures.append(pool.submit(_inputs("t", 3)[2])))
+    third.start()
+    third.join(0.1)
+    assert third.is_alive() and len(futures) == 2
+    gate.set()
+    third.join(2)
+    assert [f.result(2)["run_id"] for f in futures] == ["t-0", "t-1", "t-2"]
+    pool.shutdown()
+
+
+def test_simulation_service_submit_uses_the_configured_parallelism() -> None:
+    workflow = Workflow()
+    service = SimulationService(workflow)  # type: ignore[arg-type]
+    futures = [service.submit(run_id=f"r{i}", target_id="t", task_id="x") for i in range(3)]
+    assert {f.result(2)["run_id"] for f in futures} == {"r0", "r1", "r2"}
+    assert service._run_pool().max_concurrent == DEFAULT_MAX_CONCURRENT_RUNS
+    service.shutdown()
+
+
+def test_shutdown_without_wait_cancels_running_tokens() -> None:
+    started = threading.Event()
+
+    def run_one(run_input: RunInput, cancel: CancellationToken) -> dict[str, object]:
+        started.set()
+        return {"run_id": run_input.run_id, "cancelled": cancel.wait(5.0)}
+
+    pool = RunPool(run_one, max_concurrent=1)
+    token = CancellationToken()
+    running, queued = pool.submit(RunInput("a", "t", "x", "tcp"), token), pool.submit(RunInput("b", "t", "x", "tcp"))
+    assert started.wait(1.0)
+    begun = time.perf_counter()
+    pool.shutdown(wait=False)
+    assert running.result(timeout=1.0)["cancelled"] is True
+    assert time.perf_counter() - begun < 1.0
+    assert queued.cancelled() and not token.cancelled  # the run's own token was cancelled, not the caller's
+
+
+def test_shutdown_cancels_every_run_sharing_a_token_after_one_finishes() -> None:
+    waiting = threading.Barrier(4)  # every run has registered the token before quick finishes
+
+    def run_one(run_input: RunInput, cancel: CancellationToken) -> dict[str, object]:
+        waiting.wait(1.0)
+        if run_input.run_id == "quick":
+            return {"run_id": "quick"}
+        return {"run_id": run_input.run_id, "cancelled": cancel.wait(5.0)}
+
+    pool = RunPool(run_one, max_concurrent=3)
+    token = CancellationToken()
+    quick = pool.submit(RunInput("quick", "t", "x", "tcp"), token)
+    slow = [pool.submit(RunInput(f"slow-{i}", "t", "x", "tcp"), token) for i in range(2)]
+    waiting.wait(1.0)
+    quick.result(timeout=1.0)
+    time.sleep(0.05)  # let its worker release the shared token
+    pool.shutdown(wait=False)
+    assert all(f.result(timeout=1.0)["cancelled"] is True for f in slow)
+
+
+def test_shutdown_cancels_runs_submitted_without_a_token() -> None:
+    started = threading.Barrier(3)
+
+    def run_one(run_input: RunInput, cancel: CancellationToken) -> dict[str, object]:
+        started.wait(1.0)
+        return {"run_id": run_input.run_id, "cancelled": cancel.wait(5.0)}
+
+    pool = RunPool(run_one, max_concurrent=2)
+    running = [pool.submit(RunInput(f"r{i}", "t", "x", "tcp")) for i in range(2)]
+    started.wait(1.0)
+    begun = time.perf_counter()
+    pool.shutdown(wait=False)
+    assert all(f.result(timeout=1.0)["cancelled"] is True for f in running)
+    assert time.perf_counter() - begun < 1.0
+
+
+def test_a_caller_token_cancels_the_runs_linked_to_it() -> None:
+    started = threading.Event()
+
+    def run_one(run_input: RunInput, cancel: CancellationToken) -> dict[str, object]:
+        started.set()
+        return {"run_id": run_input.run_id, "cancelled": cancel.wait(5.0)}
+
+    pool = RunPool(run_one, max_concurrent=1)
+    token = CancellationToken()
+    future = pool.submit(RunInput("a", "t", "x", "tcp"), token)
+    assert started.wait(1.0)
+    token.cancel()
+    assert future.result(timeout=1.0)["cancelled"] is True
+    pool.shutdown()
@@ -0,0 +1,204 @@
+"""Unit tests for compiled execution plans and the per-task plan cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import tracemalloc
+from collections.abc import Iterable
+from pathlib import Path
+
+from simulator.adapters.events import InMemoryEventBus
+from simulator.adapters.logging import ConsoleLoggingAdapter
+from simulator.adapters.tasks import FileTaskRegistryAdapter
+from simulator.adapters.tasks.file_task_registry import load_task_file_from_dict
+from simulator.adapters.transport.common.message_io import encode_body
+from simulator.adapters.verification import CountVerificationAdapter
+from simulator.domain.models.run_models import ObservedInteractions, RunInput
+from simulator.domain.models.target_and_task import TargetRef
+from simulator.domain.services.execution_plan import ExecutionPlanCache, compile_plan
+from simulator.workflows import RunWorkflow
+
+DEFINITION = {
+    "task_id": "echo",
+    "name": "Echo",
+    "defaults": {"protocol": "udp"},
+    "payloads": {"p": {"id": 1}},
+    "steps": [
+        {"step_id": "s1", "action": "send", "message_type": "Ping", "payload_ref": "p", "timeout_ms": 100},
+        {
+            "step_id": "s2",
+            "action": "receive_expectation",
+            "message_type": "Pong",
+            "timeout_ms": 750,
+            "expect": {"matcher": {"direction": "receive", "message_type": "Pong"}, "expected_count": 1},
+        },
+    ],
+}
+
+
+def test_compile_plan_builds_script_rules_and_step_deadlines() -> None:
+    plan = compile_plan(load_task_file_from_dict(DEFINITION))
+    assert [(m.direction, m.message_type, m.timeout_ms) for m in plan.iter_messages()] == [
+        ("send", "Ping", None),
+        ("receive", "Pong", 750),
+    ]
+    assert plan.step_deadlines_ms == (100, 750)
+    assert plan.timeout_ms == 750
+    assert plan.default_protocol == "udp"
+    assert plan.expected_rules == (
+        {"message_type": "Pong", "direction": "receive", "expected_count": 1, "comparison": "eq"},
+    )
+
+
+def test_cache_reuses_plan_until_content_hash_changes() -> None:
+    cache = ExecutionPlanCache()
+    task = load_task_file_from_dict(DEFINITION)
+    first = cache.get(task)
+    assert cache.get(load_task_file_from_dict(DEFINITION)) is first
+    edited = load_task_file_from_dict({**DEFINITION, "payloads": {"p": {"id": 2}}})
+    assert edited.content_hash != task.content_hash
+    second = cache.get(edited)
+    assert second is not first and next(second.iter_messages()).payload == {"id": 2}
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 1)
+
+
+def test_send_bodies_are_encoded_once_per_envelope() -> None:
+    class CountingCodec:
+        calls = 0
+
+        def encode(self, msg: object) -> bytes:
+            self.calls += 1
+            return b"body"
+
+    codec = CountingCodec()
+    send = next(compile_plan(load_task_file_from_dict(DEFINITION)).iter_messages())
+    assert encode_body(send, codec) == encode_body(send, codec) == b"body"  # type: ignore[arg-type]
+    assert codec.calls == 1
+    assert encode_body(send, None) == b"{'id': 1}"
+
+
+def test_workflow_compiles_once_and_recompiles_after_task_file_edit(tmp_path: Path) -> None:
+    class RecordingTransport:
+        def __init__(self) -> None:
+            self.calls: list[tuple[list[object], int]] = []
+
+        def execute(
+            self, *, target: object, protocol: str, messages: Iterable[object], timeout_ms: int, deadline: object
+        ) -> ObservedInteractions:
+            self.calls.append((list(messages), timeout_ms))
+            return ObservedInteractions(interactions=(), transport_errors=())
+
+    path = tmp_path / "echo.task.json"
+    path.write_text(json.dumps(DEFINITION))
+    transport = RecordingTransport()
+    registry = FileTaskRegistryAdapter(tasks_dir=tmp_path)
+    workflow = RunWorkflow(
+        verification_port=CountVerificationAdapter(),
+        event_bus=InMemoryEventBus(),
+        logger=ConsoleLoggingAdapter(),
+        transport_port=transport,  # type: ignore[arg-type]
+        task_registry_port=registry,
+        target_resolver=lambda _: object(),  # type: ignore[arg-type,return-value]
+    )
+    for i in range(3):
+        workflow.run(RunInput(run_id=f"r{i}", target_id="t", task_id="echo", protocol=""))
+    assert (workflow.plan_cache.hits, workflow.plan_cache.misses) == (2, 1)
+    assert transport.calls[0][0][0] is transport.calls[2][0][0]
+    assert transport.calls[0][1] == 750
+
+    path.write_text(json.dumps({**DEFINITION, "name": "Echo v2"}))
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    registry.refresh()
+    workflow.run(RunInput(run_id="r3", target_id="t", task_id="echo", protocol=""))
+    assert workflow.plan_cache.misses == 2
+
+
+SOAK = {
+    "task_id": "soak",
+    "name": "Soak",
+    "payloads": {"ping": {"id": "${i}", "tag": "ping-${i}-${j}"}, "static": {"id": 0}},
+    "steps": [
+        {
+            "step_id": "outer",
+            "action": "repeat",
+            "count": 100_000,
+            "steps": [
+                {"step_id": "s", "action": "send", "message_type": "Ping", "payload_ref": "static"},
+                {
+                    "step_id": "inner",
+                    "action": "loop",
+                    "counter": "j",
+                    "start": 1,
+                    "count": 2,
+                    "steps": [
+                        {"step_id": "p", "action": "send", "message_type": "Ping", "payload_ref": "ping"},
+                        {
+                            "step_id": "r",
+                            "action": "receive_expectation",
+                            "message_type": "Pong",
+                            "expect": {"matcher": {"message_type": "Pong"}, "expected_count": 1},
+                        },
+                    ],
+                },
+            ],
+        }
+    ],
+}
+
+
+def test_repeat_steps_expand_lazily_with_counter_substitution() -> None:
+    plan = compile_plan(load_task_file_from_dict(SOAK))
+    assert plan.message_count == 500_000
+    assert plan.expected_rules[0]["expected_count"] == 200_000
+    messages = plan.iter_messages()
+    first = [next(messages) for _ in range(5)]
+    assert [m.payload for m in first] == [
+        {"id": 0},
+        {"id": 0, "tag": "ping-0-1"},
+        {},
+        {"id": 0, "tag": "ping-0-2"},
+        {},
+    ]
+    assert next(messages) is first[0]  # static sends are shared across iterations (encoded once)
+
+    tracemalloc.start()
+    try:
+        seen = sum(1 for _ in plan.iter_messages())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert seen == plan.message_count
+    assert peak < 256 * 1024
+
+
+def test_repeat_steps_are_refused_by_modes_that_hold_the_whole_script(tmp_path: Path) -> None:
+    class CountingTransport:
+        calls = 0
+
+        def execute(self, **kwargs: object) -> ObservedInteractions:
+            CountingTransport.calls += 1
+            return ObservedInteractions(interactions=(), transport_errors=())
+
+    (tmp_path / "soak.task.json").write_text(json.dumps(SOAK))
+    targets = {
+        "server": TargetRef("server", "s", "127.0.0.1", 0, "tcp", "server"),
+        "pipelined": TargetRef("pipelined", "p", "127.0.0.1", 0, "tcp", "client", pipeline={}),
+        "client": TargetRef("client", "c", "127.0.0.1", 0, "tcp", "client"),
+    }
+    workflow = RunWorkflow(
+        verification_port=CountVerificationAdapter(),
+        event_bus=InMemoryEventBus(),
+        logger=ConsoleLoggingAdapter(),
+        transport_port=CountingTransport(),  # type: ignore[arg-type]
+        task_registry_port=FileTaskRegistryAdapter(tasks_dir=tmp_path),
+        target_resolver=targets.get,
+    )
+    for target_id, protocol in (("server", "udp"), ("server", "tcp"), ("pipelined", "tcp")):
+        result = workflow.run(RunInput(run_id="r", target_id=target_id, task_id="soak", protocol=protocol))
+        assert result["observed"]["transport_errors"] == ["TRANSPORT_REPEAT_UNSUPPORTED"]  # type: ignore[index]
+    assert CountingTransport.calls == 0
+    workflow.run(RunInput(run_id="r", target_id="client", task_id="soak", protocol="tcp"))
+    workflow.run(RunInput(run_id="r", target_id="pipelined", task_id="soak", protocol="mem"))
+    assert CountingTransport.calls == 2
@@ -11,3 +11,9 @@ def test_steps_execute_strictly_by_order_index() -> None:
     assert len(results) == 2
     assert results[0].order_index == 1
     assert results[1].order_index == 2
+
+
+def test_without_a_workflow_every_step_fails_unrun() -> None:
+    results = run_sequence([{"order_index": 1, "task_ref": "a"}])
+    assert [(r.verdict, r.evidence["error_code"]) for r in results] == [("FAIL", "SEQUENCE_NO_WORKFLOW")]
+
@@ -0,0 +1,89 @@
+"""Unit tests for the dependency-aware sequence runner (TKT-C03-01, TKT-C03-02)."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from simulator.domain.models.run_models import RunInput
+from simulator.domain.models.simulation_entities import SequenceStepDefinition as Step
+from simulator.domain.services.cancellation import CancellationToken
+from simulator.domain.services.run_summary_builder import COMPLETE_WITH_FAILURES, FAIL, PASS
+from simulator.workflows.execution_orchestrator import ExecutionOrchestrator
+from simulator.workflows.sequence_runner import run_sequence, sequence_status
+
+
+class Workflow:
+    """Sleeps per run; task ids starting with "bad" fail verification."""
+
+    def __init__(self, delay: float = 0.1) -> None:
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.started: list[tuple[str, str, float]] = []
+
+    def run(self, run_input: RunInput, cancel: CancellationToken | None = None) -> dict[str, object]:
+        with self.lock:
+            self.started.append((run_input.task_id, run_input.target_id, time.perf_counter()))
+        time.sleep(self.delay)
+        passed = not run_input.task_id.startswith("bad")
+        return {"run_id": run_input.run_id, "verification": {"passed": passed, "summary": ""}, "observed": {}}
+
+
+def test_independent_chains_finish_in_critical_path_time() -> None:
+    steps = [
+        Step(1, "a1", target_ref="A", depends_on=()),
+        Step(2, "b1", target_ref="B", depends_on=()),
+        Step(3, "c1", target_ref="C", depends_on=()),
+        Step(4, "a2", target_ref="A", depends_on=(1,)),
+        Step(5, "b2", target_ref="B", depends_on=(2,)),
+        Step(6, "join", depends_on=(4, 5, 3)),
+    ]
+    workflow = Workflow()
+    started = time.perf_counter()
+    results = run_sequence(steps, workflow=workflow, target_id="main")  # type: ignore[arg-type]
+    elapsed = time.perf_counter() - started
+    assert [r.order_index for r in results] == [1, 2, 3, 4, 5, 6]
+    assert all(r.verdict == "PASS" and r.state == "completed" for r in results)
+    assert elapsed < 0.45  # critical path is 3 steps (0.3s), the sum is 0.6s
+    order = [task for task, _, _ in workflow.started]
+    assert order.index("a2") > order.index("a1") and order[-1] == "join"
+    assert dict((task, target) for task, target, _ in workflow.started)["join"] == "main"
+    assert sequence_status(steps, results) == PASS
+
+
+def test_undeclared_dependencies_keep_steps_in_order() -> None:
+    workflow = Workflow(delay=0.01)
+    steps = [{"order_index": i, "task_ref": t} for i, t in ((2, "b"), (1, "a"), (3, "c"))]
+    results = run_sequence(steps, workflow=workflow, target_id="t")  # type: ignore[arg-type]
+    assert [task for task, _, _ in workflow.started] == ["a", "b", "c"]
+    assert [r.evidence["run_id"] for r in results] == ["sequence-1", "sequence-2", "sequence-3"]  # type: ignore[index]
+
+
+def test_stop_policy_skips_unstarted_steps_and_continue_runs_dependents() -> None:
+    stop = [Step(1, "bad"), Step(2, "ok"), Step(3, "other", depends_on=())]
+    results = run_sequence(stop, workflow=Workflow(delay=0.01), max_parallel=1)  # type: ignore[arg-type]
+    assert [r.verdict for r in results] == ["FAIL", "SKIP", "PASS"]  # 3 was ready alongside 1
+    assert sequence_status(stop, results) == FAIL
+
+    cont = [Step(1, "bad", failure_policy="continue"), Step(2, "ok"), Step(3, "ok", depends_on=(9,))]
+    results = run_sequence(cont, workflow=Workflow(delay=0.01))  # type: ignore[arg-type]
+    assert [r.verdict for r in results] == ["FAIL", "PASS", "FAIL"]
+    assert results[2].evidence["error_code"] == "SEQUENCE_DEPENDENCY_INVALID"  # type: ignore[index]
+    assert sequence_status(cont[:2], results[:2]) == COMPLETE_WITH_FAILURES
+
+
+def test_duplicate_order_index_is_rejected_before_anything_runs() -> None:
+    workflow = Workflow(delay=0.0)
+    steps = [Step(1, "a"), Step(1, "b"), Step(2, "c", depends_on=(1,))]
+    results = run_sequence(steps, workflow=workflow)  # type: ignore[arg-type]
+    assert workflow.started == []
+    assert [r.evidence["task_id"] for r in results] == ["a", "b", "c"]
+    assert {r.evidence["error_code"] for r in results} == {"SEQUENCE_DUPLICATE_ORDER_INDEX"}  # type: ignore[index]
+    assert sequence_status(steps, results) == FAIL
+
+
+def test_orchestrator_reports_sequence_status() -> None:
+    orchestrator = ExecutionOrchestrator(Workflow(delay=0.0))  # type: ignore[arg-type]
+    report = orchestrator.start_sequence("seq-1", "t", [Step(1, "a"), Step(2, "bad", failure_policy="continue")])
+    assert report["status"] == COMPLETE_WITH_FAILURES
+    assert [s["verdict"] for s in report["steps"]] == ["PASS", "FAIL"]  # type: ignore[index]